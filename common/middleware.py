@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from common.utils.query_stats import (
+    QueryStats,
+    collect_query_stats,
+    pop_pool_stats,
+)
+from core.db_routers import STICKY_COOKIE
+
+logger = logging.getLogger("common.query_stats")
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+
+@dataclass(frozen=True)
+class QueryStatsConfig:
+    # share of requests that are instrumented, 0..1
+    sample_rate: float = 0.0
+    slowest: int = 5
+    headers: bool = False
+
+    @classmethod
+    def from_settings(cls) -> QueryStatsConfig:
+        return cls(
+            sample_rate=settings.QUERY_STATS_SAMPLE_RATE,
+            slowest=settings.QUERY_STATS_SLOWEST,
+            headers=settings.QUERY_STATS_HEADERS,
+        )
+
+
+class QueryStatsMiddleware:
+    """
+    Sampled SQL instrumentation.
+
+    A sampled request gets a QueryStats execute_wrapper on every
+    connection, and one JSON line on the common.query_stats logger
+    (query count, SQL time, slowest statements, and the connection pool
+    counters since the previous sampled request). With headers on, the
+    response also gets X-DB-Query-Count, X-DB-Time-Ms and Server-Timing.
+    Requests outside the sample pay one random() call.
+
+    Queries run while a streaming response is consumed are not counted.
+    """
+
+    def __init__(
+        self, get_response, config: QueryStatsConfig | None = None
+    ) -> None:
+        self.get_response = get_response
+        self.config = config or QueryStatsConfig.from_settings()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not self._sampled():
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        with collect_query_stats(self.config.slowest) as stats:
+            response = self.get_response(request)
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        if self.config.headers:
+            self._set_headers(response, stats)
+        logger.info(
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "duration_ms": round(duration_ms, 2),
+                    "queries": stats.count,
+                    "db_ms": round(stats.total_ms, 2),
+                    "slowest": [
+                        {"ms": round(ms, 2), "sql": sql}
+                        for ms, sql in stats.slowest_statements()
+                    ],
+                    "pool": pop_pool_stats(),
+                },
+                separators=(",", ":"),
+            )
+        )
+        return response
+
+    def _sampled(self) -> bool:
+        rate = self.config.sample_rate
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+    @staticmethod
+    def _set_headers(response: HttpResponse, stats: QueryStats) -> None:
+        response["X-DB-Query-Count"] = str(stats.count)
+        response["X-DB-Time-Ms"] = f"{stats.total_ms:.2f}"
+        timing = f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries"'
+        existing = response.get("Server-Timing")
+        response["Server-Timing"] = (
+            f"{existing}, {timing}" if existing else timing
+        )
+
+
+class PrimaryStickyMiddleware:
+    """
+    Sticky primary after writes, for core.db_routers.
+
+    A response to an unsafe method (POST, PUT, PATCH, DELETE) gets a
+    short-lived cookie; read-only views skip the replicas while the
+    browser sends it, so a user sees their own change right away
+    however far the replicas lag. Without replicas it does nothing.
+    """
+
+    def __init__(self, get_response, seconds: int | None = None) -> None:
+        self.get_response = get_response
+        self.seconds = (
+            settings.REPLICA_STICKY_SECONDS if seconds is None else seconds
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        if settings.DATABASE_REPLICAS and request.method not in SAFE_METHODS:
+            response.set_cookie(
+                STICKY_COOKIE,
+                "1",
+                max_age=self.seconds,
+                httponly=True,
+                samesite="Lax",
+                secure=not settings.DEBUG,
+            )
+        return response
@@ -0,0 +1,529 @@
+from __future__ import annotations
+
+import math
+import random
+import uuid
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import accumulate
+from operator import itemgetter
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import Model
+from django.utils import timezone
+
+from common.testing.synthetic import (
+    WORKFLOW,
+    build_hotels,
+    build_rooms,
+    sentence,
+)
+from hotels.models import (
+    Hotel,
+    HotelDepartment,
+    HotelUserRole,
+    Role,
+    Room,
+    Visibility,
+)
+from issues.models import (
+    Issue,
+    IssueCategory,
+    IssueComment,
+    IssueStatusHistory,
+)
+from issues.services.sla import sla_calculator
+from users.models import GuestStay
+
+User = get_user_model()
+
+# every seeded staff user logs in with this password (drive_load)
+SEED_PASSWORD = "LoadTest123!"
+
+# code, name, default SLA minutes, categories
+DEPARTMENTS = (
+    ("HK", "Housekeeping", 30, ("Towels", "Cleaning", "Bed linen")),
+    ("ENG", "Engineering", 60, ("Air conditioning", "Plumbing", "TV")),
+    ("REC", "Reception", 15, ("Key card", "Late checkout", "Billing")),
+    ("FB", "Food & beverage", 30, ("Room service", "Minibar")),
+    ("IT", "IT", 120, ("Wi-Fi", "Phone")),
+    ("SEC", "Security", 10, ("Noise", "Safe")),
+)
+ROLES = (
+    ("gm", "General manager", Visibility.HOTEL),
+    ("ops_manager", "Operations manager", Visibility.HOTEL),
+    ("dept_manager", "Department manager", Visibility.DEPARTMENT),
+    ("staff", "Staff", Visibility.DEPARTMENT),
+    ("admin", "Administrator", Visibility.GLOBAL),
+)
+PRIORITY_WEIGHTS = {
+    Issue.Priority.LOW: 20,
+    Issue.Priority.NORMAL: 60,
+    Issue.Priority.HIGH: 15,
+    Issue.Priority.CRITICAL: 5,
+}
+SOURCE_WEIGHTS = {
+    Issue.Source.GUEST_WEB: 70,
+    Issue.Source.STAFF_APP: 30,
+}
+# guests report in the morning and in the evening
+HOUR_WEIGHTS = (
+    1, 1, 1, 1, 1, 2, 4, 8, 9, 7, 5, 4,
+    4, 4, 4, 5, 6, 8, 9, 10, 9, 7, 4, 2,
+)  # fmt: skip
+
+ISSUE_COLUMNS = (
+    "id", "created_at", "updated_at", "hotel_id", "guest_stay_id",
+    "room_id", "category_id", "title", "description", "status",
+    "priority", "assigned_department_id", "assigned_user_id",
+    "sla_due_at", "sla_escalated_at", "resolved_at", "closed_at",
+    "last_guest_message_at", "last_staff_response_at", "source",
+)  # fmt: skip
+# sla_due_at is filled in per chunk by the SLA calculator (hotel
+# calendars) from hotel, category and created_at
+_SLA_DUE_AT = ISSUE_COLUMNS.index("sla_due_at")
+_SLA_INPUTS = itemgetter(
+    *map(ISSUE_COLUMNS.index, ("hotel_id", "category_id", "created_at"))
+)
+COMMENT_COLUMNS = (
+    "id", "created_at", "updated_at", "issue_id", "author_type",
+    "author_user_id", "message", "is_internal",
+)  # fmt: skip
+HISTORY_COLUMNS = (
+    "id", "created_at", "updated_at", "issue_id", "old_status",
+    "new_status", "changed_by_type", "changed_by_user_id",
+)  # fmt: skip
+STAY_COLUMNS = (
+    "id", "created_at", "updated_at", "hotel_id", "room_id",
+    "session_key", "valid_until",
+)  # fmt: skip
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    hotels: int = 10
+    rooms_min: int = 60
+    rooms_max: int = 400
+    # staff users per 100 rooms, spread over the departments
+    staff_per_100_rooms: int = 15
+    # days of history to generate, ending now
+    days: int = 90
+    # issues per occupied room per day
+    issues_per_room_day: float = 0.08
+    occupancy: float = 0.75
+    comments_mean: float = 2.0
+    # Hotel.sla_calendar of every seeded hotel; None = the SLA clock
+    # runs 24/7
+    sla_calendar: dict | None = None
+    seed: int = 1
+    prefix: str = "load"
+    chunk_size: int = 20_000
+
+
+@dataclass
+class SeedStats:
+    hotels: int = 0
+    rooms: int = 0
+    staff: int = 0
+    stays: int = 0
+    issues: int = 0
+    comments: int = 0
+    history: int = 0
+    hotel_ids: list[int] = field(default_factory=list)
+
+
+def copy_rows(
+    model: type[Model], columns: Sequence[str], rows: Iterable[tuple]
+) -> int:
+    """COPY ... FROM STDIN: the fastest way to load rows into Postgres."""
+    quote = connection.ops.quote_name
+    sql = (
+        f"COPY {quote(model._meta.db_table)} "
+        f"({', '.join(quote(column) for column in columns)}) FROM STDIN"
+    )
+    written = 0
+    with connection.cursor() as cursor, cursor.copy(sql) as copy:
+        for row in rows:
+            copy.write_row(row)
+            written += 1
+    return written
+
+
+class _Weighted:
+    """random.choices() with the cumulative weights computed once."""
+
+    def __init__(self, values: Sequence[Any], weights: Sequence[float]):
+        self.values = values
+        self.cumulative = list(accumulate(weights))
+
+    def pick(self, rnd: random.Random) -> Any:
+        point = rnd.random() * self.cumulative[-1]
+        return self.values[bisect_right(self.cumulative, point)]
+
+
+_HOURS = _Weighted(range(24), HOUR_WEIGHTS)
+_SOURCES = _Weighted(list(SOURCE_WEIGHTS), list(SOURCE_WEIGHTS.values()))
+_PRIORITIES = _Weighted(
+    list(PRIORITY_WEIGHTS), list(PRIORITY_WEIGHTS.values())
+)
+
+
+def _uuid(rnd: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rnd.getrandbits(128), version=4)
+
+
+class ChainSeeder:
+    """
+    Generates a hotel chain with realistic volumes and distributions.
+
+    Every hotel draws from its own RNG (seed, hotel index), so the data
+    is reproducible and independent of chunking. Small tables go
+    through bulk_create, stays/issues/comments/history through COPY in
+    chunks of `chunk_size` issues, each chunk in its own transaction.
+    """
+
+    def __init__(self, config: SeedConfig, *, progress=None) -> None:
+        self.config = config
+        self.progress = progress or (lambda message: None)
+        self.now = timezone.now().replace(microsecond=0)
+        self.stats = SeedStats()
+
+    def run(self) -> SeedStats:
+        prefix = self.config.prefix
+        if Hotel.objects.filter(code__startswith=f"{prefix}-").exists():
+            raise ValueError(
+                f"Hotels with prefix {prefix!r} exist already, "
+                "use another --prefix or a fresh database"
+            )
+        with transaction.atomic():
+            self._seed_reference()
+        for index, hotel in enumerate(self.hotels):
+            self._seed_hotel(index, hotel)
+            self.progress(
+                f"{hotel.code}: {self.stats.issues} issues, "
+                f"{self.stats.comments} comments so far"
+            )
+        return self.stats
+
+    # --- reference data -----------------------------------------------
+
+    def _seed_reference(self) -> None:
+        config = self.config
+        prefix = config.prefix
+        rnd = random.Random(f"{config.prefix}:{config.seed}:reference")
+
+        self.departments: list[HotelDepartment] = []
+        self.categories: list[tuple[IssueCategory, int]] = []
+        for code, name, sla, categories in DEPARTMENTS:
+            department = HotelDepartment.objects.filter(
+                code=code, is_active=True
+            ).first() or HotelDepartment.objects.create(
+                code=code, name=name, default_sla_minutes=sla
+            )
+            self.departments.append(department)
+            for category_name in categories:
+                category = IssueCategory.objects.filter(
+                    name=category_name, department=department, is_active=True
+                ).first() or IssueCategory.objects.create(
+                    name=category_name, department=department
+                )
+                self.categories.append(
+                    (category, category.default_sla_minutes or sla)
+                )
+        # a few categories get most of the issues (Zipf-like)
+        self.category_weights = _Weighted(
+            self.categories,
+            [1 / (rank + 1) for rank in range(len(self.categories))],
+        )
+
+        self.roles = {}
+        for code, name, visibility in ROLES:
+            self.roles[code], _ = Role.objects.get_or_create(
+                code=code, defaults={"name": name, "visibility": visibility}
+            )
+
+        self.hotels = build_hotels(prefix, config.hotels)
+        if config.sla_calendar:
+            Hotel.objects.filter(
+                pk__in=[hotel.pk for hotel in self.hotels]
+            ).update(sla_calendar=config.sla_calendar)
+        self.stats.hotels = len(self.hotels)
+        self.stats.hotel_ids = [hotel.pk for hotel in self.hotels]
+
+        self.password = make_password(SEED_PASSWORD)
+        admin = User.objects.create(
+            username=f"{prefix}-admin",
+            email=f"{prefix}-admin@example.com",
+            password=self.password,
+            is_staff=True,
+        )
+        HotelUserRole.objects.create(
+            user=admin, hotel=self.hotels[0], role=self.roles["admin"]
+        )
+
+        self.rooms: dict[int, list[Room]] = build_rooms(
+            [
+                (
+                    hotel,
+                    rnd.randint(config.rooms_min, config.rooms_max),
+                    rnd.choice((12, 16, 20, 24)),
+                )
+                for hotel in self.hotels
+            ]
+        )
+        self.stats.rooms = sum(len(rooms) for rooms in self.rooms.values())
+
+    def _seed_staff(self, hotel: Hotel, rnd: random.Random) -> dict:
+        """Per department: staff user ids of the hotel."""
+        prefix = self.config.prefix
+        rooms = len(self.rooms[hotel.pk])
+        count = max(
+            len(self.departments) + 2,
+            rooms * self.config.staff_per_100_rooms // 100,
+        )
+        users = User.objects.bulk_create(
+            User(
+                username=f"{hotel.code}-{n + 1}",
+                email=f"{hotel.code}-{n + 1}@{prefix}.example.com",
+                password=self.password,
+                is_staff=True,
+            )
+            for n in range(count)
+        )
+        grants = [
+            HotelUserRole(user=users[0], hotel=hotel, role=self.roles["gm"]),
+            HotelUserRole(
+                user=users[1], hotel=hotel, role=self.roles["ops_manager"]
+            ),
+        ]
+        by_department: dict[Any, list[int]] = {
+            d.pk: [] for d in self.departments
+        }
+        for n, user in enumerate(users[2:]):
+            if n < len(self.departments):
+                department, role = self.departments[n], "dept_manager"
+            else:
+                # bigger departments (housekeeping) first
+                department = self.departments[
+                    min(int(rnd.expovariate(0.6)), len(self.departments) - 1)
+                ]
+                role = "staff"
+            grants.append(
+                HotelUserRole(
+                    user=user,
+                    hotel=hotel,
+                    department=department,
+                    role=self.roles[role],
+                )
+            )
+            by_department[department.pk].append(user.pk)
+        HotelUserRole.objects.bulk_create(grants)
+        self.stats.staff += len(users)
+        return by_department
+
+    # --- per hotel volumes --------------------------------------------
+
+    def _stays(self, hotel: Hotel, rnd: random.Random) -> dict:
+        """Back-to-back stays per room; room id -> [(start, end, id)]."""
+        config = self.config
+        start_of_period = self.now - timedelta(days=config.days)
+        timelines: dict[Any, list[tuple[datetime, datetime, uuid.UUID]]] = {}
+        rows = []
+        for room in self.rooms[hotel.pk]:
+            at = start_of_period - timedelta(days=rnd.uniform(0, 5))
+            while at < self.now:
+                if rnd.random() > config.occupancy:
+                    at += timedelta(days=rnd.uniform(1, 4))
+                    continue
+                length = timedelta(days=max(1, round(rnd.gauss(3.5, 2))))
+                stay_id = _uuid(rnd)
+                timelines.setdefault(room.pk, []).append(
+                    (at, at + length, stay_id)
+                )
+                rows.append(
+                    (
+                        stay_id,
+                        at,
+                        at,
+                        hotel.pk,
+                        room.pk,
+                        uuid.UUID(int=rnd.getrandbits(128)).hex,
+                        at + length,
+                    )
+                )
+                at += length + timedelta(hours=rnd.uniform(2, 30))
+        with transaction.atomic():
+            self.stats.stays += copy_rows(GuestStay, STAY_COLUMNS, rows)
+        return timelines
+
+    def _seed_hotel(self, index: int, hotel: Hotel) -> None:
+        config = self.config
+        rnd = random.Random(f"{config.prefix}:{config.seed}:hotel:{index}")
+        staff = self._seed_staff(hotel, rnd)
+        timelines = self._stays(hotel, rnd)
+        rooms = self.rooms[hotel.pk]
+
+        expected = (
+            len(rooms) * config.occupancy * config.days
+        ) * config.issues_per_room_day
+        count = max(0, round(rnd.gauss(expected, math.sqrt(expected))))
+
+        issues: list[tuple] = []
+        comments: list[tuple] = []
+        history: list[tuple] = []
+        for _ in range(count):
+            self._issue(
+                rnd, hotel, rooms, timelines, staff, issues, comments, history
+            )
+            if len(issues) >= config.chunk_size:
+                self._flush(issues, comments, history)
+        self._flush(issues, comments, history)
+
+    def _created_at(self, rnd: random.Random) -> datetime:
+        day = self.now - timedelta(days=rnd.randrange(self.config.days))
+        hour = _HOURS.pick(rnd)
+        return day.replace(
+            hour=hour, minute=rnd.randrange(60), second=rnd.randrange(60)
+        )
+
+    def _issue(
+        self, rnd, hotel, rooms, timelines, staff, issues, comments, history
+    ) -> None:
+        room = rnd.choice(rooms)
+        category, sla_minutes = self.category_weights.pick(rnd)
+        department_id = category.department_id
+        created_at = min(self._created_at(rnd), self.now)
+        source = _SOURCES.pick(rnd)
+        stay_id = None
+        if source == Issue.Source.GUEST_WEB:
+            for start, end, candidate in timelines.get(room.pk, ()):
+                if start <= created_at < end:
+                    stay_id = candidate
+                    break
+
+        # time to resolve: log-normal around the SLA, a quarter breach it
+        resolve_after = timedelta(
+            minutes=sla_minutes * rnd.lognormvariate(-0.4, 0.6)
+        )
+        team = staff.get(department_id) or [None]
+        assignee = rnd.choice(team)
+        if rnd.random() < 0.04:
+            path = [Issue.Status.NEW, Issue.Status.CANCELLED]
+            end = min(created_at + resolve_after, self.now)
+        elif created_at + resolve_after <= self.now:
+            closed = self.now - (created_at + resolve_after) > timedelta(
+                days=1
+            )
+            path = list(WORKFLOW[: 5 if closed else 4])
+            end = created_at + resolve_after
+        else:
+            progress = (self.now - created_at) / resolve_after
+            path = list(WORKFLOW[: 1 + min(2, int(progress * 3))])
+            if rnd.random() < 0.1 and len(path) == 3:
+                path.append(Issue.Status.WAITING_GUEST)
+            end = self.now
+        status = path[-1]
+
+        issue_id = _uuid(rnd)
+        # work steps are spread up to `end`, closing comes later
+        work_steps = len([x for x in path[1:] if x != Issue.Status.CLOSED])
+        changed_at = created_at
+        resolved_at = closed_at = None
+        for step, new_status in enumerate(path[1:]):
+            if new_status == Issue.Status.CLOSED:
+                changed_at = end + timedelta(hours=rnd.uniform(1, 20))
+                closed_at = changed_at
+            else:
+                changed_at = (
+                    created_at + (end - created_at) * (step + 1) / work_steps
+                )
+            if new_status == Issue.Status.RESOLVED:
+                resolved_at = changed_at
+            history.append(
+                (
+                    _uuid(rnd),
+                    changed_at,
+                    changed_at,
+                    issue_id,
+                    path[step],
+                    new_status,
+                    IssueStatusHistory.ChangedByType.STAFF,
+                    assignee,
+                )
+            )
+
+        last_guest = last_staff = None
+        at = created_at
+        for n in range(
+            min(10, int(rnd.expovariate(1 / self.config.comments_mean)))
+        ):
+            at = at + (end - at) * rnd.uniform(0.1, 0.5)
+            guest = stay_id is not None and n % 2 == 0
+            comments.append(
+                (
+                    _uuid(rnd),
+                    at,
+                    at,
+                    issue_id,
+                    IssueComment.AuthorType.GUEST
+                    if guest
+                    else IssueComment.AuthorType.STAFF,
+                    None if guest else assignee,
+                    sentence(rnd, rnd.randint(3, 20)).capitalize(),
+                    not guest and rnd.random() < 0.3,
+                )
+            )
+            if guest:
+                last_guest = at
+            else:
+                last_staff = at
+
+        issues.append(
+            (
+                issue_id,
+                created_at,
+                max(changed_at, at),
+                hotel.pk,
+                stay_id,
+                room.pk,
+                category.pk,
+                f"{category.name}: room {room.number}",
+                sentence(rnd, rnd.randint(5, 30)).capitalize(),
+                status,
+                _PRIORITIES.pick(rnd),
+                department_id,
+                None if status == Issue.Status.NEW else assignee,
+                None,
+                None,
+                resolved_at,
+                closed_at,
+                last_guest or (created_at if stay_id else None),
+                last_staff,
+                source,
+            )
+        )
+
+    def _flush(self, issues: list, comments: list, history: list) -> None:
+        if not issues:
+            return
+        due = sla_calculator.due_at_many([_SLA_INPUTS(row) for row in issues])
+        rows = [
+            (*row[:_SLA_DUE_AT], due_at, *row[_SLA_DUE_AT + 1 :])
+            for row, due_at in zip(issues, due, strict=True)
+        ]
+        with transaction.atomic():
+            self.stats.issues += copy_rows(Issue, ISSUE_COLUMNS, rows)
+            self.stats.comments += copy_rows(
+                IssueComment, COMMENT_COLUMNS, comments
+            )
+            self.stats.history += copy_rows(
+                IssueStatusHistory, HISTORY_COLUMNS, history
+            )
+        issues.clear()
+        comments.clear()
+        history.clear()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import gc
+import json
+import math
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+# a measured run may take this many times the recorded baseline, and
+# at least this many milliseconds more (timer noise on short runs)
+DEFAULT_TIME_TOLERANCE = 3.0
+MIN_SLACK_MS = 50
+
+
+@dataclass(frozen=True)
+class Measurement:
+    queries: int
+    ms: float
+    statements: tuple[str, ...]
+
+
+def measure(
+    fn: Callable[[], Any], *, using: str = "default"
+) -> tuple[Any, Measurement]:
+    # like timeit: a full collection of the objects other tests left
+    # behind would otherwise land in whichever run it happens to hit
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with CaptureQueriesContext(connections[using]) as ctx:
+            started = time.perf_counter()
+            result = fn()
+            ms = (time.perf_counter() - started) * 1000
+    finally:
+        if enabled:
+            gc.enable()
+    statements = tuple(query["sql"] for query in ctx.captured_queries)
+    return result, Measurement(len(statements), ms, statements)
+
+
+@dataclass
+class PerfBaselines:
+    """
+    Query budgets and wall-clock baselines, kept in a JSON file:
+    {"name": {"queries": max queries, "ms": baseline milliseconds}}.
+
+    Queries are a hard limit. Time fails above ms * tolerance, to
+    absorb slower CI machines (PERF_TIME_TOLERANCE). With
+    PERF_UPDATE_BASELINES=1 nothing fails: measurements are recorded and
+    written back by save().
+    """
+
+    path: Path
+    tolerance: float = DEFAULT_TIME_TOLERANCE
+    update: bool = False
+    entries: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> PerfBaselines:
+        entries = json.loads(path.read_text()) if path.exists() else {}
+        return cls(
+            path=path,
+            tolerance=float(
+                os.environ.get("PERF_TIME_TOLERANCE", DEFAULT_TIME_TOLERANCE)
+            ),
+            update=os.environ.get("PERF_UPDATE_BASELINES") == "1",
+            entries=entries,
+        )
+
+    def check(self, name: str, measurement: Measurement) -> None:
+        if self.update:
+            self.entries[name] = {
+                "queries": measurement.queries,
+                "ms": math.ceil(measurement.ms),
+            }
+            return
+
+        baseline = self.entries.get(name)
+        assert baseline is not None, (
+            f"No perf baseline for {name!r}, "
+            "run with PERF_UPDATE_BASELINES=1 to record it"
+        )
+        assert measurement.queries <= baseline["queries"], (
+            f"{name}: {measurement.queries} queries, "
+            f"budget {baseline['queries']}:\n"
+            + "\n".join(measurement.statements)
+        )
+        limit = max(
+            baseline["ms"] * self.tolerance, baseline["ms"] + MIN_SLACK_MS
+        )
+        assert measurement.ms <= limit, (
+            f"{name}: {measurement.ms:.1f} ms, baseline {baseline['ms']} ms "
+            f"(limit {limit:.0f} ms)"
+        )
+
+    def save(self) -> None:
+        if self.update:
+            self.path.write_text(
+                json.dumps(self.entries, indent=2, sort_keys=True) + "\n"
+            )
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar
+
+from common.testing.load import SEED_PASSWORD
+from common.testing.synthetic import WORDS, WORKFLOW
+from hotels.models import Hotel, Room
+from issues.models import Issue, IssueCategory
+
+# staff actions and how often a staff user picks them
+STAFF_WEIGHTS = {
+    "issue_list": 40,
+    "issue_detail": 25,
+    "search": 10,
+    "change_status": 10,
+    "dashboard": 10,
+    "export": 5,
+}
+
+
+@dataclass(frozen=True)
+class LoadTargets:
+    """What the driver may ask for, read from a seeded database."""
+
+    hotel_codes: tuple[str, ...]
+    # hotel code -> room numbers
+    rooms: dict[str, tuple[str, ...]]
+    # hotel code -> usernames with hotel visibility (gm, ops manager)
+    staff: dict[str, tuple[str, ...]]
+    # hotel code -> (issue id, status) of open issues
+    issues: dict[str, tuple[tuple[str, str], ...]]
+    category_ids: tuple[str, ...]
+
+    @classmethod
+    def from_db(cls, prefix: str, sample: int = 200) -> LoadTargets:
+        hotels = list(
+            Hotel.objects.filter(code__startswith=f"{prefix}-")
+            .order_by("pk")
+            .values_list("pk", "code")
+        )
+        if not hotels:
+            raise ValueError(
+                f"No hotels with prefix {prefix!r}, run seed_load first"
+            )
+        rooms: dict[str, tuple[str, ...]] = {}
+        staff: dict[str, tuple[str, ...]] = {}
+        issues: dict[str, tuple[tuple[str, str], ...]] = {}
+        for hotel_id, code in hotels:
+            rooms[code] = tuple(
+                Room.objects.filter(hotel_id=hotel_id).values_list(
+                    "number", flat=True
+                )
+            )
+            staff[code] = (f"{code}-1", f"{code}-2")
+            issues[code] = tuple(
+                (str(pk), status)
+                for pk, status in Issue.objects.filter(
+                    hotel_id=hotel_id, status__in=WORKFLOW[:3]
+                )
+                .order_by("-created_at")
+                .values_list("pk", "status")[:sample]
+            )
+        category_ids = tuple(
+            str(pk)
+            for pk in IssueCategory.objects.filter(is_active=True).values_list(
+                "pk", flat=True
+            )
+        )
+        return cls(
+            hotel_codes=tuple(code for _, code in hotels),
+            rooms=rooms,
+            staff=staff,
+            issues=issues,
+            category_ids=category_ids,
+        )
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # a redirect is an answer: timed on its own, not followed
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpSession:
+    """
+    A browser-like client: cookies, CSRF tokens, no redirects.
+
+    Stay and JWT cookies are Secure outside DEBUG, so drive a plain http
+    server only when it runs with DEBUG on; otherwise use https.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.cookies = CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies), _NoRedirect
+        )
+
+    def _cookie(self, name: str) -> str:
+        for cookie in self.cookies:
+            if cookie.name == name:
+                return cookie.value or ""
+        return ""
+
+    def request(self, method: str, path: str, data: dict | None = None) -> int:
+        """Send a request, read the whole body, return the status."""
+        url = self.base_url + path
+        body = None
+        headers = {}
+        if method == "POST":
+            data = {
+                **(data or {}),
+                "csrfmiddlewaretoken": self._cookie("csrftoken"),
+            }
+            body = urllib.parse.urlencode(data, doseq=True).encode()
+            headers["Referer"] = url
+        req = urllib.request.Request(
+            url, data=body, headers=headers, method=method
+        )
+        try:
+            with self.opener.open(req, timeout=self.timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as exc:
+            exc.read()
+            return exc.code
+
+
+@dataclass
+class LoadReport:
+    """Latencies per endpoint, shared by the scenario threads."""
+
+    samples: dict[str, list[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    limited: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, name: str, status: int, ms: float) -> None:
+        with self._lock:
+            self.samples[name].append(ms)
+            if status == 429:
+                self.limited[name] += 1
+            elif status >= 400:
+                self.errors[name] += 1
+
+    def summary(self, seconds: float) -> list[dict]:
+        rows = []
+        for name in sorted(self.samples):
+            values = sorted(self.samples[name])
+            rows.append(
+                {
+                    "name": name,
+                    "count": len(values),
+                    "errors": self.errors[name],
+                    "limited": self.limited[name],
+                    "rps": len(values) / seconds if seconds else 0.0,
+                    "p50": percentile(values, 50),
+                    "p95": percentile(values, 95),
+                    "p99": percentile(values, 99),
+                }
+            )
+        return rows
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, round(pct / 100 * len(values)) - 1))
+    return values[rank]
+
+
+class Scenario(ABC):
+    """One simulated user: a loop of timed requests until the deadline."""
+
+    def __init__(
+        self,
+        base_url: str,
+        targets: LoadTargets,
+        report: LoadReport,
+        *,
+        seed: int,
+        think: float = 0.5,
+    ) -> None:
+        self.base_url = base_url
+        self.targets = targets
+        self.report = report
+        self.rnd = random.Random(seed)
+        self.think = think
+        self.http = HttpSession(base_url)
+
+    def call(
+        self, name: str, method: str, path: str, data: dict | None = None
+    ) -> int:
+        started = time.perf_counter()
+        try:
+            status = self.http.request(method, path, data)
+        except OSError:
+            # refused, reset, timed out: an error with its waiting time
+            status = 599
+        self.report.record(
+            name, status, (time.perf_counter() - started) * 1000
+        )
+        return status
+
+    def pause(self) -> None:
+        if self.think > 0:
+            time.sleep(self.rnd.uniform(0, 2 * self.think))
+
+    @abstractmethod
+    def run(self, deadline: float) -> None:
+        """Play the user until time.monotonic() reaches `deadline`."""
+
+
+class StaffScenario(Scenario):
+    """Logs in as hotel staff, then works the issue queue."""
+
+    def run(self, deadline: float) -> None:
+        self.hotel = self.rnd.choice(self.targets.hotel_codes)
+        self.call("login_form", "GET", "/users/login/")
+        status = self.call(
+            "login",
+            "POST",
+            "/users/login/",
+            {
+                "username_or_email": self.rnd.choice(
+                    self.targets.staff[self.hotel]
+                ),
+                "password": SEED_PASSWORD,
+            },
+        )
+        if status != 302:
+            return
+
+        actions: dict[str, Callable[[], None]] = {
+            "issue_list": self.issue_list,
+            "issue_detail": self.issue_detail,
+            "search": self.search,
+            "change_status": self.change_status,
+            "dashboard": self.dashboard,
+            "export": self.export,
+        }
+        names = list(STAFF_WEIGHTS)
+        weights = list(STAFF_WEIGHTS.values())
+        while time.monotonic() < deadline:
+            actions[self.rnd.choices(names, weights)[0]]()
+            self.pause()
+
+    def _issue(self) -> tuple[str, str] | None:
+        issues = self.targets.issues[self.hotel]
+        return self.rnd.choice(issues) if issues else None
+
+    def issue_list(self) -> None:
+        self.call("issue_list", "GET", "/issues/issue_list/")
+
+    def issue_detail(self) -> None:
+        issue = self._issue()
+        if issue is not None:
+            self.call("issue_detail", "GET", f"/issues/{issue[0]}/")
+
+    def search(self) -> None:
+        if self.rnd.random() < 0.3:
+            query = self.rnd.choice(self.targets.rooms[self.hotel])
+        else:
+            query = " ".join(self.rnd.sample(WORDS, 2))
+        self.call(
+            "search",
+            "GET",
+            "/issues/search/?" + urllib.parse.urlencode({"q": query}),
+        )
+
+    def change_status(self) -> None:
+        issue = self._issue()
+        if issue is None:
+            return
+        pk, status = issue
+        # the next workflow step; a stale status is refused with a redirect
+        new_status = WORKFLOW[WORKFLOW.index(status) + 1]
+        self.call(
+            "change_status",
+            "POST",
+            f"/issues/{pk}/change-status/",
+            {"status": new_status},
+        )
+
+    def dashboard(self) -> None:
+        days = self.rnd.choice((1, 7, 7, 30))
+        self.call("dashboard", "GET", f"/users/dashboard/?days={days}")
+
+    def export(self) -> None:
+        self.call("export", "GET", "/issues/export/?kind=issues")
+
+
+class GuestScenario(Scenario):
+    """Scans a room QR code, looks at the stay, reports an issue."""
+
+    def run(self, deadline: float) -> None:
+        while time.monotonic() < deadline:
+            self.http = HttpSession(self.base_url)
+            hotel = self.rnd.choice(self.targets.hotel_codes)
+            self.call("guest_entry", "GET", f"/g/{hotel}/")
+            status = self.call(
+                "guest_room",
+                "POST",
+                f"/g/{hotel}/",
+                {"room_number": self.rnd.choice(self.targets.rooms[hotel])},
+            )
+            if status != 302:
+                self.pause()
+                continue
+            for _ in range(self.rnd.randint(1, 4)):
+                self.call("guest_stay", "GET", "/g/stay/")
+                if self.rnd.random() < 0.4:
+                    self.call("guest_issue_form", "GET", "/g/stay/issues/new/")
+                    self.call(
+                        "guest_issue_create",
+                        "POST",
+                        "/g/stay/issues/new/",
+                        {
+                            "category": self.rnd.choice(
+                                self.targets.category_ids
+                            ),
+                            "description": " ".join(
+                                self.rnd.choices(WORDS, k=8)
+                            ),
+                        },
+                    )
+                self.pause()
+                if time.monotonic() >= deadline:
+                    return
+
+
+def drive_load(
+    base_url: str,
+    targets: LoadTargets,
+    *,
+    staff: int,
+    guests: int,
+    duration: float,
+    think: float = 0.5,
+    seed: int = 1,
+) -> tuple[LoadReport, float]:
+    """Run the scenarios in threads for `duration` seconds."""
+    report = LoadReport()
+    scenarios: list[Scenario] = [
+        StaffScenario(
+            base_url, targets, report, seed=seed * 1000 + n, think=think
+        )
+        for n in range(staff)
+    ] + [
+        GuestScenario(
+            base_url,
+            targets,
+            report,
+            seed=seed * 1000 + staff + n,
+            think=think,
+        )
+        for n in range(guests)
+    ]
+    started = time.monotonic()
+    deadline = started + duration
+    threads = [
+        threading.Thread(target=scenario.run, args=(deadline,), daemon=True)
+        for scenario in scenarios
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return report, time.monotonic() - started
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from hotels.models import (
+    Hotel,
+    HotelDepartment,
+    HotelUserRole,
+    Role,
+    Room,
+    Visibility,
+)
+from issues.models import (
+    Issue,
+    IssueCategory,
+    IssueComment,
+    IssueStatusHistory,
+)
+from issues.services.importer import keep_created_at
+from users.models import StaffUser
+
+User = get_user_model()
+
+PASSWORD = "Synthetic123!"
+
+# Vocabulary shared by the generated data sets (this module and
+# common.testing.load) and the load driver (common.testing.scenarios).
+
+# a plausible workflow: where an issue with N history rows ends up
+WORKFLOW = (
+    Issue.Status.NEW,
+    Issue.Status.ASSIGNED,
+    Issue.Status.IN_PROGRESS,
+    Issue.Status.RESOLVED,
+    Issue.Status.CLOSED,
+)
+WORDS = (
+    "please room again since morning not working broken dirty noisy "
+    "cold hot smell leaking missing need more extra urgent thanks asap "
+    "shower tap lamp air conditioner window door bathroom light towels "
+    "minibar remote card safe wifi heating cleaning pillow"
+).split()
+
+
+@dataclass
+class SyntheticDataset:
+    prefix: str
+    hotels: list[Hotel] = field(default_factory=list)
+    departments: list[HotelDepartment] = field(default_factory=list)
+    categories: list[IssueCategory] = field(default_factory=list)
+    rooms: dict[int, list[Room]] = field(default_factory=dict)
+    roles: dict[str, Role] = field(default_factory=dict)
+    # "global" | "hotel" | "department" -> user (scoped to hotels[0])
+    users: dict[str, StaffUser] = field(default_factory=dict)
+    issues: int = 0
+    comments: int = 0
+    history: int = 0
+
+
+def sentence(rnd: random.Random, words: int) -> str:
+    return " ".join(rnd.choice(WORDS) for _ in range(words))
+
+
+def build_hotels(prefix: str, count: int) -> list[Hotel]:
+    """Hotels `{prefix}-1` .. `{prefix}-{count}`."""
+    return Hotel.objects.bulk_create(
+        Hotel(
+            name=f"{prefix.title()} Hotel {n + 1}",
+            code=f"{prefix}-{n + 1}",
+            slug=f"{prefix}-hotel-{n + 1}",
+        )
+        for n in range(count)
+    )
+
+
+def build_rooms(
+    layout: Iterable[tuple[Hotel, int, int]],
+) -> dict[int, list[Room]]:
+    """
+    Rooms for (hotel, rooms, rooms per floor) triples, numbered 101,
+    102, ... per floor; hotel id -> rooms.
+    """
+    rooms = Room.objects.bulk_create(
+        (
+            Room(
+                hotel=hotel,
+                number=f"{floor + 1}{number + 1:02d}",
+                floor=str(floor + 1),
+            )
+            for hotel, count, per_floor in layout
+            for floor, number in (divmod(n, per_floor) for n in range(count))
+        ),
+        batch_size=5000,
+    )
+    by_hotel: dict[int, list[Room]] = {}
+    for room in rooms:
+        by_hotel.setdefault(room.hotel_id, []).append(room)
+    return by_hotel
+
+
+def build_synthetic_dataset(
+    *,
+    hotels: int = 3,
+    departments: int = 4,
+    categories_per_department: int = 2,
+    rooms_per_hotel: int = 40,
+    issues_per_hotel: int = 1000,
+    comments_per_issue: int = 2,
+    history_per_issue: int = 2,
+    days: int = 30,
+    seed: int = 0,
+    prefix: str = "syn",
+    batch_size: int = 2000,
+) -> SyntheticDataset:
+    """
+    Realistic-looking data for performance tests, bulk inserted.
+
+    Deterministic for a seed. Issues are spread over the last `days`
+    days; bulk_create sends no signals, so there are no events and no
+    dashboard rollups (see rebuild_issue_stats).
+    """
+    rnd = random.Random(seed)
+    now = timezone.now()
+    data = SyntheticDataset(prefix=prefix)
+
+    data.departments = HotelDepartment.objects.bulk_create(
+        HotelDepartment(name=f"{prefix} department {n}", code=f"{prefix}D{n}")
+        for n in range(departments)
+    )
+    data.categories = IssueCategory.objects.bulk_create(
+        IssueCategory(
+            name=f"{prefix} category {d}.{n}",
+            department=department,
+            default_sla_minutes=rnd.choice((30, 60, 240)),
+        )
+        for d, department in enumerate(data.departments)
+        for n in range(categories_per_department)
+    )
+    data.hotels = build_hotels(prefix, hotels)
+    data.rooms = build_rooms(
+        (hotel, rooms_per_hotel, 20) for hotel in data.hotels
+    )
+
+    _add_staff(data)
+
+    issues: list[Issue] = []
+    # history rows per issue, in the same order
+    steps_per_issue: list[int] = []
+    for hotel in data.hotels:
+        for _ in range(issues_per_hotel):
+            category = rnd.choice(data.categories)
+            created_at = now - timedelta(seconds=rnd.uniform(0, days * 86400))
+            steps = rnd.randint(0, history_per_issue)
+            status = WORKFLOW[steps]
+            issue = Issue(
+                hotel=hotel,
+                room=rnd.choice(data.rooms[hotel.pk]),
+                category=category,
+                assigned_department_id=category.department_id,
+                title=sentence(rnd, 3).capitalize(),
+                description=sentence(rnd, 12),
+                status=status,
+                priority=rnd.choice(Issue.Priority.values),
+                source=rnd.choice(Issue.Source.values),
+                created_at=created_at,
+                sla_due_at=created_at
+                + timedelta(minutes=category.default_sla_minutes),
+            )
+            issues.append(issue)
+            steps_per_issue.append(steps)
+    with keep_created_at():
+        Issue.objects.bulk_create(issues, batch_size=batch_size)
+    data.issues = len(issues)
+
+    comments: list[IssueComment] = []
+    history: list[IssueStatusHistory] = []
+    for issue, steps in zip(issues, steps_per_issue, strict=True):
+        for _ in range(comments_per_issue):
+            comments.append(
+                IssueComment(
+                    issue=issue,
+                    author_type=rnd.choice(IssueComment.AuthorType.values),
+                    message=sentence(rnd, 8),
+                )
+            )
+        for step in range(steps):
+            history.append(
+                IssueStatusHistory(
+                    issue=issue,
+                    old_status=WORKFLOW[step],
+                    new_status=WORKFLOW[step + 1],
+                    changed_by_type=IssueStatusHistory.ChangedByType.STAFF,
+                )
+            )
+    IssueComment.objects.bulk_create(comments, batch_size=batch_size)
+    IssueStatusHistory.objects.bulk_create(history, batch_size=batch_size)
+    data.comments = len(comments)
+    data.history = len(history)
+    return data
+
+
+def _add_staff(data: SyntheticDataset) -> None:
+    prefix = data.prefix
+    for visibility in Visibility.values:
+        role = Role.objects.create(
+            code=f"{prefix}_{visibility}",
+            name=f"{prefix} {visibility}",
+            visibility=visibility,
+        )
+        user = User.objects.create_user(
+            username=f"{prefix}_{visibility}",
+            email=f"{prefix}_{visibility}@example.com",
+            password=PASSWORD,
+            is_staff=True,
+        )
+        HotelUserRole.objects.create(
+            user=user,
+            hotel=data.hotels[0],
+            role=role,
+            department=data.departments[0]
+            if visibility == Visibility.DEPARTMENT
+            else None,
+        )
+        data.roles[visibility] = role
+        data.users[visibility] = user
+
+
+def drop_synthetic_dataset(data: SyntheticDataset) -> None:
+    """Delete everything build_synthetic_dataset created."""
+    hotel_ids = [hotel.pk for hotel in data.hotels]
+    Issue.objects.filter(hotel_id__in=hotel_ids).delete()
+    Hotel.objects.filter(pk__in=hotel_ids).delete()
+    User.objects.filter(pk__in=[u.pk for u in data.users.values()]).delete()
+    Role.objects.filter(pk__in=[r.pk for r in data.roles.values()]).delete()
+    IssueCategory.objects.filter(
+        pk__in=[c.pk for c in data.categories]
+    ).delete()
+    HotelDepartment.objects.filter(
+        pk__in=[d.pk for d in data.departments]
+    ).delete()
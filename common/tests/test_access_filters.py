@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from common.utils.access.filters import SCOPE_FILTERS, get_scope_filter
+from common.utils.access.scope import build_user_scope
+from hotels.models import Visibility
+from issues.models import Issue
+
+
+@pytest.fixture()
+def scoped_world(
+    user_factory, hotel_factory, department_factory, grant_role, issue_factory
+):
+    user = user_factory()
+    hotel_a, hotel_b, hotel_c = (
+        hotel_factory(),
+        hotel_factory(),
+        hotel_factory(),
+    )
+    dept_x, dept_y = department_factory(), department_factory()
+
+    grant_role(
+        user, hotel_a, visibility=Visibility.DEPARTMENT, department=dept_x
+    )
+    grant_role(user, hotel_b, visibility=Visibility.HOTEL)
+
+    visible = {
+        issue_factory(hotel_a, assigned_department=dept_x).pk,
+        issue_factory(hotel_b, assigned_department=dept_y).pk,
+    }
+    issue_factory(hotel_a, assigned_department=dept_y)
+    issue_factory(hotel_c, assigned_department=dept_x)
+    return user, visible
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("strategy", sorted(SCOPE_FILTERS))
+def test_strategies_return_same_rows(strategy, scoped_world):
+    user, visible = scoped_world
+    apply_scope = get_scope_filter(strategy)
+
+    qs = apply_scope(
+        Issue.objects.all(),
+        build_user_scope(user),
+        hotel_field="hotel_id",
+        department_field="assigned_department_id",
+    )
+    assert set(qs.values_list("pk", flat=True)) == visible
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("strategy", ["values", "exists"])
+def test_join_strategies_do_not_use_distinct(strategy, scoped_world):
+    user, _ = scoped_world
+    qs = get_scope_filter(strategy)(
+        Issue.objects.all(),
+        build_user_scope(user),
+        department_field="assigned_department_id",
+    )
+    assert "DISTINCT" not in str(qs.query)
+
+
+def test_unknown_strategy_raises():
+    with pytest.raises(ValueError):
+        get_scope_filter("nope")
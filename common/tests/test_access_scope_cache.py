@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from common.utils.access.scope_cache import (
+    get_request_scope,
+    get_user_scope,
+)
+from hotels.models import Visibility
+
+_DB_CACHE = {
+    "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+    "LOCATION": "test_scope_cache",
+}
+
+
+@pytest.fixture()
+def shared_cache(settings):
+    """
+    A cache shared between workers: "default" and "other_worker" are two
+    instances of one database cache, like two processes on one redis.
+    """
+    settings.CACHES = {"default": _DB_CACHE, "other_worker": _DB_CACHE}
+    call_command("createcachetable", verbosity=0)
+
+
+def _role_queries(queries) -> int:
+    return sum('"hotels_hoteluserrole"' in q["sql"] for q in queries)
+
+
+@pytest.mark.django_db
+def test_user_scope_cached_across_calls(
+    shared_cache, user_factory, hotel_factory, grant_role
+):
+    user = user_factory()
+    hotel = hotel_factory()
+    grant_role(user, hotel, visibility=Visibility.HOTEL)
+
+    scope = get_user_scope(user)
+    assert scope.hotel_ids == frozenset({hotel.id})
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert get_user_scope(user) == scope
+    assert _role_queries(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_role_change_in_another_worker_is_not_served_stale(
+    shared_cache, settings, user_factory, hotel_factory, grant_role
+):
+    user = user_factory()
+    first, second = hotel_factory(), hotel_factory()
+    grant_role(user, first, visibility=Visibility.HOTEL)
+    user_role = grant_role(user, second, visibility=Visibility.HOTEL)
+    assert get_user_scope(user).hotel_ids == frozenset({first.id, second.id})
+
+    # the revocation is handled by another worker, through its own cache
+    settings.ACCESS_SCOPE_CACHE_ALIAS = "other_worker"
+    user_role.is_active = False
+    user_role.save()
+
+    settings.ACCESS_SCOPE_CACHE_ALIAS = "default"
+    assert get_user_scope(user).hotel_ids == frozenset({first.id})
+
+
+@pytest.mark.django_db
+def test_local_memory_cache_is_not_used_across_requests(
+    settings, user_factory, hotel_factory, grant_role
+):
+    locmem = "django.core.cache.backends.locmem.LocMemCache"
+    settings.CACHES = {
+        "default": {"BACKEND": locmem, "LOCATION": "worker"},
+        "other_worker": {"BACKEND": locmem, "LOCATION": "other_worker"},
+    }
+    user = user_factory()
+    hotel = hotel_factory()
+    user_role = grant_role(user, hotel, visibility=Visibility.HOTEL)
+    assert get_user_scope(user).hotel_ids == frozenset({hotel.id})
+
+    settings.ACCESS_SCOPE_CACHE_ALIAS = "other_worker"
+    user_role.is_active = False
+    user_role.save()
+
+    settings.ACCESS_SCOPE_CACHE_ALIAS = "default"
+    assert get_user_scope(user).hotel_ids == frozenset()
+
+
+@pytest.mark.django_db
+def test_request_scope_memoized_on_request(
+    rf: RequestFactory, user_factory, hotel_factory, grant_role
+):
+    user = user_factory()
+    grant_role(user, hotel_factory(), visibility=Visibility.GLOBAL)
+
+    request = rf.get("/")
+    request.user = user
+
+    scope = get_request_scope(request)
+    assert scope.is_global is True
+    assert get_request_scope(request) is scope
+
+
+@pytest.mark.django_db
+def test_user_role_change_invalidates_scope(
+    shared_cache, user_factory, hotel_factory, grant_role
+):
+    user = user_factory()
+    first, second = hotel_factory(), hotel_factory()
+    grant_role(user, first, visibility=Visibility.HOTEL)
+    assert get_user_scope(user).hotel_ids == frozenset({first.id})
+
+    user_role = grant_role(user, second, visibility=Visibility.HOTEL)
+    assert get_user_scope(user).hotel_ids == frozenset({first.id, second.id})
+
+    user_role.is_active = False
+    user_role.save()
+    assert get_user_scope(user).hotel_ids == frozenset({first.id})
+
+
+@pytest.mark.django_db
+def test_role_change_invalidates_scope(
+    shared_cache, user_factory, hotel_factory, grant_role
+):
+    user = user_factory()
+    hotel = hotel_factory()
+    user_role = grant_role(user, hotel, visibility=Visibility.HOTEL)
+    assert get_user_scope(user).is_global is False
+
+    user_role.role.visibility = Visibility.GLOBAL
+    user_role.role.save()
+    assert get_user_scope(user).is_global is True
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.db_routers import STICKY_COOKIE, ReplicaRouter, use_replica
+from hotels.models import Visibility
+from issues.models import Issue
+
+REPLICA = "replica"
+
+
+@pytest.fixture()
+def replicas(settings):
+    settings.DATABASE_REPLICAS = [REPLICA]
+
+
+@pytest.fixture()
+def hotel_staff(user_factory, hotel_factory, grant_role):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    grant_role(user, hotel, visibility=Visibility.HOTEL)
+    return user, hotel
+
+
+def _issue_queries(ctx) -> list[str]:
+    return [
+        q["sql"] for q in ctx.captured_queries if '"issues_issue"' in q["sql"]
+    ]
+
+
+def test_reads_go_to_the_replica_only_inside_the_block(replicas):
+    router = ReplicaRouter()
+
+    assert router.db_for_read(Issue) is None
+    with use_replica() as alias:
+        assert alias == REPLICA
+        assert router.db_for_read(Issue) == REPLICA
+        assert Issue.objects.all().db == REPLICA
+        assert router.db_for_write(Issue) == "default"
+    assert Issue.objects.all().db == "default"
+
+
+def test_without_replicas_everything_stays_on_default(settings):
+    settings.DATABASE_REPLICAS = []
+
+    with use_replica() as alias:
+        assert alias is None
+        assert Issue.objects.all().db == "default"
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", REPLICA])
+def test_read_only_views_read_from_the_replica(
+    replicas, client: Client, hotel_staff, issue_factory
+):
+    user, hotel = hotel_staff
+    issue = issue_factory(hotel)
+    client.force_login(user)
+
+    with (
+        CaptureQueriesContext(connections["default"]) as primary,
+        CaptureQueriesContext(connections[REPLICA]) as replica,
+    ):
+        resp = client.get(reverse("issue_list"))
+        export = client.get(reverse("issue_export"))
+        # streamed after the view returned, still from the replica
+        body = b"".join(export.streaming_content)
+
+    assert resp.status_code == 200
+    assert list(resp.context["issues"]) == [issue]
+    assert str(issue.pk).encode() in body
+    assert len(_issue_queries(replica)) == 2
+    assert not _issue_queries(primary)
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", REPLICA])
+def test_a_write_pins_the_user_to_the_primary(
+    replicas, client: Client, hotel_staff, issue_factory
+):
+    user, hotel = hotel_staff
+    issue = issue_factory(hotel)
+    client.force_login(user)
+
+    resp = client.post(
+        reverse("issue_change_status", args=[issue.pk]),
+        {"status": Issue.Status.ASSIGNED},
+    )
+    assert resp.status_code == 302
+    assert resp.cookies[STICKY_COOKIE]["max-age"]
+
+    with CaptureQueriesContext(connections[REPLICA]) as replica:
+        resp = client.get(reverse("issue_detail", args=[issue.pk]))
+
+    assert resp.context["issue"].status == Issue.Status.ASSIGNED
+    assert not replica.captured_queries
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from common.utils.pagination import KeysetPaginator
+from issues.models import Issue
+
+
+@pytest.fixture()
+def seven_issues(hotel_factory, issue_factory):
+    hotel = hotel_factory()
+    issues = [issue_factory(hotel) for _ in range(7)]
+    # newest first, the same order the paginator walks
+    return sorted(issues, key=lambda i: (i.created_at, i.pk), reverse=True)
+
+
+@pytest.mark.django_db
+def test_walk_forward_and_back(seven_issues):
+    paginator = KeysetPaginator(Issue.objects.all(), 3)
+
+    first = paginator.page()
+    assert [i.pk for i in first] == [i.pk for i in seven_issues[:3]]
+    assert first.has_previous() is False
+    assert first.has_next() is True
+
+    second = paginator.page(first.next_cursor)
+    assert [i.pk for i in second] == [i.pk for i in seven_issues[3:6]]
+
+    last = paginator.page(second.next_cursor)
+    assert [i.pk for i in last] == [seven_issues[6].pk]
+    assert last.has_next() is False
+
+    back = paginator.page(last.previous_cursor)
+    assert [i.pk for i in back] == [i.pk for i in seven_issues[3:6]]
+    assert back.has_previous() is True
+
+
+@pytest.mark.django_db
+def test_page_does_not_count(seven_issues, django_assert_num_queries):
+    paginator = KeysetPaginator(Issue.objects.all(), 3)
+    cursor = paginator.page().next_cursor
+
+    with django_assert_num_queries(1):
+        paginator.page(cursor)
+
+
+def test_invalid_cursor_raises():
+    paginator = KeysetPaginator(Issue.objects.none(), 3)
+    with pytest.raises(ValueError):
+        paginator.page("not-a-cursor")
+
+
+@pytest.mark.django_db
+def test_cursor_is_an_index_condition(seven_issues):
+    paginator = KeysetPaginator(Issue.objects.all(), 3)
+    cursor = paginator.page().next_cursor
+    with CaptureQueriesContext(connection) as queries:
+        paginator.page(cursor)
+
+    with connection.cursor() as db:
+        # seven rows: make sure the (created_at, id) index is chosen
+        db.execute("SET LOCAL enable_seqscan = off")
+        db.execute("EXPLAIN " + queries[0]["sql"])
+        plan = "\n".join(row[0] for row in db.fetchall())
+
+    assert "Index Cond: (ROW(created_at, id) < ROW(" in plan
+    assert "Filter" not in plan
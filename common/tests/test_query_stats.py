@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from common.middleware import QueryStatsConfig, QueryStatsMiddleware
+from common.utils.query_stats import (
+    POOL_STATS_KEYS,
+    QueryStats,
+    collect_query_stats,
+    pop_pool_stats,
+)
+
+
+def test_query_stats_keeps_only_the_slowest():
+    stats = QueryStats(slowest=2)
+    for n, seconds in enumerate([0.001, 0.005, 0.002, 0.009]):
+        stats.record(f"SELECT {n}", seconds)
+
+    assert stats.count == 4
+    assert stats.total_ms == pytest.approx(17.0)
+    assert [sql for _, sql in stats.slowest_statements()] == [
+        "SELECT 3",
+        "SELECT 1",
+    ]
+
+
+@pytest.mark.django_db
+def test_collect_query_stats_wraps_the_connection():
+    with collect_query_stats() as stats:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.execute("SELECT 2")
+
+    assert stats.count == 2
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 3")
+    assert stats.count == 2
+
+
+def _view(request):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    response = HttpResponse("ok")
+    response["Server-Timing"] = "app;dur=1"
+    return response
+
+
+@pytest.mark.django_db
+def test_middleware_sampled_request_gets_headers_and_log(caplog):
+    middleware = QueryStatsMiddleware(
+        _view, QueryStatsConfig(sample_rate=1.0, headers=True)
+    )
+
+    with caplog.at_level(logging.INFO, logger="common.query_stats"):
+        response = middleware(RequestFactory().get("/issues/"))
+
+    assert response["X-DB-Query-Count"] == "1"
+    assert float(response["X-DB-Time-Ms"]) >= 0
+    assert response["Server-Timing"].startswith("app;dur=1, db;dur=")
+    [record] = caplog.records
+    line = json.loads(record.getMessage())
+    assert line["path"] == "/issues/"
+    assert line["queries"] == 1
+    assert line["slowest"][0]["sql"] == "SELECT 1"
+    assert "pool" in line
+
+
+@pytest.mark.django_db
+def test_middleware_skips_unsampled_requests(caplog):
+    middleware = QueryStatsMiddleware(
+        _view, QueryStatsConfig(sample_rate=0.0, headers=True)
+    )
+
+    with caplog.at_level(logging.INFO, logger="common.query_stats"):
+        response = middleware(RequestFactory().get("/"))
+
+    assert "X-DB-Query-Count" not in response
+    assert not caplog.records
+
+
+@pytest.mark.django_db
+def test_pop_pool_stats_reports_and_resets_the_pool_counters():
+    if connection.pool is None:
+        pytest.skip("DB_POOL is off")
+    connection.ensure_connection()
+
+    first = pop_pool_stats()["default"]
+    second = pop_pool_stats()["default"]
+
+    assert set(first) == set(POOL_STATS_KEYS)
+    assert first["pool_size"] >= 1
+    # counters restart, gauges don't
+    assert second["requests_num"] == 0
+    assert second["pool_size"] == first["pool_size"]
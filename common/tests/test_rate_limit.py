@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from common.utils.rate_limit import (
+    RateLimitExceeded,
+    TokenBucket,
+    check_all,
+    consume_all,
+)
+
+
+def test_bucket_allows_burst_then_limits(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("common.utils.rate_limit.time.time", lambda: now[0])
+    bucket = TokenBucket(name="test", capacity=2, per_seconds=10)
+
+    assert bucket.consume("k") == 0.0
+    assert bucket.consume("k") == 0.0
+    assert bucket.consume("k") == pytest.approx(5.0)
+    # other keys have their own bucket
+    assert bucket.consume("other") == 0.0
+
+    now[0] += 5
+    bucket.check("k")
+    with pytest.raises(RateLimitExceeded) as exc:
+        bucket.check("k")
+    assert exc.value.retry_after == pytest.approx(5.0)
+
+
+def test_bucket_reset():
+    bucket = TokenBucket(name="test", capacity=1, per_seconds=60)
+    bucket.check("k")
+    bucket.reset("k")
+    bucket.check("k")
+
+
+def test_consume_all_takes_nothing_when_one_bucket_is_short(monkeypatch):
+    monkeypatch.setattr("common.utils.rate_limit.time.time", lambda: 1000.0)
+    wide = TokenBucket(name="wide", capacity=2, per_seconds=10)
+    narrow = TokenBucket(name="narrow", capacity=1, per_seconds=10)
+    narrow.check("k")
+
+    assert consume_all([(wide, "k"), (narrow, "k")]) == pytest.approx(10.0)
+    with pytest.raises(RateLimitExceeded):
+        check_all([(wide, "k"), (narrow, "k")])
+    # the wide bucket is still full
+    assert wide.consume("k") == 0.0
+    assert wide.consume("k") == 0.0
@@ -1,9 +1,75 @@
 from __future__ import annotations
 
-from django.db.models import Q, QuerySet
+from collections.abc import Callable, Iterable
+
+from django.core.exceptions import EmptyResultSet
+from django.db.models import (
+    BooleanField,
+    Exists,
+    Expression,
+    F,
+    OuterRef,
+    Q,
+    QuerySet,
+)
+
+from hotels.models import HotelUserRole, Visibility
 
 from .scope import UserScope
 
+ScopeFilter = Callable[..., QuerySet]
+
+
+class RowValueIn(Expression):
+    """
+    (first, second) IN (VALUES (a1, b1), (a2, b2), ...)
+
+    A single row-value predicate instead of an OR chain of pairs.
+    Values are cast explicitly so the VALUES list gets the column types.
+    """
+
+    output_field = BooleanField()
+    conditional = True
+
+    def __init__(self, first: str, second: str, rows: Iterable[tuple]) -> None:
+        super().__init__()
+        self.first = F(first)
+        self.second = F(second)
+        self.rows = tuple(rows)
+
+    def get_source_expressions(self) -> list:
+        return [self.first, self.second]
+
+    def set_source_expressions(self, exprs) -> None:
+        self.first, self.second = exprs
+
+    def as_sql(self, compiler, connection):
+        if not self.rows:
+            raise EmptyResultSet
+
+        first_sql, first_params = compiler.compile(self.first)
+        second_sql, second_params = compiler.compile(self.second)
+
+        first_field = self.first.output_field
+        second_field = self.second.output_field
+        row_sql = (
+            f"(CAST(%s AS {first_field.cast_db_type(connection)}), "
+            f"CAST(%s AS {second_field.cast_db_type(connection)}))"
+        )
+
+        params = [*first_params, *second_params]
+        for first_value, second_value in self.rows:
+            params.append(
+                first_field.get_db_prep_value(first_value, connection)
+            )
+            params.append(
+                second_field.get_db_prep_value(second_value, connection)
+            )
+
+        values_sql = ", ".join([row_sql] * len(self.rows))
+        sql = f"({first_sql}, {second_sql}) IN (VALUES {values_sql})"
+        return sql, params
+
 
 def apply_scope_to_qs(
     qs: QuerySet,
@@ -43,3 +109,83 @@ def apply_scope_to_qs(
         return qs.none()
 
     return qs.filter(visibility_filter).distinct()
+
+
+def apply_scope_to_qs_values(
+    qs: QuerySet,
+    scope: UserScope,
+    *,
+    hotel_field: str = "hotel_id",
+    department_field: str | None = None,
+) -> QuerySet:
+    """
+    Same contract as apply_scope_to_qs, but (hotel, department) pairs are
+    matched with one row-value IN (VALUES ...) predicate and no DISTINCT.
+    """
+    if scope.is_global:
+        return qs
+
+    visibility_filter = Q()
+
+    if scope.hotel_ids:
+        visibility_filter |= Q(**{f"{hotel_field}__in": scope.hotel_ids})
+
+    if department_field is not None and scope.dept_pairs:
+        visibility_filter |= Q(
+            RowValueIn(hotel_field, department_field, scope.dept_pairs)
+        )
+
+    if not visibility_filter:
+        return qs.none()
+
+    return qs.filter(visibility_filter)
+
+
+def apply_scope_to_qs_exists(
+    qs: QuerySet,
+    scope: UserScope,
+    *,
+    hotel_field: str = "hotel_id",
+    department_field: str | None = None,
+) -> QuerySet:
+    """
+    Same contract as apply_scope_to_qs, but department visibility is an
+    EXISTS subquery against the user's active HotelUserRole rows
+    (served by the (hotel, department) index), no DISTINCT.
+    """
+    if scope.is_global:
+        return qs
+
+    visibility_filter = Q()
+
+    if scope.hotel_ids:
+        visibility_filter |= Q(**{f"{hotel_field}__in": scope.hotel_ids})
+
+    if department_field is not None and scope.dept_pairs:
+        user_roles = HotelUserRole.objects.filter(
+            user_id=scope.user_id,
+            is_active=True,
+            role__visibility=Visibility.DEPARTMENT,
+            hotel_id=OuterRef(hotel_field),
+            department_id=OuterRef(department_field),
+        )
+        visibility_filter |= Q(Exists(user_roles))
+
+    if not visibility_filter:
+        return qs.none()
+
+    return qs.filter(visibility_filter)
+
+
+SCOPE_FILTERS: dict[str, ScopeFilter] = {
+    "or": apply_scope_to_qs,
+    "values": apply_scope_to_qs_values,
+    "exists": apply_scope_to_qs_exists,
+}
+
+
+def get_scope_filter(strategy: str) -> ScopeFilter:
+    try:
+        return SCOPE_FILTERS[strategy]
+    except KeyError:
+        raise ValueError(f"Unknown scope strategy: {strategy}") from None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import uuid
 from dataclasses import dataclass
 
 from hotels.models import HotelUserRole, Visibility
@@ -13,11 +14,21 @@ class UserScope:
     - global: True → visible to all
     - hotel_ids: hotels to which access is granted
     - dept_pairs: pairs (hotel_id, department_id)
+    - user_id: owner of the scope (used by the EXISTS filter strategy)
     """
 
     is_global: bool
     hotel_ids: frozenset[int]
     dept_pairs: frozenset[tuple[int, int]]
+    user_id: int | None = None
+
+    def covers(self, hotel_id: int, department_id: uuid.UUID | None) -> bool:
+        """Whether an issue of this hotel/department is visible."""
+        return (
+            self.is_global
+            or hotel_id in self.hotel_ids
+            or (hotel_id, department_id) in self.dept_pairs
+        )
 
 
 def build_user_scope(user: StaffUser) -> UserScope:
@@ -32,6 +43,7 @@ def build_user_scope(user: StaffUser) -> UserScope:
             is_global=False,
             hotel_ids=frozenset(),
             dept_pairs=frozenset(),
+            user_id=user.pk,
         )
 
     # GLOBAL
@@ -40,6 +52,7 @@ def build_user_scope(user: StaffUser) -> UserScope:
             is_global=True,
             hotel_ids=frozenset(),
             dept_pairs=frozenset(),
+            user_id=user.pk,
         )
 
     hotel_ids: set[int] = set()
@@ -58,4 +71,5 @@ def build_user_scope(user: StaffUser) -> UserScope:
         is_global=False,
         hotel_ids=frozenset(hotel_ids),
         dept_pairs=frozenset(dept_pairs),
+        user_id=user.pk,
     )
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpRequest
+
+from users.models import StaffUser
+
+from .scope import UserScope, build_user_scope
+
+SCOPE_KEY_PREFIX = "access:scope"
+REQUEST_ATTR = "_user_scope"
+
+EMPTY_SCOPE = UserScope(
+    is_global=False,
+    hotel_ids=frozenset(),
+    dept_pairs=frozenset(),
+)
+
+
+def _cache() -> BaseCache | None:
+    cache = caches[settings.ACCESS_SCOPE_CACHE_ALIAS]
+    # Invalidation only reaches the cache of the worker that made the
+    # change; in a per-process cache every other worker would keep a
+    # revoked role's access until the entry expires.
+    if isinstance(cache, LocMemCache):
+        return None
+    return cache
+
+
+def _version_key(user_id: int | None) -> str:
+    if user_id is None:
+        return f"{SCOPE_KEY_PREFIX}:version:global"
+    return f"{SCOPE_KEY_PREFIX}:version:user:{user_id}"
+
+
+def _get_version(cache: BaseCache, user_id: int | None) -> int:
+    # Seed with the clock, not 1: if the version key gets evicted, entries
+    # stored under an older version must never become reachable again.
+    return cache.get_or_set(_version_key(user_id), time.time_ns, timeout=None)
+
+
+def _bump_version(user_id: int | None) -> None:
+    cache = _cache()
+    if cache is None:
+        return
+    key = _version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_user_scope(user_id: int) -> None:
+    """Drops the cached scope of a single user (their roles changed)."""
+    _bump_version(user_id)
+
+
+def invalidate_all_scopes() -> None:
+    """Drops every cached scope (a Role/department changed)."""
+    _bump_version(None)
+
+
+def get_user_scope(user: StaffUser) -> UserScope:
+    """
+    Cached build_user_scope().
+
+    Key: user id + global role version + user role version, so any
+    HotelUserRole/Role change makes the old entry unreachable. Not cached
+    when ACCESS_SCOPE_CACHE_ALIAS is a per-process (locmem) cache.
+    """
+    if not user.is_authenticated:
+        return EMPTY_SCOPE
+
+    cache = _cache()
+    if cache is None:
+        return build_user_scope(user)
+    key = (
+        f"{SCOPE_KEY_PREFIX}:{user.pk}"
+        f":{_get_version(cache, None)}:{_get_version(cache, user.pk)}"
+    )
+
+    scope = cache.get(key)
+    if scope is None:
+        scope = build_user_scope(user)
+        cache.set(key, scope, timeout=settings.ACCESS_SCOPE_CACHE_TIMEOUT)
+    return scope
+
+
+def get_request_scope(request: HttpRequest) -> UserScope:
+    """Scope of request.user, memoized on the request object."""
+    scope = getattr(request, REQUEST_ATTR, None)
+    if scope is None:
+        scope = get_user_scope(request.user)
+        setattr(request, REQUEST_ATTR, scope)
+    return scope
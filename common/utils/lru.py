@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import builtins
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+_NO_EXPIRY = float("inf")
+
+
+class LRUCache:
+    """
+    Small thread-safe in-process LRU map with an optional TTL.
+
+    Unlike functools.lru_cache it can be filled in bulk (warm-up with one
+    query) and invalidated per key from model signals. The TTL bounds
+    staleness in other processes, which don't see those signals.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else _NO_EXPIRY
+        )
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    # builtins: the set() method shadows the type in the class body
+    def missing(self, keys: Iterable[Hashable]) -> builtins.set[Hashable]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key
+                for key in keys
+                if key not in self._data or self._data[key][0] < now
+            }
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from django.db.models import F, Field, Func, QuerySet, Value
+from django.db.models.lookups import GreaterThan, LessThan
+from django.utils.dateparse import parse_datetime
+
+
+@dataclass(frozen=True)
+class KeysetPage:
+    """
+    One page of keyset (cursor) pagination.
+
+    Compatible with the parts of Django's Page used by ListView/templates.
+    """
+
+    object_list: list[Any]
+    next_cursor: str | None
+    previous_cursor: str | None
+
+    is_keyset = True
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination over a (timestamp, pk) key, newest first.
+
+    Every page is a `WHERE (ts, pk) < (:ts, :pk) ORDER BY ts DESC, pk DESC
+    LIMIT n + 1` query, so page 500 costs the same as page 1 and no
+    COUNT(*) is ever issued. The cursor is an opaque urlsafe string that
+    carries the boundary key and the direction.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        per_page: int,
+        *,
+        time_field: str = "created_at",
+        pk_field: str = "id",
+    ) -> None:
+        self.queryset = queryset
+        self.per_page = per_page
+        self.time_field = time_field
+        self.pk_field = pk_field
+
+    def page(self, cursor: str | None = None) -> KeysetPage:
+        if not cursor:
+            rows = self._fetch(self._ordered(desc=True))
+            has_next = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            return self._build(rows, has_next=has_next, has_previous=False)
+
+        direction, ts, pk = self._decode(cursor)
+
+        if direction == "next":
+            qs = self._ordered(desc=True).filter(self._after(ts, pk))
+            rows = self._fetch(qs)
+            has_next = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            return self._build(rows, has_next=has_next, has_previous=True)
+
+        qs = self._ordered(desc=False).filter(self._before(ts, pk))
+        rows = self._fetch(qs)
+        has_previous = len(rows) > self.per_page
+        rows = rows[: self.per_page][::-1]
+        return self._build(rows, has_next=True, has_previous=has_previous)
+
+    def _ordered(self, *, desc: bool) -> QuerySet:
+        prefix = "-" if desc else ""
+        return self.queryset.order_by(
+            f"{prefix}{self.time_field}", f"{prefix}{self.pk_field}"
+        )
+
+    def _fetch(self, qs: QuerySet) -> list[Any]:
+        return list(qs[: self.per_page + 1])
+
+    def _row(self, *expressions) -> Func:
+        return Func(*expressions, function="ROW", output_field=Field())
+
+    def _key(self) -> Func:
+        return self._row(F(self.time_field), F(self.pk_field))
+
+    def _boundary(self, ts, pk) -> Func:
+        meta = self.queryset.model._meta
+        return self._row(
+            Value(ts, output_field=meta.get_field(self.time_field)),
+            Value(pk, output_field=meta.get_field(self.pk_field)),
+        )
+
+    # Row-value comparisons, not ts < :ts OR (ts = :ts AND pk < :pk):
+    # Postgres turns only the row form into an index condition on
+    # (ts, pk); the OR form is a filter over every row before the page.
+
+    def _after(self, ts, pk) -> LessThan:
+        # Older than the boundary row.
+        return LessThan(self._key(), self._boundary(ts, pk))
+
+    def _before(self, ts, pk) -> GreaterThan:
+        # Newer than the boundary row.
+        return GreaterThan(self._key(), self._boundary(ts, pk))
+
+    def _build(
+        self, rows: list[Any], *, has_next: bool, has_previous: bool
+    ) -> KeysetPage:
+        next_cursor = None
+        previous_cursor = None
+        if rows and has_next:
+            next_cursor = self._encode("next", rows[-1])
+        if rows and has_previous:
+            previous_cursor = self._encode("prev", rows[0])
+        return KeysetPage(
+            object_list=rows,
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
+        )
+
+    def _encode(self, direction: str, obj: Any) -> str:
+        ts = getattr(obj, self.time_field)
+        pk = getattr(obj, self.pk_field)
+        raw = json.dumps([direction, ts.isoformat(), str(pk)])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode(cursor: str) -> tuple[str, Any, str]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            direction, ts_raw, pk = json.loads(
+                base64.urlsafe_b64decode(padded.encode())
+            )
+            ts = parse_datetime(ts_raw)
+        except (ValueError, TypeError) as exc:
+            raise ValueError("Invalid cursor") from exc
+
+        if direction not in ("next", "prev") or ts is None:
+            raise ValueError("Invalid cursor")
+        return direction, ts, pk
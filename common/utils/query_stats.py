@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import heapq
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.db import connections
+
+# psycopg_pool counters worth a log line; missing ones are zero
+POOL_STATS_KEYS = (
+    "pool_size",
+    "pool_available",
+    "requests_waiting",
+    "requests_num",
+    "requests_queued",
+    "requests_wait_ms",
+    "requests_errors",
+    "connections_num",
+    "connections_errors",
+    "connections_lost",
+)
+
+# statements are kept without their parameters (no guest data in logs)
+# and cut to this many characters
+MAX_SQL_LENGTH = 500
+
+
+@dataclass
+class QueryStats:
+    """
+    Per-request query counters, filled by execute_wrapper.
+
+    Only the `slowest` statements are kept (a min-heap), so a request
+    running thousands of queries costs a counter, not a list.
+    """
+
+    slowest: int = 5
+    count: int = 0
+    total_seconds: float = 0.0
+    _heap: list[tuple[float, int, str]] = field(default_factory=list)
+
+    def __call__(
+        self, execute, sql: str, params: Any, many: bool, context: dict
+    ):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, time.perf_counter() - started)
+
+    def record(self, sql: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if self.slowest <= 0:
+            return
+        # count breaks ties, so statements are never compared
+        entry = (seconds, self.count, sql)
+        if len(self._heap) < self.slowest:
+            heapq.heappush(self._heap, entry)
+        elif seconds > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000
+
+    def slowest_statements(self) -> list[tuple[float, str]]:
+        """[(milliseconds, sql)], slowest first."""
+        return [
+            (seconds * 1000, sql[:MAX_SQL_LENGTH])
+            for seconds, _, sql in sorted(self._heap, reverse=True)
+        ]
+
+
+@contextmanager
+def collect_query_stats(slowest: int = 5) -> Iterator[QueryStats]:
+    """Count the queries run on every database alias inside the block."""
+    stats = QueryStats(slowest=slowest)
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        yield stats
+
+
+def pop_pool_stats() -> dict[str, dict[str, int]]:
+    """
+    psycopg pool counters per pooled alias, reset by the call.
+
+    requests_queued / requests_wait_ms are the pool-wait metrics: how
+    many getconn() calls had to wait for a free connection, and for how
+    long in total, since the previous call in this process.
+    """
+    stats = {}
+    for connection in connections.all(initialized_only=True):
+        pool = getattr(connection, "pool", None)
+        if pool is None:
+            continue
+        counters = pool.pop_stats()
+        stats[connection.alias] = {
+            key: counters.get(key, 0) for key in POOL_STATS_KEYS
+        }
+    return stats
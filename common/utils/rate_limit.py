@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+from django.core.cache import caches
+
+_lock = threading.Lock()
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Rate limit exceeded, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class TokenBucket:
+    """
+    Token bucket kept in the Django cache: `capacity` requests at once,
+    refilled at capacity / per_seconds tokens per second.
+
+    State is (tokens, timestamp) per key. The read-modify-write is
+    serialized within the process; across processes sharing a cache a
+    race can let a request or two through, which is fine for abuse
+    protection.
+    """
+
+    name: str
+    capacity: int
+    per_seconds: float
+    cache_alias: str = "default"
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.per_seconds
+
+    def _key(self, key: Hashable) -> str:
+        return f"ratelimit:{self.name}:{key}"
+
+    def _available(self, key: Hashable, now: float) -> float:
+        state = caches[self.cache_alias].get(self._key(key))
+        if state is None:
+            return float(self.capacity)
+        left, at = state
+        return min(self.capacity, left + (now - at) * self.rate)
+
+    def _store(self, key: Hashable, tokens: float, now: float) -> None:
+        caches[self.cache_alias].set(
+            self._key(key),
+            (tokens, now),
+            # a full bucket needs no state
+            timeout=math.ceil(self.per_seconds) + 1,
+        )
+
+    def consume(self, key: Hashable, tokens: int = 1) -> float:
+        """Take tokens; 0.0 on success, else seconds until they're there."""
+        return consume_all([(self, key)], tokens)
+
+    def check(self, key: Hashable, tokens: int = 1) -> None:
+        retry_after = self.consume(key, tokens)
+        if retry_after:
+            raise RateLimitExceeded(retry_after)
+
+    def reset(self, key: Hashable) -> None:
+        caches[self.cache_alias].delete(self._key(key))
+
+
+def consume_all(
+    limits: Iterable[tuple[TokenBucket, Hashable]], tokens: int = 1
+) -> float:
+    """
+    Take tokens from every (bucket, key), or from none of them: 0.0 on
+    success, else seconds until all of them have the tokens.
+    """
+    with _lock:
+        now = time.time()
+        levels = [
+            (bucket, key, bucket._available(key, now))
+            for bucket, key in limits
+        ]
+        retry_after = max(
+            (
+                (tokens - available) / bucket.rate
+                for bucket, _, available in levels
+                if available < tokens
+            ),
+            default=0.0,
+        )
+        if retry_after:
+            return retry_after
+        for bucket, key, available in levels:
+            bucket._store(key, available - tokens, now)
+        return 0.0
+
+
+def check_all(
+    limits: Iterable[tuple[TokenBucket, Hashable]], tokens: int = 1
+) -> None:
+    """consume_all(), raising RateLimitExceeded when any bucket is short."""
+    retry_after = consume_all(limits, tokens)
+    if retry_after:
+        raise RateLimitExceeded(retry_after)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from faker import Faker
+
+from hotels.models import (
+    Hotel,
+    HotelDepartment,
+    HotelUserRole,
+    Role,
+    Room,
+    Visibility,
+)
+from hotels.services.directory import hotel_directory
+from issues.models import Issue, IssueCategory
+from issues.services.sla import sla_calculator
+from users.models import StaffUser
+
+User = get_user_model()
+
+_seq = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(
+    django_db_modify_db_settings_parallel_suffix,
+) -> None:
+    # a second alias on the test database: the replica of routing tests
+    # (common/tests/test_db_routers.py). Reads are routed to replicas
+    # only in tests that set DATABASE_REPLICAS themselves.
+    from django.conf import settings
+    from django.db import connections
+
+    default = connections["default"].settings_dict
+    settings.DATABASES.setdefault(
+        "replica",
+        {**default, "TEST": {**default["TEST"], "MIRROR": "default"}},
+    )
+    settings.DATABASE_REPLICAS = []
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    # In-process caches live for the whole process: keep tests isolated.
+    cache.clear()
+    sla_calculator.clear()
+    hotel_directory.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture()
+def faker() -> Faker:
+    return Faker()
+
+
+@pytest.fixture()
+def user_factory(faker: Faker) -> Callable[..., StaffUser]:
+    def _make_user(**kwargs):
+        username = kwargs.pop("username", faker.user_name()[:30])
+        email = kwargs.pop("email", faker.unique.email())
+        password = kwargs.pop("password", "TestPassword123!")
+
+        user = User(username=username, email=email, **kwargs)
+        user.set_password(password)
+        user.save()
+        user._raw_password = password  # type: ignore[attr-defined]
+        return user
+
+    return _make_user
+
+
+@pytest.fixture()
+def hotel_factory() -> Callable[..., Hotel]:
+    def _make_hotel(**kwargs):
+        n = next(_seq)
+        kwargs.setdefault("name", f"Hotel {n}")
+        kwargs.setdefault("code", f"H{n}")
+        kwargs.setdefault("slug", f"hotel-{n}")
+        return Hotel.objects.create(**kwargs)
+
+    return _make_hotel
+
+
+@pytest.fixture()
+def department_factory() -> Callable[..., HotelDepartment]:
+    def _make_department(**kwargs):
+        n = next(_seq)
+        kwargs.setdefault("name", f"Department {n}")
+        kwargs.setdefault("code", f"D{n}")
+        return HotelDepartment.objects.create(**kwargs)
+
+    return _make_department
+
+
+@pytest.fixture()
+def role_factory() -> Callable[..., Role]:
+    def _make_role(**kwargs):
+        n = next(_seq)
+        kwargs.setdefault("code", f"role_{n}")
+        kwargs.setdefault("name", f"Role {n}")
+        kwargs.setdefault("visibility", Visibility.DEPARTMENT)
+        return Role.objects.create(**kwargs)
+
+    return _make_role
+
+
+@pytest.fixture()
+def grant_role(role_factory) -> Callable[..., HotelUserRole]:
+    def _grant(user, hotel, *, visibility=Visibility.HOTEL, **kwargs):
+        role = kwargs.pop("role", None) or role_factory(visibility=visibility)
+        return HotelUserRole.objects.create(
+            user=user, hotel=hotel, role=role, **kwargs
+        )
+
+    return _grant
+
+
+@pytest.fixture()
+def room_factory() -> Callable[..., Room]:
+    def _make_room(hotel, **kwargs):
+        kwargs.setdefault("number", str(100 + next(_seq)))
+        return Room.objects.create(hotel=hotel, **kwargs)
+
+    return _make_room
+
+
+@pytest.fixture()
+def category_factory(department_factory) -> Callable[..., IssueCategory]:
+    def _make_category(**kwargs):
+        kwargs.setdefault("name", f"Category {next(_seq)}")
+        if "department" not in kwargs:
+            kwargs["department"] = department_factory()
+        return IssueCategory.objects.create(**kwargs)
+
+    return _make_category
+
+
+@pytest.fixture()
+def issue_factory(room_factory, category_factory) -> Callable[..., Issue]:
+    def _make_issue(hotel, **kwargs):
+        if "room" not in kwargs:
+            kwargs["room"] = room_factory(hotel)
+        if "category" not in kwargs:
+            kwargs["category"] = category_factory(
+                **(
+                    {"department": kwargs["assigned_department"]}
+                    if "assigned_department" in kwargs
+                    else {}
+                )
+            )
+        kwargs.setdefault("assigned_department", kwargs["category"].department)
+        kwargs.setdefault("title", f"Issue {next(_seq)}")
+        kwargs.setdefault("sla_due_at", timezone.now() + timedelta(hours=1))
+        return Issue.objects.create(hotel=hotel, **kwargs)
+
+    return _make_issue
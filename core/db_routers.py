@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+
+# set on responses to writes (common.middleware.PrimaryStickyMiddleware):
+# while present, read-only views read from the primary too, so a user
+# sees their own change before it reaches the replicas
+STICKY_COOKIE = "db_primary"
+
+# alias the current read-only block reads from; None = default
+_read_alias: ContextVar[str | None] = ContextVar("read_alias", default=None)
+
+
+class ReplicaRouter:
+    """
+    Reads inside use_replica() go to a replica, everything else to the
+    primary.
+
+    Outside such a block the router has no opinion, so reads follow the
+    instance they start from and end up on default. Writes always go to
+    default; replicas never get migrations.
+    """
+
+    def db_for_read(self, model, **hints) -> str | None:
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints) -> str | None:
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints) -> bool:
+        return db not in settings.DATABASE_REPLICAS
+
+
+@contextmanager
+def use_replica(alias: str | None = None) -> Iterator[str | None]:
+    """
+    Route the reads of the block to `alias`, or to a random replica.
+
+    Yields the alias used; None when no replica is configured. The
+    block must not write and read back what it wrote.
+    """
+    if alias is None and settings.DATABASE_REPLICAS:
+        alias = random.choice(settings.DATABASE_REPLICAS)
+    token = _read_alias.set(alias)
+    try:
+        yield alias
+    finally:
+        _read_alias.reset(token)
+
+
+def _iter_on_replica(alias: str, content: Iterable) -> Iterator:
+    # queries of a streaming response run while the server iterates it,
+    # after the view returned; every chunk is produced inside the block
+    iterator = iter(content)
+    while True:
+        with use_replica(alias):
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+        yield chunk
+
+
+def serve_from_replica(
+    view: Callable[..., HttpResponse],
+    request: HttpRequest,
+    *args,
+    **kwargs,
+) -> HttpResponse:
+    """
+    Call a read-only view with its reads on a replica.
+
+    Lazy responses are finished inside the block: template responses
+    are rendered, streaming content keeps reading from the same
+    replica. Requests carrying the sticky cookie stay on the primary.
+    """
+    if not settings.DATABASE_REPLICAS or STICKY_COOKIE in request.COOKIES:
+        return view(request, *args, **kwargs)
+
+    alias = random.choice(settings.DATABASE_REPLICAS)
+    with use_replica(alias):
+        response = view(request, *args, **kwargs)
+        if response.streaming:
+            response.streaming_content = _iter_on_replica(
+                alias, response.streaming_content
+            )
+        elif hasattr(response, "render") and not response.is_rendered:
+            response.render()
+    return response
+
+
+def read_replica(view: Callable[..., HttpResponse]):
+    """Decorator for function views, see serve_from_replica."""
+
+    @wraps(view)
+    def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        return serve_from_replica(view, request, *args, **kwargs)
+
+    return wrapper
+
+
+class ReadReplicaMixin(View):
+    """
+    Class-based view mixin, see serve_from_replica. Put it first, so
+    that the login check (request.user) reads from the replica too.
+    """
+
+    def dispatch(self, request: HttpRequest, *args, **kwargs):
+        return serve_from_replica(super().dispatch, request, *args, **kwargs)
@@ -17,15 +17,19 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "users",
     "hotels",
     "issues",
     "notifications",
+    "guests",
 ]
 
 MIDDLEWARE = [
+    "common.middleware.QueryStatsMiddleware",
+    "common.middleware.PrimaryStickyMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -34,10 +38,28 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "users.middleware.JWTRefreshMiddleware",
+    "guests.middleware.GuestStayMiddleware",
 ]
 
+# common.middleware.QueryStatsMiddleware: sampled per-request SQL stats
+# (JSON line on the common.query_stats logger, optional response headers)
+QUERY_STATS_SAMPLE_RATE = settings.query_stats_sample_rate
+QUERY_STATS_SLOWEST = 5
+QUERY_STATS_HEADERS = False
+
+# users.middleware.JWTRefreshMiddleware
+JWT_REFRESH_EXCLUDED_PREFIXES = (
+    "/static/",
+    "/media/",
+    "/health_check/",
+    "/admin/jsi18n/",
+)
+# refresh the access token this many seconds before it expires (0 = off)
+JWT_REFRESH_WINDOW_SECONDS = 60
+
 ROOT_URLCONF = "core.urls"
 AUTH_USER_MODEL = "users.StaffUser"
+AUTHENTICATION_BACKENDS = ["users.backends.UsernameOrEmailBackend"]
 
 TEMPLATES = [
     {
@@ -65,6 +87,17 @@ REST_FRAMEWORK = {
 WSGI_APPLICATION = "core.wsgi.application"
 ASGI_APPLICATION = "core.asgi.application"
 
+# With the pool, a request borrows a connection and returns it when
+# Django closes it at the end of the request, hence CONN_MAX_AGE = 0.
+DATABASE_POOL = {
+    "min_size": settings.database.pool_min_size,
+    "max_size": settings.database.pool_max_size,
+    "timeout": settings.database.pool_timeout,
+    "max_idle": settings.database.pool_max_idle,
+    "max_lifetime": settings.database.pool_max_lifetime,
+}
+DATABASE_OPTIONS = {"pool": DATABASE_POOL} if settings.database.pool else {}
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -73,10 +106,97 @@ DATABASES = {
         "PASSWORD": settings.database.postgres_password,
         "HOST": settings.database.postgres_host,
         "PORT": settings.database.postgres_port,
-        "CONN_MAX_AGE": 60,
+        "CONN_MAX_AGE": (
+            0 if settings.database.pool else settings.database.conn_max_age
+        ),
+        # pooled: the pool checks a connection before handing it out
+        "CONN_HEALTH_CHECKS": settings.database.health_checks,
+        "OPTIONS": DATABASE_OPTIONS,
+    }
+}
+
+# read replicas (core.db_routers): default on other hosts; tests read
+# them through the default test database
+DATABASE_REPLICAS = []
+for n, (host, port) in enumerate(settings.database.replicas, start=1):
+    DATABASES[f"replica_{n}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port,
+        "OPTIONS": dict(DATABASE_OPTIONS),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{n}")
+DATABASE_ROUTERS = ["core.db_routers.ReplicaRouter"]
+# common.middleware.PrimaryStickyMiddleware: after a write, a user reads
+# from the primary for this long (longer than the replication lag)
+REPLICA_STICKY_SECONDS = 15
+
+# locmem is private to each process. Run several workers with db (after
+# manage.py createcachetable) or redis: the cross-request UserScope cache
+# needs one, and guest rate limits and dedup only hold within it.
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "db": "django.core.cache.backends.db.DatabaseCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[settings.cache_backend],
+        "LOCATION": settings.cache_location,
     }
 }
 
+# UserScope cache (common.utils.access.scope_cache); on a locmem alias
+# scopes are only memoized per request, see get_user_scope()
+ACCESS_SCOPE_CACHE_ALIAS = "default"
+ACCESS_SCOPE_CACHE_TIMEOUT = 300
+# Scope filter strategy for issue visibility: or | values | exists
+ACCESS_SCOPE_STRATEGY = settings.access_scope_strategy
+
+# in-process SLA category/calendar cache (issues.services.sla)
+SLA_CACHE_TTL_SECONDS = 300
+
+# guest QR entry: hotel code / room number cache (hotels.services.directory)
+HOTEL_DIRECTORY_TTL_SECONDS = 300
+HOTEL_DIRECTORY_NEGATIVE_TTL_SECONDS = 30
+HOTEL_DIRECTORY_MAX_HOTELS = 1024
+
+# guests.middleware.GuestStayMiddleware: signed stay cookie, re-checked
+# against the DB (revocation) at most this often
+GUEST_STAY_COOKIE_NAME = "guest_stay"
+GUEST_STAY_REVALIDATE_SECONDS = 300
+
+# guests.services.issues: token buckets for new guest issues and the
+# window in which a repeated request becomes a comment on the first one
+GUEST_ISSUE_RATE_LIMITS = {
+    "stay": {"capacity": 5, "per_seconds": 600},
+    "room": {"capacity": 10, "per_seconds": 600},
+}
+GUEST_ISSUE_DEDUP_SECONDS = 600
+# both need a cache shared by the workers, see CACHES
+GUEST_ISSUE_CACHE_ALIAS = "default"
+
+# live issue feed (issues.services.events): local | postgres (NOTIFY)
+ISSUE_EVENTS_BACKEND = settings.issue_events_backend
+ISSUE_EVENTS_CHANNEL = "issue_events"
+ISSUE_EVENTS_HEARTBEAT_SECONDS = 15
+# per-subscriber backlog; on overflow the client gets a resync event
+ISSUE_EVENTS_QUEUE_SIZE = 100
+
+# notifications.services.senders: {channel_type: {"BACKEND", "OPTIONS"}}
+NOTIFICATION_SENDERS = {
+    "email": {
+        "BACKEND": "notifications.services.senders.StubEmailSender",
+    },
+    "telegram": {
+        "BACKEND": "notifications.services.senders.StubTelegramSender",
+    },
+    "web_push": {
+        "BACKEND": "notifications.services.senders.StubWebPushSender",
+    },
+}
+
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 # STATICFILES_DIRS = [
@@ -104,7 +224,12 @@ LOGGING = {
     "loggers": {
         "django.db.backends": {
             "handlers": ["console"],
-            "level": "DEBUG",
+            "level": "DEBUG" if settings.sql_echo else "INFO",
+            "propagate": False,
+        },
+        "common.query_stats": {
+            "handlers": ["console"],
+            "level": "INFO",
             "propagate": False,
         },
         "django": {
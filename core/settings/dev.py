@@ -3,3 +3,5 @@ from .base import *
 DEBUG = True
 
 ALLOWED_HOSTS = [*ALLOWED_HOSTS, "0.0.0.0"]
+
+QUERY_STATS_HEADERS = True
@@ -14,11 +14,40 @@ class DatabaseSettings(BaseSettings):
     postgres_host: str = Field("localhost", alias="POSTGRES_HOST")
     postgres_port: int = Field(5432, alias="POSTGRES_PORT")
 
+    # psycopg 3 connection pool (OPTIONS["pool"]), one per process;
+    # off = a persistent connection per thread, kept conn_max_age seconds
+    pool: bool = Field(True, alias="DB_POOL")
+    pool_min_size: int = Field(2, alias="DB_POOL_MIN_SIZE")
+    pool_max_size: int = Field(10, alias="DB_POOL_MAX_SIZE")
+    # seconds a request waits for a free connection before failing
+    pool_timeout: float = Field(10.0, alias="DB_POOL_TIMEOUT")
+    # idle connections above min_size are closed after this many seconds
+    pool_max_idle: float = Field(300.0, alias="DB_POOL_MAX_IDLE")
+    # connections are replaced after this many seconds
+    pool_max_lifetime: float = Field(1800.0, alias="DB_POOL_MAX_LIFETIME")
+    conn_max_age: int = Field(60, alias="DB_CONN_MAX_AGE")
+    # check a connection before handing it out (pool or persistent)
+    health_checks: bool = Field(True, alias="DB_HEALTH_CHECKS")
+
+    # read replicas, "host[:port],...", same database and credentials as
+    # the primary; read-only views read from them (core.db_routers)
+    replica_hosts: str = Field("", alias="DB_REPLICA_HOSTS")
+
     model_config = SettingsConfigDict(
         env_file=".env",
         extra="ignore",
     )
 
+    @property
+    def replicas(self) -> list[tuple[str, int]]:
+        """(host, port) of every replica in DB_REPLICA_HOSTS."""
+        replicas = []
+        for item in self.replica_hosts.split(","):
+            host, _, port = item.strip().partition(":")
+            if host:
+                replicas.append((host, int(port or self.postgres_port)))
+        return replicas
+
 
 class Settings(BaseSettings):
     debug: bool = Field(False, alias="DEBUG")
@@ -34,6 +63,24 @@ class Settings(BaseSettings):
         "core.settings.dev", alias="DJANGO_SETTINGS_MODULE"
     )
 
+    # or | values | exists, see common.utils.access.filters
+    access_scope_strategy: str = Field("values", alias="ACCESS_SCOPE_STRATEGY")
+
+    # locmem | db | redis, the default cache (CACHES in core.settings.base)
+    cache_backend: str = Field("locmem", alias="CACHE_BACKEND")
+    # redis URL, or the table of the db backend
+    cache_location: str = Field("django_cache", alias="CACHE_LOCATION")
+
+    # local | postgres, see issues.services.events
+    issue_events_backend: str = Field("postgres", alias="ISSUE_EVENTS_BACKEND")
+
+    # share of requests instrumented by common.middleware.QueryStatsMiddleware
+    query_stats_sample_rate: float = Field(
+        0.01, alias="QUERY_STATS_SAMPLE_RATE"
+    )
+    # log every SQL statement (django.db.backends at DEBUG, needs DEBUG)
+    sql_echo: bool = Field(False, alias="SQL_ECHO")
+
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE),
         extra="ignore",
@@ -32,6 +32,7 @@ urlpatterns: list[URLPattern] = [
     path("hotels/", include("hotels.urls")),
     path("issues/", include("issues.urls")),
     path("notifications/", include("notifications.urls")),
+    path("g/", include("guests.urls")),
     path("health_check/", health_check, name="health_check"),
     # path(
     #     "api/auth/token/",
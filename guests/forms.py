@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from django import forms
+
+from common.bootstrap_mixin import BootstrapFormMixin
+from issues.models import IssueCategory
+
+
+class RoomNumberForm(BootstrapFormMixin, forms.Form):
+    room_number = forms.CharField(label="Room number", max_length=32)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._init_bootstrap()
+
+
+class GuestIssueForm(BootstrapFormMixin, forms.Form):
+    category = forms.ModelChoiceField(
+        label="What do you need?",
+        queryset=IssueCategory.objects.filter(is_active=True).order_by("name"),
+        empty_label=None,
+    )
+    description = forms.CharField(
+        label="Details",
+        required=False,
+        max_length=2000,
+        widget=forms.Textarea(attrs={"rows": 3}),
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._init_bootstrap()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import time
+from contextlib import nullcontext
+from datetime import timedelta
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, close_old_connections
+
+from guests.services.purge import (
+    PurgeConfig,
+    PurgeStats,
+    purge_expired_stays_batch,
+)
+
+MAX_FAILURES_IN_ROW = 5
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired GuestStay rows in small batches (SKIP LOCKED, "
+        "short lock_timeout), detaching their issues. Safe to run "
+        "alongside traffic, optionally in a loop."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=0,
+            help="Only purge stays expired at least this long ago.",
+        )
+        parser.add_argument("--lock-timeout-ms", type=int, default=2000)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.05,
+            help="Seconds to sleep between batches (yield to traffic).",
+        )
+        parser.add_argument(
+            "--archive-to",
+            type=Path,
+            help="Append purged rows to this JSON Lines file.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running: purge, then sleep --idle-sleep.",
+        )
+        parser.add_argument("--idle-sleep", type=float, default=300.0)
+
+    def handle(self, *args, **options) -> None:
+        config = PurgeConfig(
+            batch_size=options["batch_size"],
+            grace=timedelta(hours=options["grace_hours"]),
+            lock_timeout_ms=options["lock_timeout_ms"],
+        )
+        archive_path = options["archive_to"]
+        archive_cm = (
+            archive_path.open("a", encoding="utf-8")
+            if archive_path
+            else nullcontext()
+        )
+
+        try:
+            with archive_cm as archive:
+                while True:
+                    self._purge_pass(config, archive, options["pause"])
+                    if not options["loop"]:
+                        break
+                    time.sleep(options["idle_sleep"])
+                    close_old_connections()
+        except KeyboardInterrupt:
+            pass
+
+    def _purge_pass(self, config: PurgeConfig, archive, pause: float):
+        total = PurgeStats()
+        lock_timeouts = 0
+        failures_in_row = 0
+        started = time.monotonic()
+
+        while True:
+            try:
+                stats = purge_expired_stays_batch(config, archive=archive)
+            except OperationalError as exc:
+                # lock_timeout hit: back off and retry
+                lock_timeouts += 1
+                failures_in_row += 1
+                if failures_in_row >= MAX_FAILURES_IN_ROW:
+                    raise
+                self.stderr.write(f"batch failed: {exc}")
+                time.sleep(max(pause, 1.0))
+                continue
+            failures_in_row = 0
+
+            total += stats
+            if stats.stays:
+                elapsed = max(time.monotonic() - started, 1e-6)
+                self.stdout.write(
+                    f"batch: stays={stats.stays} "
+                    f"issues={stats.issues_detached} | "
+                    f"total={total.stays} ({total.stays / elapsed:.0f} rows/s)"
+                )
+            if stats.stays < config.batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"purged stays={total.stays} "
+                f"issues_detached={total.issues_detached} "
+                f"lock_timeouts={lock_timeouts} "
+                f"in {elapsed:.1f}s ({total.stays / elapsed:.0f} rows/s)"
+            )
+        )
+        return total
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from .services.stay_cookie import GuestStayCookieService
+from .services.stays import revalidate_stay
+
+
+class GuestStayMiddleware:
+    """
+    Resolves request.guest_stay (GuestStayRef | None) from the signed cookie.
+
+    - a valid, unexpired token is trusted without a query
+    - every GUEST_STAY_REVALIDATE_SECONDS the stay is re-read from the DB
+      (deleted/shortened stays are revoked) and the cookie is reissued
+    - tampered, expired or revoked tokens clear the cookie
+    """
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.cookies = GuestStayCookieService()
+        self.revalidate_seconds = settings.GUEST_STAY_REVALIDATE_SECONDS
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        has_cookie = settings.GUEST_STAY_COOKIE_NAME in request.COOKIES
+        ref = self.cookies.read(request) if has_cookie else None
+        reissue = False
+
+        if ref is not None and ref.expired:
+            ref = None
+        elif ref is not None and ref.needs_revalidation(
+            self.revalidate_seconds
+        ):
+            ref = revalidate_stay(ref.id)
+            reissue = ref is not None
+
+        request.guest_stay = ref  # type: ignore[attr-defined]
+        response = self.get_response(request)
+
+        # the view may have started/ended a stay and set the cookie itself
+        if settings.GUEST_STAY_COOKIE_NAME in response.cookies:
+            return response
+        if reissue and ref is not None:
+            self.cookies.set(response, ref)
+        elif has_cookie and ref is None:
+            self.cookies.clear(response)
+        return response
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.db import transaction
+from django.utils import timezone
+
+from common.utils.rate_limit import TokenBucket, check_all
+from issues.models import Issue, IssueCategory, IssueComment
+from issues.services.sla import compute_sla_due_at
+
+from .stay_cookie import GuestStayRef
+
+# another request of the same guest is creating the issue right now
+_PENDING = "pending"
+_PENDING_TIMEOUT = 30
+
+REPEAT_MESSAGE = "The guest repeated the request."
+
+
+@dataclass(frozen=True)
+class GuestIssueResult:
+    # None: a duplicate submitted while the first one was still in flight
+    issue_id: uuid.UUID | None
+    created: bool
+    commented: bool = False
+
+
+def _cache() -> BaseCache:
+    return caches[settings.GUEST_ISSUE_CACHE_ALIAS]
+
+
+def _bucket(name: str) -> TokenBucket:
+    return TokenBucket(
+        name=f"guest_issue:{name}",
+        cache_alias=settings.GUEST_ISSUE_CACHE_ALIAS,
+        **settings.GUEST_ISSUE_RATE_LIMITS[name],
+    )
+
+
+def _dedup_key(stay: GuestStayRef, category_id: uuid.UUID) -> str:
+    return f"guests:issue_dedup:{stay.id}:{category_id}"
+
+
+def create_guest_issue(
+    *,
+    stay: GuestStayRef,
+    category: IssueCategory,
+    description: str = "",
+) -> GuestIssueResult:
+    """
+    Create an issue for the guest's room, collapsing repeats.
+
+    Within GUEST_ISSUE_DEDUP_SECONDS a second request of the same stay and
+    category doesn't create an issue: the first repeat is added as a guest
+    comment, further repeats write nothing. cache.add() claims the key, so
+    even simultaneous double submits create one issue.
+
+    New issues are limited by token buckets per stay and per room
+    (RateLimitExceeded); a rejected request takes no token from either.
+
+    Dedup keys and buckets live in GUEST_ISSUE_CACHE_ALIAS. With several
+    workers it must be a shared cache (CACHE_BACKEND db or redis): a retry
+    landing on another worker would otherwise create a second issue and
+    start with full buckets.
+    """
+    if stay.room_id is None:
+        raise ValueError("Enter your room number first.")
+
+    cache = _cache()
+    key = _dedup_key(stay, category.pk)
+    if cache.add(key, _PENDING, timeout=_PENDING_TIMEOUT):
+        try:
+            issue = _create_issue(stay, category, description)
+        except BaseException:
+            cache.delete(key)
+            raise
+        cache.set(
+            key,
+            {"issue_id": issue.pk, "commented": False},
+            timeout=settings.GUEST_ISSUE_DEDUP_SECONDS,
+        )
+        return GuestIssueResult(issue_id=issue.pk, created=True)
+
+    entry = cache.get(key)
+    if entry is None:
+        # expired in between: this is a new request after all
+        return create_guest_issue(
+            stay=stay, category=category, description=description
+        )
+    if entry == _PENDING:
+        return GuestIssueResult(issue_id=None, created=False)
+    if entry["commented"]:
+        return GuestIssueResult(issue_id=entry["issue_id"], created=False)
+
+    now = timezone.now()
+    with transaction.atomic():
+        still_open = Issue.objects.filter(
+            pk=entry["issue_id"], status__in=Issue.OPEN_STATUSES
+        ).update(last_guest_message_at=now, updated_at=now)
+        if still_open:
+            IssueComment.objects.create(
+                issue_id=entry["issue_id"],
+                author_type=IssueComment.AuthorType.GUEST,
+                message=description or REPEAT_MESSAGE,
+            )
+    if not still_open:
+        # resolved or gone meanwhile: the guest needs a new issue
+        cache.delete(key)
+        return create_guest_issue(
+            stay=stay, category=category, description=description
+        )
+
+    cache.set(
+        key,
+        {"issue_id": entry["issue_id"], "commented": True},
+        timeout=settings.GUEST_ISSUE_DEDUP_SECONDS,
+    )
+    return GuestIssueResult(
+        issue_id=entry["issue_id"], created=False, commented=True
+    )
+
+
+def _create_issue(
+    stay: GuestStayRef, category: IssueCategory, description: str
+) -> Issue:
+    check_all([(_bucket("stay"), stay.id), (_bucket("room"), stay.room_id)])
+
+    now = timezone.now()
+    return Issue.objects.create(
+        hotel_id=stay.hotel_id,
+        room_id=stay.room_id,
+        guest_stay_id=stay.id,
+        category=category,
+        assigned_department_id=category.department_id,
+        title=category.name,
+        description=description or None,
+        source=Issue.Source.GUEST_WEB,
+        sla_due_at=compute_sla_due_at(
+            hotel_id=stay.hotel_id, category_id=category.pk, start=now
+        ),
+        last_guest_message_at=now,
+    )
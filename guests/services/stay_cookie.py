@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from django.conf import settings
+from django.core import signing
+from django.http import HttpRequest, HttpResponse
+
+SALT = "guests.stay"
+
+
+@dataclass(frozen=True)
+class GuestStayRef:
+    """What a guest request needs to know about its stay, from the cookie."""
+
+    id: uuid.UUID
+    hotel_id: int
+    room_id: uuid.UUID | None
+    valid_until: datetime
+    # unix time of the last DB revocation check
+    checked_at: int
+
+    @property
+    def expired(self) -> bool:
+        return self.valid_until.timestamp() <= time.time()
+
+    def needs_revalidation(self, interval: int) -> bool:
+        return time.time() - self.checked_at >= interval
+
+
+@dataclass(frozen=True)
+class GuestStayCookieConfig:
+    name: str = "guest_stay"
+    path: str = "/"
+    samesite: str = "Lax"
+    httponly: bool = True
+
+    @property
+    def secure(self) -> bool:
+        return False if settings.DEBUG else True
+
+    def as_cookie_kwargs(self) -> dict[str, Any]:
+        return {
+            "httponly": self.httponly,
+            "samesite": self.samesite,
+            "secure": self.secure,
+            "path": self.path,
+        }
+
+
+class GuestStayCookieService:
+    """
+    Signed, expiring guest stay token in a cookie.
+
+    The payload carries stay id, hotel, room and valid_until, so a valid
+    cookie is verified by HMAC alone. chk records when the stay was last
+    confirmed in the DB (revocation check).
+    """
+
+    def __init__(self, config: GuestStayCookieConfig | None = None) -> None:
+        self._cfg = config or GuestStayCookieConfig(
+            name=settings.GUEST_STAY_COOKIE_NAME
+        )
+
+    @staticmethod
+    def dumps(ref: GuestStayRef) -> str:
+        return signing.dumps(
+            {
+                "sid": ref.id.hex,
+                "hid": ref.hotel_id,
+                "rid": ref.room_id.hex if ref.room_id else None,
+                "exp": int(ref.valid_until.timestamp()),
+                "chk": ref.checked_at,
+            },
+            salt=SALT,
+        )
+
+    @staticmethod
+    def loads(token: str) -> GuestStayRef | None:
+        try:
+            data = signing.loads(token, salt=SALT)
+            return GuestStayRef(
+                id=uuid.UUID(data["sid"]),
+                hotel_id=int(data["hid"]),
+                room_id=uuid.UUID(data["rid"]) if data["rid"] else None,
+                valid_until=datetime.fromtimestamp(data["exp"], tz=UTC),
+                checked_at=int(data["chk"]),
+            )
+        except (signing.BadSignature, KeyError, TypeError, ValueError):
+            return None
+
+    def read(self, request: HttpRequest) -> GuestStayRef | None:
+        token = request.COOKIES.get(self._cfg.name)
+        if not token:
+            return None
+        return self.loads(token)
+
+    def set(self, resp: HttpResponse, ref: GuestStayRef) -> None:
+        resp.set_cookie(
+            self._cfg.name,
+            self.dumps(ref),
+            expires=ref.valid_until,
+            **self._cfg.as_cookie_kwargs(),
+        )
+
+    def clear(self, resp: HttpResponse) -> None:
+        resp.delete_cookie(self._cfg.name, path=self._cfg.path)
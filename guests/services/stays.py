@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import secrets
+import time
+import uuid
+
+from django.utils import timezone
+
+from hotels.services.directory import HotelRef, RoomRef
+from users.models import GuestStay, default_valid_until
+
+from .stay_cookie import GuestStayRef
+
+
+def stay_ref(stay: GuestStay) -> GuestStayRef:
+    return GuestStayRef(
+        id=stay.pk,
+        hotel_id=stay.hotel_id,
+        room_id=stay.room_id,
+        valid_until=stay.valid_until,
+        checked_at=int(time.time()),
+    )
+
+
+def start_guest_stay(
+    *,
+    hotel: HotelRef,
+    room: RoomRef,
+    current: GuestStayRef | None = None,
+) -> GuestStayRef:
+    """
+    Bind the browser to a hotel room for a week.
+
+    Scanning again (same or another hotel) rebinds the current stay of
+    the browser instead of creating a new one.
+    """
+    if room.hotel_id != hotel.id:
+        raise ValueError("The room does not belong to this hotel.")
+
+    valid_until = default_valid_until()
+    fields = {
+        "hotel_id": hotel.id,
+        "room_id": room.id,
+        "valid_until": valid_until,
+    }
+    if current is not None:
+        updated = GuestStay.objects.filter(pk=current.id).update(
+            updated_at=timezone.now(), **fields
+        )
+        if updated:
+            return GuestStayRef(
+                id=current.id,
+                hotel_id=hotel.id,
+                room_id=room.id,
+                valid_until=valid_until,
+                checked_at=int(time.time()),
+            )
+
+    # the browser is identified by the signed cookie; session_key only
+    # has to stay unique
+    stay = GuestStay.objects.create(
+        session_key=secrets.token_urlsafe(32), **fields
+    )
+    return stay_ref(stay)
+
+
+def revalidate_stay(stay_id: uuid.UUID) -> GuestStayRef | None:
+    """Fresh ref from the DB, or None if the stay is gone or expired."""
+    stay = (
+        GuestStay.objects.filter(pk=stay_id, valid_until__gt=timezone.now())
+        .only("id", "hotel_id", "room_id", "valid_until")
+        .first()
+    )
+    return stay_ref(stay) if stay is not None else None
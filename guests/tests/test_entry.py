@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from hotels.services.directory import hotel_directory
+from users.models import GuestStay
+
+
+@pytest.mark.django_db
+def test_directory_resolves_from_cache(
+    hotel_factory, room_factory, django_assert_num_queries
+):
+    hotel = hotel_factory()
+    room_factory(hotel, number="101A")
+    room_factory(hotel, number="102")
+
+    with django_assert_num_queries(2):
+        ref = hotel_directory.resolve_hotel(hotel.code)
+        assert hotel_directory.resolve_room(ref.id, " 101a ").number == "101A"
+
+    with django_assert_num_queries(0):
+        assert hotel_directory.resolve_hotel(hotel.code) == ref
+        assert hotel_directory.resolve_room(ref.id, "102") is not None
+        assert hotel_directory.resolve_room(ref.id, "999") is None
+
+
+@pytest.mark.django_db
+def test_directory_caches_unknown_codes(django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert hotel_directory.resolve_hotel("nope") is None
+        assert hotel_directory.resolve_hotel("nope") is None
+
+
+@pytest.mark.django_db
+def test_directory_invalidated_by_room_changes(hotel_factory, room_factory):
+    hotel = hotel_factory()
+    assert hotel_directory.resolve_room(hotel.pk, "7") is None
+
+    room = room_factory(hotel, number="7")
+    assert hotel_directory.resolve_room(hotel.pk, "7").id == room.pk
+
+    room.is_active = False
+    room.save()
+    assert hotel_directory.resolve_room(hotel.pk, "7") is None
+
+
+@pytest.mark.django_db
+def test_guest_entry_creates_stay(client: Client, hotel_factory, room_factory):
+    hotel = hotel_factory()
+    room = room_factory(hotel, number="305")
+    url = reverse("guest_entry", args=[hotel.code])
+
+    assert client.get(url).status_code == 200
+
+    resp = client.post(url, {"room_number": "305"})
+    assert resp.status_code == 302
+    assert resp.url == reverse("guest_stay")
+
+    stay = GuestStay.objects.get()
+    assert (stay.hotel_id, stay.room_id) == (hotel.pk, room.pk)
+
+    # a second scan goes straight to the stay
+    resp = client.get(url)
+    assert resp.status_code == 302
+    assert client.get(reverse("guest_stay")).status_code == 200
+
+
+@pytest.mark.django_db
+def test_guest_entry_rejects_unknown_room(client: Client, hotel_factory):
+    hotel = hotel_factory()
+
+    resp = client.post(
+        reverse("guest_entry", args=[hotel.code]), {"room_number": "1"}
+    )
+
+    assert resp.status_code == 400
+    assert not GuestStay.objects.exists()
+
+
+@pytest.mark.django_db
+def test_guest_entry_unknown_hotel_is_404(client: Client):
+    resp = client.get(reverse("guest_entry", args=["missing"]))
+    assert resp.status_code == 404
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from common.utils.rate_limit import RateLimitExceeded
+from guests.services.issues import _bucket, create_guest_issue
+from guests.services.stay_cookie import GuestStayCookieService
+from guests.services.stays import stay_ref
+from issues.models import Issue, IssueComment
+from users.models import GuestStay
+
+
+@pytest.fixture()
+def stay(hotel_factory, room_factory):
+    hotel = hotel_factory()
+    room = room_factory(hotel)
+    return stay_ref(
+        GuestStay.objects.create(hotel=hotel, room=room, session_key="s")
+    )
+
+
+@pytest.mark.django_db
+def test_repeats_become_one_issue_and_one_comment(stay, category_factory):
+    towels = category_factory(name="Towels")
+
+    results = [
+        create_guest_issue(stay=stay, category=towels, description="towels")
+        for _ in range(5)
+    ]
+
+    assert [r.created for r in results] == [True, False, False, False, False]
+    assert [r.commented for r in results] == [False, True, False, False, False]
+    issue = Issue.objects.get()
+    assert issue.guest_stay_id == stay.id
+    assert issue.room_id == stay.room_id
+    assert issue.assigned_department_id == towels.department_id
+    assert issue.source == Issue.Source.GUEST_WEB
+    assert IssueComment.objects.filter(issue=issue).count() == 1
+
+
+@pytest.mark.django_db
+def test_repeat_after_resolution_creates_new_issue(stay, category_factory):
+    towels = category_factory()
+    first = create_guest_issue(stay=stay, category=towels)
+    Issue.objects.filter(pk=first.issue_id).update(
+        status=Issue.Status.RESOLVED
+    )
+
+    second = create_guest_issue(stay=stay, category=towels)
+
+    assert second.created
+    assert second.issue_id != first.issue_id
+
+
+@pytest.mark.django_db
+def test_rejected_issue_takes_no_token_from_the_stay(
+    stay, category_factory, settings
+):
+    settings.GUEST_ISSUE_RATE_LIMITS = {
+        "stay": {"capacity": 2, "per_seconds": 600},
+        "room": {"capacity": 1, "per_seconds": 600},
+    }
+    create_guest_issue(stay=stay, category=category_factory())
+    with pytest.raises(RateLimitExceeded):
+        create_guest_issue(stay=stay, category=category_factory())
+
+    _bucket("room").reset(stay.room_id)
+    assert create_guest_issue(stay=stay, category=category_factory()).created
+
+
+@pytest.mark.django_db
+def test_guest_issue_view_rate_limits_per_stay(
+    client: Client, stay, category_factory, settings
+):
+    settings.GUEST_ISSUE_RATE_LIMITS = {
+        "stay": {"capacity": 2, "per_seconds": 600},
+        "room": {"capacity": 10, "per_seconds": 600},
+    }
+    client.cookies["guest_stay"] = GuestStayCookieService.dumps(stay)
+    url = reverse("guest_issue_create")
+
+    statuses = [
+        client.post(url, {"category": category_factory().pk}).status_code
+        for _ in range(3)
+    ]
+
+    assert statuses == [302, 302, 429]
+    assert Issue.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_guest_issue_view_requires_stay(client: Client):
+    resp = client.get(reverse("guest_issue_create"))
+    assert resp.status_code == 403
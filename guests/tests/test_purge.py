@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from guests.services.purge import PurgeConfig, purge_expired_stays_batch
+from users.models import GuestStay
+
+
+@pytest.fixture()
+def make_stay(hotel_factory):
+    hotel = hotel_factory()
+
+    def _make(*, expired: bool) -> GuestStay:
+        delta = timedelta(days=-1 if expired else 1)
+        return GuestStay.objects.create(
+            hotel=hotel,
+            session_key=f"s-{GuestStay.objects.count()}",
+            valid_until=timezone.now() + delta,
+        )
+
+    return _make
+
+
+@pytest.mark.django_db
+def test_purge_batch_deletes_expired_and_detaches_issues(
+    make_stay, issue_factory
+):
+    expired = [make_stay(expired=True) for _ in range(3)]
+    alive = make_stay(expired=False)
+    issue = issue_factory(expired[0].hotel, guest_stay=expired[0])
+    archive = io.StringIO()
+
+    stats = purge_expired_stays_batch(
+        PurgeConfig(batch_size=2), archive=archive
+    )
+
+    assert stats.stays == 2
+    assert stats.issues_detached == 1
+    issue.refresh_from_db()
+    assert issue.guest_stay_id is None
+    archived = [json.loads(line) for line in archive.getvalue().splitlines()]
+    assert {row["id"] for row in archived} == {str(s.pk) for s in expired[:2]}
+
+    stats = purge_expired_stays_batch(PurgeConfig(batch_size=2))
+    assert stats.stays == 1
+    assert list(GuestStay.objects.all()) == [alive]
+
+
+@pytest.mark.django_db
+def test_purge_respects_grace(make_stay):
+    make_stay(expired=True)
+
+    stats = purge_expired_stays_batch(PurgeConfig(grace=timedelta(days=2)))
+
+    assert stats.stays == 0
+    assert GuestStay.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_purge_command_archives_to_file(make_stay, tmp_path):
+    for _ in range(5):
+        make_stay(expired=True)
+    archive = tmp_path / "stays.jsonl"
+    out = io.StringIO()
+
+    call_command(
+        "purge_guest_stays",
+        "--batch-size=2",
+        "--pause=0",
+        f"--archive-to={archive}",
+        stdout=out,
+    )
+
+    assert not GuestStay.objects.exists()
+    assert len(archive.read_text().splitlines()) == 5
+    assert "purged stays=5" in out.getvalue()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from guests.services.stay_cookie import GuestStayCookieService
+from guests.services.stays import stay_ref
+from users.models import GuestStay
+
+COOKIE = "guest_stay"
+
+
+@pytest.fixture()
+def stay(hotel_factory, room_factory) -> GuestStay:
+    hotel = hotel_factory()
+    room = room_factory(hotel)
+    return GuestStay.objects.create(
+        hotel=hotel, room=room, session_key="test-session"
+    )
+
+
+def _login_guest(client: Client, stay: GuestStay, **overrides) -> None:
+    ref = replace(stay_ref(stay), **overrides)
+    client.cookies[COOKIE] = GuestStayCookieService.dumps(ref)
+
+
+@pytest.mark.django_db
+def test_valid_cookie_needs_no_stay_query(
+    client: Client, stay, django_assert_num_queries
+):
+    _login_guest(client, stay)
+    # warm the directory: only the stay lookup is under test
+    client.get(reverse("guest_stay"))
+
+    # only the guest's issue list, no stay/hotel/room lookups
+    with django_assert_num_queries(1):
+        resp = client.get(reverse("guest_stay"))
+
+    assert resp.status_code == 200
+    assert resp.wsgi_request.guest_stay.id == stay.pk
+
+
+@pytest.mark.django_db
+def test_tampered_cookie_is_dropped(client: Client, stay):
+    _login_guest(client, stay)
+    client.cookies[COOKIE] = client.cookies[COOKIE].value[:-2] + "xx"
+
+    resp = client.get(reverse("guest_stay"))
+
+    assert resp.status_code == 403
+    assert resp.cookies[COOKIE].value == ""
+
+
+@pytest.mark.django_db
+def test_expired_cookie_is_dropped(client: Client, stay):
+    _login_guest(client, stay, valid_until=timezone.now() - timedelta(1))
+
+    resp = client.get(reverse("guest_stay"))
+
+    assert resp.status_code == 403
+
+
+@pytest.mark.django_db
+def test_revoked_stay_is_detected_on_revalidation(
+    client: Client, stay, settings
+):
+    settings.GUEST_STAY_REVALIDATE_SECONDS = 60
+    _login_guest(client, stay, checked_at=int(time.time()) - 61)
+    stay.delete()
+
+    resp = client.get(reverse("guest_stay"))
+
+    assert resp.status_code == 403
+    assert resp.cookies[COOKIE].value == ""
+
+
+@pytest.mark.django_db
+def test_revalidation_reissues_cookie(client: Client, stay, settings):
+    settings.GUEST_STAY_REVALIDATE_SECONDS = 60
+    _login_guest(client, stay, checked_at=int(time.time()) - 61)
+
+    resp = client.get(reverse("guest_stay"))
+
+    assert resp.status_code == 200
+    ref = GuestStayCookieService.loads(resp.cookies[COOKIE].value)
+    assert ref is not None
+    assert ref.id == stay.pk
+    assert time.time() - ref.checked_at < 5
+
+
+@pytest.mark.django_db
+def test_rescan_rebinds_current_stay(
+    client: Client, stay, hotel_factory, room_factory
+):
+    _login_guest(client, stay)
+    other_hotel = hotel_factory()
+    room_factory(other_hotel, number="9")
+
+    resp = client.post(
+        reverse("guest_entry", args=[other_hotel.code]), {"room_number": "9"}
+    )
+
+    assert resp.status_code == 302
+    stay.refresh_from_db()
+    assert stay.hotel_id == other_hotel.pk
+    assert GuestStay.objects.count() == 1
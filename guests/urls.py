@@ -0,0 +1,13 @@
+from django.urls import URLPattern, path
+
+from .views import GuestEntryView, GuestIssueCreateView, GuestStayView
+
+urlpatterns: list[URLPattern] = [
+    path("stay/", GuestStayView.as_view(), name="guest_stay"),
+    path(
+        "stay/issues/new/",
+        GuestIssueCreateView.as_view(),
+        name="guest_issue_create",
+    ),
+    path("<str:hotel_code>/", GuestEntryView.as_view(), name="guest_entry"),
+]
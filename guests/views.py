@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from django.contrib import messages
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import redirect, render
+from django.views import View
+
+from common.utils.rate_limit import RateLimitExceeded
+from hotels.services.directory import hotel_directory
+from issues.models import Issue
+
+from .forms import GuestIssueForm, RoomNumberForm
+from .services.issues import create_guest_issue
+from .services.stay_cookie import GuestStayCookieService
+from .services.stays import start_guest_stay
+
+
+class GuestEntryView(View):
+    """
+    QR entry point: /g/<hotel code>/.
+
+    Hotel and room are resolved from the in-process directory cache and
+    the stay from the signed cookie, so a scan costs no query until the
+    stay is written.
+    """
+
+    template_name = "guests/entry.html"
+    cookie_service = GuestStayCookieService()
+
+    def get(self, request: HttpRequest, hotel_code: str) -> HttpResponse:
+        hotel = hotel_directory.resolve_hotel(hotel_code)
+        if hotel is None:
+            raise Http404("Unknown hotel")
+
+        stay = request.guest_stay
+        if stay is not None and stay.hotel_id == hotel.id:
+            return redirect("guest_stay")
+
+        return render(
+            request,
+            self.template_name,
+            {"hotel": hotel, "form": RoomNumberForm()},
+        )
+
+    def post(self, request: HttpRequest, hotel_code: str) -> HttpResponse:
+        hotel = hotel_directory.resolve_hotel(hotel_code)
+        if hotel is None:
+            raise Http404("Unknown hotel")
+
+        form = RoomNumberForm(request.POST)
+        room = None
+        if form.is_valid():
+            room = hotel_directory.resolve_room(
+                hotel.id, form.cleaned_data["room_number"]
+            )
+            if room is None:
+                form.add_error("room_number", "Room not found")
+        if room is None:
+            return render(
+                request,
+                self.template_name,
+                {"hotel": hotel, "form": form},
+                status=400,
+            )
+
+        stay = start_guest_stay(
+            hotel=hotel, room=room, current=request.guest_stay
+        )
+        resp = redirect("guest_stay")
+        self.cookie_service.set(resp, stay)
+        return resp
+
+
+class GuestStayView(View):
+    template_name = "guests/stay.html"
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        stay = request.guest_stay
+        hotel = hotel_directory.hotel(stay.hotel_id) if stay else None
+        if hotel is None:
+            return render(request, "guests/no_stay.html", status=403)
+
+        room = (
+            hotel_directory.room(stay.hotel_id, stay.room_id)
+            if stay.room_id
+            else None
+        )
+        issues = Issue.objects.filter(guest_stay_id=stay.id).order_by(
+            "-created_at"
+        )[:20]
+        return render(
+            request,
+            self.template_name,
+            {"stay": stay, "hotel": hotel, "room": room, "issues": issues},
+        )
+
+
+class GuestIssueCreateView(View):
+    template_name = "guests/issue_create.html"
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        if request.guest_stay is None:
+            return render(request, "guests/no_stay.html", status=403)
+        return render(request, self.template_name, {"form": GuestIssueForm()})
+
+    def post(self, request: HttpRequest) -> HttpResponse:
+        stay = request.guest_stay
+        if stay is None:
+            return render(request, "guests/no_stay.html", status=403)
+
+        form = GuestIssueForm(request.POST)
+        if not form.is_valid():
+            return render(
+                request, self.template_name, {"form": form}, status=400
+            )
+
+        try:
+            result = create_guest_issue(
+                stay=stay,
+                category=form.cleaned_data["category"],
+                description=form.cleaned_data["description"],
+            )
+        except RateLimitExceeded as exc:
+            form.add_error(
+                None, "Too many requests. Please try again a bit later."
+            )
+            resp = render(
+                request, self.template_name, {"form": form}, status=429
+            )
+            resp["Retry-After"] = str(int(exc.retry_after) + 1)
+            return resp
+        except ValueError as exc:
+            form.add_error(None, str(exc))
+            return render(
+                request, self.template_name, {"form": form}, status=400
+            )
+
+        if result.created:
+            messages.success(request, "Your request has been sent.")
+        else:
+            messages.info(request, "We already have your request.")
+        return redirect("guest_stay")
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-18 12:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hotels", "0005_role_visibility"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="hotel",
+            name="sla_calendar",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
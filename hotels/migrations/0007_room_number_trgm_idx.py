@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-18 14:28
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hotels", "0006_hotel_sla_calendar"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="room",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("number"),
+                    name="gin_trgm_ops",
+                ),
+                name="room_number_trgm_idx",
+            ),
+        ),
+    ]
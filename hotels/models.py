@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from common.common_base_model import BaseModel
 from common.utils.formater import formater_str_models
@@ -22,6 +24,10 @@ class Hotel(BaseModel):
     timezone = models.CharField(max_length=64, default="Africa/Cairo")
     address = models.CharField(max_length=512, blank=True, null=True)
     slug = models.SlugField(max_length=255, unique=True)
+    # SLA clock calendar, see issues.services.sla.HotelCalendar:
+    # {"business_hours": {"0": [["08:00", "20:00"]], ...},
+    #  "quiet_hours": [["23:00", "07:00"]]}
+    sla_calendar = models.JSONField(blank=True, null=True)
 
     def __str__(self) -> str:
         return formater_str_models(self.name, self.code)
@@ -115,6 +121,12 @@ class Room(BaseModel):
         ]
         indexes = [
             models.Index(fields=["hotel", "number"]),
+            # number__icontains (UPPER(number) LIKE ...) in
+            # issues.services.search
+            GinIndex(
+                OpClass(Upper("number"), name="gin_trgm_ops"),
+                name="room_number_trgm_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from common.utils.lru import LRUCache
+from hotels.models import Hotel, Room
+
+_UNKNOWN = object()
+
+
+@dataclass(frozen=True)
+class HotelRef:
+    id: int
+    code: str
+    name: str
+    timezone: str
+
+
+@dataclass(frozen=True)
+class RoomRef:
+    id: uuid.UUID
+    hotel_id: int
+    number: str
+
+
+def normalize_room_number(number: str) -> str:
+    return number.strip().upper()
+
+
+class HotelDirectory:
+    """
+    In-process cache of static hotel data for the guest entry flow:
+    hotel code -> HotelRef and (hotel, room number) -> RoomRef.
+
+    Rooms are loaded per hotel in one query, so the first scan warms the
+    whole hotel and later scans never touch the DB. Unknown codes are
+    cached too (shorter TTL) so scanning a bad QR can't hammer Postgres.
+    Model signals invalidate entries in this process, the TTL bounds
+    staleness in others.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        negative_ttl: float | None = None,
+    ) -> None:
+        self.hotels = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.hotels_by_id = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.unknown_codes = LRUCache(maxsize=maxsize, ttl=negative_ttl)
+        # hotel_id -> {normalized number: RoomRef}
+        self.rooms = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def resolve_hotel(self, code: str) -> HotelRef | None:
+        code = code.strip()
+        hotel = self.hotels.get(code, _UNKNOWN)
+        if hotel is not _UNKNOWN:
+            return hotel
+        if self.unknown_codes.get(code) is not None:
+            return None
+
+        row = (
+            Hotel.objects.filter(code=code)
+            .values("id", "code", "name", "timezone")
+            .first()
+        )
+        if row is None:
+            self.unknown_codes.set(code, True)
+            return None
+        hotel = HotelRef(**row)
+        self.hotels.set(code, hotel)
+        self.hotels_by_id.set(hotel.id, hotel)
+        return hotel
+
+    def hotel(self, hotel_id: int) -> HotelRef | None:
+        hotel = self.hotels_by_id.get(hotel_id)
+        if hotel is None:
+            row = (
+                Hotel.objects.filter(pk=hotel_id)
+                .values("id", "code", "name", "timezone")
+                .first()
+            )
+            if row is None:
+                return None
+            hotel = HotelRef(**row)
+            self.hotels_by_id.set(hotel_id, hotel)
+        return hotel
+
+    def hotel_rooms(self, hotel_id: int) -> dict[str, RoomRef]:
+        rooms = self.rooms.get(hotel_id)
+        if rooms is None:
+            rooms = {
+                normalize_room_number(number): RoomRef(
+                    id=room_id, hotel_id=hotel_id, number=number
+                )
+                for room_id, number in Room.objects.filter(
+                    hotel_id=hotel_id, is_active=True
+                ).values_list("id", "number")
+            }
+            self.rooms.set(hotel_id, rooms)
+        return rooms
+
+    def resolve_room(self, hotel_id: int, number: str) -> RoomRef | None:
+        return self.hotel_rooms(hotel_id).get(normalize_room_number(number))
+
+    def room(self, hotel_id: int, room_id: uuid.UUID) -> RoomRef | None:
+        for room in self.hotel_rooms(hotel_id).values():
+            if room.id == room_id:
+                return room
+        return None
+
+    def warm(self) -> int:
+        """Preload every hotel with its rooms; returns the hotel count."""
+        hotels = [
+            HotelRef(**row)
+            for row in Hotel.objects.values("id", "code", "name", "timezone")
+        ]
+        rooms: dict[int, dict[str, RoomRef]] = {h.id: {} for h in hotels}
+        for room_id, hotel_id, number in Room.objects.filter(
+            is_active=True
+        ).values_list("id", "hotel_id", "number"):
+            rooms[hotel_id][normalize_room_number(number)] = RoomRef(
+                id=room_id, hotel_id=hotel_id, number=number
+            )
+        for hotel in hotels:
+            self.hotels.set(hotel.code, hotel)
+            self.hotels_by_id.set(hotel.id, hotel)
+            self.rooms.set(hotel.id, rooms[hotel.id])
+        return len(hotels)
+
+    def forget_hotel(self, hotel_id: int) -> None:
+        # the code may have changed: drop by code is not enough
+        self.hotels.clear()
+        self.unknown_codes.clear()
+        self.hotels_by_id.pop(hotel_id)
+        self.rooms.pop(hotel_id)
+
+    def forget_rooms(self, hotel_id: int) -> None:
+        self.rooms.pop(hotel_id)
+
+    def clear(self) -> None:
+        self.hotels.clear()
+        self.hotels_by_id.clear()
+        self.unknown_codes.clear()
+        self.rooms.clear()
+
+
+hotel_directory = HotelDirectory(
+    maxsize=settings.HOTEL_DIRECTORY_MAX_HOTELS,
+    ttl=settings.HOTEL_DIRECTORY_TTL_SECONDS,
+    negative_ttl=settings.HOTEL_DIRECTORY_NEGATIVE_TTL_SECONDS,
+)
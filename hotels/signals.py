@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.utils.access.scope_cache import (
+    invalidate_all_scopes,
+    invalidate_user_scope,
+)
+from hotels.models import Hotel, HotelDepartment, HotelUserRole, Role, Room
+from hotels.services.directory import hotel_directory
+
+
+@receiver(post_save, sender=HotelUserRole)
+@receiver(post_delete, sender=HotelUserRole)
+def _invalidate_scope_on_user_role_change(
+    sender, instance: HotelUserRole, **kwargs
+) -> None:
+    invalidate_user_scope(instance.user_id)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_delete, sender=HotelDepartment)
+def _invalidate_all_scopes(sender, **kwargs) -> None:
+    # Role.visibility affects every holder of the role; deleting a
+    # department nulls HotelUserRole.department without emitting signals.
+    invalidate_all_scopes()
+
+
+@receiver(post_save, sender=Hotel)
+@receiver(post_delete, sender=Hotel)
+def _forget_hotel_directory(sender, instance: Hotel, **kwargs) -> None:
+    hotel_directory.forget_hotel(instance.pk)
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def _forget_room_directory(sender, instance: Room, **kwargs) -> None:
+    hotel_directory.forget_rooms(instance.hotel_id)
@@ -1,8 +1,10 @@
 from django.shortcuts import render
 
+from core.db_routers import read_replica
 from hotels.models import Hotel
 
 
+@read_replica
 def list_hotels(request):
     hotels = Hotel.objects.all()
 
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Q
 
 from issues.models import (
     Issue,
@@ -7,6 +8,24 @@ from issues.models import (
     IssueComment,
     IssueStatusHistory,
 )
+from issues.services.search import full_text_filter, parse_search_query
+
+
+class FullTextSearchMixin:
+    """
+    Admin search through the search_vector GIN index instead of
+    icontains over text columns (a sequential scan).
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        match = self.get_full_text_filter(search_term)
+        if match is None:
+            return queryset, False
+        return queryset.filter(match), False
+
+    def get_full_text_filter(self, search_term):
+        query = parse_search_query(search_term)
+        return None if query is None else Q(search_vector=query)
 
 
 @admin.register(IssueCategory)
@@ -18,7 +37,7 @@ class IssueCategoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(Issue)
-class IssueAdmin(admin.ModelAdmin):
+class IssueAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = [
         "title",
         "hotel",
@@ -29,12 +48,17 @@ class IssueAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["hotel", "status", "priority", "source"]
+    # matched through search_vector, see FullTextSearchMixin
     search_fields = ["title", "description"]
     ordering = ["-created_at"]
 
+    def get_full_text_filter(self, search_term):
+        # issue text, comments and room numbers, like the staff search
+        return full_text_filter(search_term)
+
 
 @admin.register(IssueComment)
-class IssueCommentAdmin(admin.ModelAdmin):
+class IssueCommentAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = [
         "issue",
         "author_type",
@@ -43,6 +67,7 @@ class IssueCommentAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["author_type", "is_internal"]
+    # matched through search_vector, see FullTextSearchMixin
     search_fields = ["message"]
 
 
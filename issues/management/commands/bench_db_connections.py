@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from issues.models import Issue
+
+MODES = ("pool", "persistent", "per-request")
+
+
+@dataclass
+class _Counters:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    connects: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _percentile(latencies: list[float], pct: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * pct))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Connection lifecycle benchmark: worker threads serve simulated "
+        "requests through the psycopg pool, persistent per-thread "
+        "connections (CONN_MAX_AGE) or a connection per request; reports "
+        "latency percentiles and how many connections were opened."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--mode", choices=[*MODES, "all"], default="all")
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--seconds", type=float, default=10.0)
+        parser.add_argument(
+            "--thread-requests",
+            type=int,
+            default=200,
+            help=(
+                "Requests a worker thread serves before it is replaced "
+                "(thread churn of threaded servers); 0 = never."
+            ),
+        )
+        parser.add_argument(
+            "--queries", type=int, default=3, help="Queries per request."
+        )
+        parser.add_argument(
+            "--pool-max-size",
+            type=int,
+            default=settings.DATABASE_POOL["max_size"],
+        )
+        parser.add_argument("--conn-max-age", type=int, default=60)
+
+    def handle(self, *args, **options) -> None:
+        modes = MODES if options["mode"] == "all" else [options["mode"]]
+        for mode in modes:
+            alias = self._configure(mode, options)
+            try:
+                self._run(mode, alias, options)
+            finally:
+                connections[alias].close()
+                if mode == "pool":
+                    connections[alias].close_pool()
+
+    @staticmethod
+    def _configure(mode: str, options) -> str:
+        """A separate alias per mode, a copy of default with its lifecycle."""
+        alias = f"bench_{mode.replace('-', '_')}"
+        config = copy.deepcopy(connections["default"].settings_dict)
+        config["OPTIONS"].pop("pool", None)
+        if mode == "pool":
+            config["CONN_MAX_AGE"] = 0
+            config["OPTIONS"]["pool"] = {
+                **settings.DATABASE_POOL,
+                "min_size": min(
+                    settings.DATABASE_POOL["min_size"],
+                    options["pool_max_size"],
+                ),
+                "max_size": options["pool_max_size"],
+            }
+        elif mode == "persistent":
+            config["CONN_MAX_AGE"] = options["conn_max_age"]
+        else:
+            config["CONN_MAX_AGE"] = 0
+        connections.settings[alias] = config
+        return alias
+
+    def _run(self, mode: str, alias: str, options) -> None:
+        counters = _Counters()
+        queries = options["queries"]
+        thread_requests = options["thread_requests"]
+        deadline = time.monotonic() + options["seconds"]
+
+        def on_connect(sender, connection, **kwargs) -> None:
+            if connection.alias == alias:
+                with counters.lock:
+                    counters.connects += 1
+
+        def serve() -> None:
+            # what request_started / request_finished do around a view
+            connection = connections[alias]
+            started = time.perf_counter()
+            connection.close_if_unusable_or_obsolete()
+            try:
+                for _ in range(queries):
+                    list(
+                        Issue.objects.using(alias)
+                        .order_by("-created_at")
+                        .values_list("id", "status")[:25]
+                    )
+            except Exception:
+                with counters.lock:
+                    counters.errors += 1
+                raise
+            finally:
+                connection.close_if_unusable_or_obsolete()
+            elapsed = time.perf_counter() - started
+            with counters.lock:
+                counters.latencies.append(elapsed)
+
+        def worker() -> None:
+            try:
+                served = 0
+                while time.monotonic() < deadline and (
+                    not thread_requests or served < thread_requests
+                ):
+                    try:
+                        serve()
+                    except Exception:
+                        pass  # counted in serve(), keep going
+                    served += 1
+            finally:
+                connections[alias].close()
+
+        def slot() -> None:
+            # a server thread slot: replaced workers start fresh
+            while time.monotonic() < deadline:
+                thread = threading.Thread(target=worker)
+                thread.start()
+                thread.join()
+
+        connection_created.connect(on_connect)
+        try:
+            slots = [
+                threading.Thread(target=slot)
+                for _ in range(options["threads"])
+            ]
+            started = time.monotonic()
+            for thread in slots:
+                thread.start()
+            for thread in slots:
+                thread.join()
+            elapsed = time.monotonic() - started
+        finally:
+            connection_created.disconnect(on_connect)
+
+        latencies = sorted(counters.latencies) or [0.0]
+        opened = counters.connects
+        wait = ""
+        if mode == "pool":
+            stats = connections[alias].pool.get_stats()
+            # every borrow "connects" the wrapper; count real connections
+            opened = stats.get("connections_num", 0)
+            wait = (
+                f" queued={stats.get('requests_queued', 0)} "
+                f"wait={stats.get('requests_wait_ms', 0)}ms"
+            )
+        self.stdout.write(
+            f"{mode:>11}: threads={options['threads']} "
+            f"requests={len(counters.latencies)} "
+            f"({len(counters.latencies) / elapsed:.0f}/s) "
+            f"errors={counters.errors} "
+            f"p50={_percentile(latencies, 0.5) * 1000:.1f}ms "
+            f"p95={_percentile(latencies, 0.95) * 1000:.1f}ms "
+            f"p99={_percentile(latencies, 0.99) * 1000:.1f}ms "
+            f"max={latencies[-1] * 1000:.1f}ms "
+            f"connections={opened}{wait}"
+        )
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from hotels.models import (
+    Hotel,
+    HotelDepartment,
+    HotelUserRole,
+    Role,
+    Room,
+    Visibility,
+)
+from issues.models import Issue, IssueCategory, IssueStatusHistory
+from issues.services.status import (
+    IssueStatusConflict,
+    change_issue_status,
+    status_update_fields,
+)
+from issues.services.transitions import InvalidTransition
+
+User = get_user_model()
+
+# statuses the writers cycle through, so every write is a real transition
+# the transition table allows (NEW enters the loop via IN_PROGRESS)
+CYCLE: list[str] = [
+    Issue.Status.IN_PROGRESS,  # type: ignore[list-item]
+    Issue.Status.WAITING_GUEST,  # type: ignore[list-item]
+]
+
+
+@dataclass
+class _Counters:
+    ok: int = 0
+    conflicts: int = 0
+    latencies: list[float] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _change_with_row_lock(*, issue_id, new_status: str, user) -> None:
+    """Pessimistic baseline: SELECT ... FOR UPDATE, then write."""
+    with transaction.atomic():
+        issue = Issue.objects.select_for_update().get(pk=issue_id)
+        Issue.objects.filter(pk=issue_id).update(
+            **status_update_fields(new_status, user, timezone.now())
+        )
+        IssueStatusHistory.objects.create(
+            issue_id=issue_id,
+            old_status=issue.status,
+            new_status=new_status,
+            changed_by_type=IssueStatusHistory.ChangedByType.STAFF,
+            changed_by_user=user,
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Contention benchmark for issue status changes: parallel writers "
+        "hammer a small set of issues; reports throughput and conflicts."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--writers", type=int, default=8)
+        parser.add_argument(
+            "--issues",
+            type=int,
+            default=4,
+            help="Size of the hot set; fewer issues = more contention.",
+        )
+        parser.add_argument("--seconds", type=float, default=10.0)
+        parser.add_argument(
+            "--mode",
+            choices=["conditional", "row-lock", "both"],
+            default="both",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the generated fixture rows.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        hotel, users, issue_ids = self._create_fixture(
+            writers=options["writers"], issues=options["issues"]
+        )
+        modes = (
+            ["conditional", "row-lock"]
+            if options["mode"] == "both"
+            else [options["mode"]]
+        )
+        try:
+            for mode in modes:
+                self._run(
+                    mode=mode,
+                    users=users,
+                    issue_ids=issue_ids,
+                    seconds=options["seconds"],
+                )
+        finally:
+            if not options["keep"]:
+                self._drop_fixture(hotel, users)
+
+    def _run(self, *, mode, users, issue_ids, seconds) -> None:
+        counters = _Counters()
+        history_before = IssueStatusHistory.objects.filter(
+            issue_id__in=issue_ids
+        ).count()
+        deadline = time.monotonic() + seconds
+
+        def writer(user, seed: int) -> None:
+            rng = random.Random(seed)
+            try:
+                while time.monotonic() < deadline:
+                    issue_id = rng.choice(issue_ids)
+                    started = time.perf_counter()
+                    try:
+                        if mode == "conditional":
+                            issue = Issue.objects.only(
+                                "id", "status", "assigned_user_id"
+                            ).get(pk=issue_id)
+                            change_issue_status(
+                                issue=issue,
+                                new_status=self._next_status(issue.status),
+                                user=user,
+                            )
+                        else:
+                            status = (
+                                Issue.objects.filter(pk=issue_id)
+                                .values_list("status", flat=True)
+                                .get()
+                            )
+                            _change_with_row_lock(
+                                issue_id=issue_id,
+                                new_status=self._next_status(status),
+                                user=user,
+                            )
+                    except (IssueStatusConflict, InvalidTransition):
+                        # lost the race: the status read is stale
+                        with counters.lock:
+                            counters.conflicts += 1
+                        continue
+                    elapsed = time.perf_counter() - started
+                    with counters.lock:
+                        counters.ok += 1
+                        counters.latencies.append(elapsed)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=writer, args=(user, n))
+            for n, user in enumerate(users)
+        ]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        history_rows = (
+            IssueStatusHistory.objects.filter(issue_id__in=issue_ids).count()
+            - history_before
+        )
+        latencies = sorted(counters.latencies) or [0.0]
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(
+            f"{mode:>11}: writers={len(users)} issues={len(issue_ids)} "
+            f"ok={counters.ok} ({counters.ok / elapsed:.0f}/s) "
+            f"conflicts={counters.conflicts} "
+            f"p50={latencies[len(latencies) // 2] * 1000:.1f}ms "
+            f"p99={p99 * 1000:.1f}ms "
+            f"history_rows={history_rows}"
+        )
+        if history_rows != counters.ok:
+            self.stderr.write(
+                self.style.ERROR(
+                    "history rows don't match successful writes: "
+                    "lost or duplicated updates"
+                )
+            )
+
+    @staticmethod
+    def _next_status(status: str) -> str:
+        if status not in CYCLE:
+            return CYCLE[0]
+        return CYCLE[(CYCLE.index(status) + 1) % len(CYCLE)]
+
+    @staticmethod
+    def _create_fixture(*, writers: int, issues: int):
+        tag = uuid.uuid4().hex[:8]
+        hotel = Hotel.objects.create(
+            name=f"bench {tag}", code=f"bench-{tag}", slug=f"bench-{tag}"
+        )
+        department = HotelDepartment.objects.create(
+            name=f"bench {tag}", code="BENCH"
+        )
+        category = IssueCategory.objects.create(
+            name=f"bench {tag}", department=department
+        )
+        room = Room.objects.create(hotel=hotel, number="1")
+        # writers go through the transition table like hotel managers
+        role = Role.objects.create(
+            code=f"bench-{tag}",
+            name=f"bench {tag}",
+            visibility=Visibility.HOTEL,
+        )
+        users = [
+            User.objects.create(
+                username=f"bench-{tag}-{n}", email=f"bench-{tag}-{n}@bench"
+            )
+            for n in range(writers)
+        ]
+        HotelUserRole.objects.bulk_create(
+            HotelUserRole(user=user, hotel=hotel, role=role) for user in users
+        )
+        issue_ids = [
+            Issue.objects.create(
+                hotel=hotel,
+                room=room,
+                category=category,
+                assigned_department=department,
+                title=f"bench {n}",
+                sla_due_at=timezone.now(),
+            ).pk
+            for n in range(issues)
+        ]
+        return hotel, users, issue_ids
+
+    @staticmethod
+    def _drop_fixture(hotel: Hotel, users) -> None:
+        issues = Issue.objects.filter(hotel=hotel)
+        categories = set(issues.values_list("category_id", flat=True))
+        departments = set(
+            issues.values_list("assigned_department_id", flat=True)
+        )
+        roles = set(
+            HotelUserRole.objects.filter(hotel=hotel).values_list(
+                "role_id", flat=True
+            )
+        )
+        issues.delete()  # cascades to status history
+        hotel.delete()  # cascades to rooms
+        IssueCategory.objects.filter(id__in=categories).delete()
+        HotelDepartment.objects.filter(id__in=departments).delete()
+        User.objects.filter(pk__in=[u.pk for u in users]).delete()
+        Role.objects.filter(id__in=roles).delete()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.testing.scenarios import LoadTargets, drive_load
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive staff and guest scenarios against a running server seeded "
+        "with seed_load, then report latency percentiles per endpoint."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--base-url", default="http://127.0.0.1:8000", help="Server URL."
+        )
+        parser.add_argument("--prefix", default="load")
+        parser.add_argument(
+            "--staff", type=int, default=10, help="Concurrent staff users."
+        )
+        parser.add_argument(
+            "--guests", type=int, default=40, help="Concurrent guests."
+        )
+        parser.add_argument(
+            "--duration", type=float, default=60, help="Seconds to run."
+        )
+        parser.add_argument(
+            "--think",
+            type=float,
+            default=0.5,
+            help="Mean pause between a user's requests, seconds.",
+        )
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options) -> None:
+        try:
+            targets = LoadTargets.from_db(options["prefix"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        report, seconds = drive_load(
+            options["base_url"],
+            targets,
+            staff=options["staff"],
+            guests=options["guests"],
+            duration=options["duration"],
+            think=options["think"],
+            seed=options["seed"],
+        )
+
+        self.stdout.write(
+            f"{'endpoint':<20} {'count':>7} {'errors':>6} {'429':>5} "
+            f"{'rps':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for row in report.summary(seconds):
+            self.stdout.write(
+                f"{row['name']:<20} {row['count']:>7} {row['errors']:>6} "
+                f"{row['limited']:>5} {row['rps']:>7.1f} {row['p50']:>8.1f} "
+                f"{row['p95']:>8.1f} {row['p99']:>8.1f}"
+            )
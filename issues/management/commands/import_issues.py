@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from issues.services.importer import (
+    ChunkResult,
+    ImportResolver,
+    RowError,
+    chunked,
+    detect_format,
+    import_chunk,
+    import_chunk_in_worker,
+    init_worker,
+    iter_rows,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import issues (Source.IMPORT) from a CSV or JSONL file: streamed, "
+        "resolved through in-memory dictionaries and bulk inserted in "
+        "chunks by parallel worker processes. Bad rows go to an errors file."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format", choices=["csv", "jsonl"], help="Default: by suffix."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Rows per worker task.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per INSERT statement.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes; 0 imports in this process.",
+        )
+        parser.add_argument(
+            "--errors",
+            type=Path,
+            help="Error report (CSV). Default: <path>.errors.csv",
+        )
+        parser.add_argument("--progress-every", type=int, default=50_000)
+
+    def handle(self, *args, **options) -> None:
+        path: Path = options["path"]
+        if not path.exists():
+            raise CommandError(f"No such file: {path}")
+        fmt = options["format"] or detect_format(path)
+        errors_path = options["errors"] or path.with_name(
+            path.name + ".errors.csv"
+        )
+
+        self.created = self.failed = self.processed = 0
+        self._next_progress = options["progress_every"]
+        self._progress_every = options["progress_every"]
+        self.started = time.monotonic()
+
+        with (
+            path.open(encoding="utf-8", newline="") as stream,
+            errors_path.open("w", encoding="utf-8", newline="") as err_file,
+        ):
+            self.errors = csv.writer(err_file)
+            self.errors.writerow(["line", "error", "row"])
+            chunks = chunked(iter_rows(stream, fmt), options["chunk_size"])
+            if options["workers"] > 0:
+                self._run_parallel(chunks, options)
+            else:
+                resolver = ImportResolver()
+                for chunk in chunks:
+                    self._collect(
+                        import_chunk(
+                            chunk,
+                            resolver=resolver,
+                            batch_size=options["batch_size"],
+                        )
+                    )
+
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"imported={self.created} errors={self.failed} "
+                f"in {elapsed:.1f}s ({self.processed / elapsed:.0f} rows/s)"
+            )
+        )
+        if self.failed:
+            self.stdout.write(f"error rows: {errors_path}")
+
+    def _run_parallel(self, chunks, options) -> None:
+        # forked workers must not share the parent's DB socket
+        connections.close_all()
+        workers = options["workers"]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker
+        ) as pool:
+            # bounded in-flight chunks: memory stays flat on huge inputs
+            in_flight: deque[Future[ChunkResult]] = deque()
+            for chunk in chunks:
+                in_flight.append(
+                    pool.submit(
+                        import_chunk_in_worker, chunk, options["batch_size"]
+                    )
+                )
+                if len(in_flight) >= workers * 2:
+                    self._collect(in_flight.popleft().result())
+            while in_flight:
+                self._collect(in_flight.popleft().result())
+
+    def _collect(self, result: ChunkResult) -> None:
+        self.created += result.created
+        self.failed += len(result.errors)
+        self.processed += result.created + len(result.errors)
+        for error in result.errors:
+            self._write_error(error)
+
+        if self._progress_every and self.processed >= self._next_progress:
+            self._next_progress += self._progress_every
+            elapsed = max(time.monotonic() - self.started, 1e-6)
+            self.stdout.write(
+                f"{self.processed} rows: imported={self.created} "
+                f"errors={self.failed} ({self.processed / elapsed:.0f} rows/s)"
+            )
+
+    def _write_error(self, error: RowError) -> None:
+        self.errors.writerow(
+            [
+                error.line,
+                error.error,
+                json.dumps(error.data, default=str) if error.data else "",
+            ]
+        )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from issues.services.stats import rebuild_issue_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the dashboard rollups (IssueStatsBucket) from issues "
+        "and their status history. Status changes wait until it commits."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--hotel",
+            type=int,
+            action="append",
+            dest="hotels",
+            help="Only this hotel id (repeatable).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **options) -> None:
+        started = time.monotonic()
+        processed = rebuild_issue_stats(
+            hotel_ids=options["hotels"], chunk_size=options["chunk_size"]
+        )
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            f"rebuilt stats from {processed} issues in {elapsed:.1f}s"
+        )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from common.testing.load import SEED_PASSWORD, ChainSeeder, SeedConfig
+from issues.services.stats import rebuild_issue_stats
+
+ANALYZE_TABLES = (
+    "hotels_room",
+    "users_gueststay",
+    "issues_issue",
+    "issues_issuecomment",
+    "issues_issuestatushistory",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic hotel chain for load tests: hotels, rooms, "
+        "staff with roles, guest stays, issues with comments and history. "
+        "Deterministic for a --seed; bulk tables are loaded with COPY."
+    )
+
+    def add_arguments(self, parser) -> None:
+        defaults = SeedConfig()
+        parser.add_argument("--hotels", type=int, default=defaults.hotels)
+        parser.add_argument(
+            "--rooms",
+            type=int,
+            nargs=2,
+            metavar=("MIN", "MAX"),
+            default=(defaults.rooms_min, defaults.rooms_max),
+            help="Rooms per hotel, drawn uniformly.",
+        )
+        parser.add_argument(
+            "--staff-per-100-rooms",
+            type=int,
+            default=defaults.staff_per_100_rooms,
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=defaults.days,
+            help="Days of history, ending now.",
+        )
+        parser.add_argument(
+            "--issues-per-room-day",
+            type=float,
+            default=defaults.issues_per_room_day,
+            help="Issues per occupied room per day.",
+        )
+        parser.add_argument(
+            "--occupancy", type=float, default=defaults.occupancy
+        )
+        parser.add_argument(
+            "--comments-mean",
+            type=float,
+            default=defaults.comments_mean,
+            help="Mean comments per issue (exponential).",
+        )
+        parser.add_argument("--seed", type=int, default=defaults.seed)
+        parser.add_argument(
+            "--prefix",
+            default=defaults.prefix,
+            help="Hotel codes and usernames start with it.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=defaults.chunk_size,
+            help="Issues per COPY transaction.",
+        )
+        parser.add_argument(
+            "--skip-stats",
+            action="store_true",
+            help="Don't rebuild the dashboard rollups afterwards.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        config = SeedConfig(
+            hotels=options["hotels"],
+            rooms_min=options["rooms"][0],
+            rooms_max=options["rooms"][1],
+            staff_per_100_rooms=options["staff_per_100_rooms"],
+            days=options["days"],
+            issues_per_room_day=options["issues_per_room_day"],
+            occupancy=options["occupancy"],
+            comments_mean=options["comments_mean"],
+            seed=options["seed"],
+            prefix=options["prefix"],
+            chunk_size=options["chunk_size"],
+        )
+        started = time.monotonic()
+        try:
+            stats = ChainSeeder(config, progress=self.stdout.write).run()
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        elapsed = time.monotonic() - started
+
+        rows = stats.stays + stats.issues + stats.comments + stats.history
+        self.stdout.write(
+            f"hotels={stats.hotels} rooms={stats.rooms} staff={stats.staff} "
+            f"stays={stats.stays} issues={stats.issues} "
+            f"comments={stats.comments} history={stats.history} "
+            f"in {elapsed:.1f}s ({rows / max(elapsed, 1e-9):.0f} rows/s)"
+        )
+
+        if not options["skip_stats"]:
+            rebuild_issue_stats(hotel_ids=stats.hotel_ids)
+            self.stdout.write("dashboard rollups rebuilt")
+        with connection.cursor() as cursor:
+            for table in ANALYZE_TABLES:
+                cursor.execute(f"ANALYZE {table}")
+        self.stdout.write(
+            f"staff log in as {config.prefix}-admin or "
+            f"{config.prefix}-<n>-<k> with password {SEED_PASSWORD!r}"
+        )
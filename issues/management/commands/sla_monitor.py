@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from issues.services.sla_monitor import SlaDueQueue, SlaEscalator
+
+
+class Command(BaseCommand):
+    help = (
+        "SLA breach monitor: keeps open issues in an in-memory due queue "
+        "and emits escalation notifications when deadlines pass."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--refresh-interval",
+            type=float,
+            default=30.0,
+            help="Seconds between incremental refreshes from updated_at.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Escalate everything already due and exit.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        refresh_interval = options["refresh_interval"]
+        queue = SlaDueQueue()
+        escalator = SlaEscalator(batch_size=options["batch_size"])
+
+        queue.load()
+        self.stdout.write(f"loaded {len(queue)} open issues")
+        next_refresh = time.monotonic() + refresh_interval
+
+        try:
+            while True:
+                breached = queue.pop_due(timezone.now())
+                if breached:
+                    escalated = escalator.escalate(breached)
+                    self.stdout.write(
+                        f"due={len(breached)} escalated={escalated} "
+                        f"tracked={len(queue)}"
+                    )
+
+                if options["once"]:
+                    break
+
+                time.sleep(self._sleep_for(queue, next_refresh))
+
+                if time.monotonic() >= next_refresh:
+                    close_old_connections()
+                    queue.refresh()
+                    next_refresh = time.monotonic() + refresh_interval
+        except KeyboardInterrupt:
+            pass
+
+    @staticmethod
+    def _sleep_for(queue: SlaDueQueue, next_refresh: float) -> float:
+        until_refresh = next_refresh - time.monotonic()
+        next_due = queue.next_due_at()
+        if next_due is None:
+            return max(until_refresh, 0.0)
+        until_due = (next_due - timezone.now()).total_seconds()
+        return max(min(until_due, until_refresh), 0.0)
@@ -0,0 +1,22 @@
+# Generated by Django 6.0 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "issues",
+            "0003_remove_issuecategory_issues_issu_hotel_i_e6f60e_idx_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                fields=["created_at", "id"],
+                name="issues_issu_created_dbc091_idx",
+            ),
+        ),
+    ]
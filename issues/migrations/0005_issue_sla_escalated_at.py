@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("issues", "0004_issue_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issue",
+            name="sla_escalated_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
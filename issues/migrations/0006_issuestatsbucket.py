@@ -0,0 +1,84 @@
+# Generated by Django 6.0 on 2026-10-18 14:24
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+import issues.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hotels", "0006_hotel_sla_calendar"),
+        ("issues", "0005_issue_sla_escalated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueStatsBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bucket", models.DateTimeField()),
+                ("created", models.PositiveIntegerField(default=0)),
+                ("open_delta", models.IntegerField(default=0)),
+                ("resolved", models.PositiveIntegerField(default=0)),
+                ("resolved_breached", models.PositiveIntegerField(default=0)),
+                (
+                    "resolve_histogram",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.PositiveIntegerField(),
+                        default=issues.models._empty_resolve_histogram,
+                        size=10,
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="issues.issuecategory",
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="hotels.hoteldepartment",
+                    ),
+                ),
+                (
+                    "hotel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="hotels.hotel",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["hotel", "bucket"],
+                        name="issues_issu_hotel_i_11c83b_idx",
+                    ),
+                    models.Index(
+                        fields=["bucket"], name="issues_issu_bucket_a2eba7_idx"
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("hotel", "department", "category", "bucket"),
+                        name="issue_stats_bucket_key",
+                    )
+                ],
+            },
+        ),
+    ]
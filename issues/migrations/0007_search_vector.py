@@ -0,0 +1,55 @@
+# Generated by Django 6.0 on 2026-10-18 14:29
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("issues", "0006_issuestatsbucket"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issue",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector(
+                        "title", config="simple", weight="A"
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description", config="simple", weight="B"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="issuecomment",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    "message", config="simple"
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="issue_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issuecomment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="issue_comment_search_idx"
+            ),
+        ),
+    ]
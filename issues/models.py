@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import uuid
 
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.urls import reverse
 
 from common.common_base_model import BaseModel
 from common.utils.formater import formater_str_models
 
+# text search configuration of the search_vector columns: no stemming,
+# titles and comments mix languages
+SEARCH_CONFIG = "simple"
+
 
 class IssueCategory(BaseModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -51,6 +58,15 @@ class Issue(BaseModel):
         CLOSED = "closed", "Closed"
         CANCELLED = "cancelled", "Cancelled"
 
+    OPEN_STATUSES = frozenset(
+        {
+            Status.NEW,
+            Status.ASSIGNED,
+            Status.IN_PROGRESS,
+            Status.WAITING_GUEST,
+        }
+    )
+
     class Priority(models.TextChoices):
         LOW = "low", "Low"
         NORMAL = "normal", "Normal"
@@ -108,6 +124,8 @@ class Issue(BaseModel):
     )
 
     sla_due_at = models.DateTimeField(db_index=True)
+    # set when the SLA breach escalation is emitted (sla_monitor)
+    sla_escalated_at = models.DateTimeField(blank=True, null=True)
     resolved_at = models.DateTimeField(blank=True, null=True)
     closed_at = models.DateTimeField(blank=True, null=True)
 
@@ -118,10 +136,21 @@ class Issue(BaseModel):
         max_length=16, choices=Source.choices, default=Source.GUEST_WEB
     )
 
+    # maintained by Postgres (issues.services.search)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="B", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         indexes = [
+            GinIndex(fields=["search_vector"], name="issue_search_idx"),
             models.Index(fields=["hotel", "status"]),
             models.Index(fields=["hotel", "created_at"]),
+            # keyset pagination for global scope (no hotel filter)
+            models.Index(fields=["created_at", "id"]),
         ]
 
     def __str__(self) -> str:
@@ -154,8 +183,17 @@ class IssueComment(BaseModel):
     message = models.TextField()
     is_internal = models.BooleanField(default=False)
 
+    search_vector = models.GeneratedField(
+        expression=SearchVector("message", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         indexes = [
+            GinIndex(
+                fields=["search_vector"], name="issue_comment_search_idx"
+            ),
             models.Index(fields=["issue", "created_at"]),
         ]
 
@@ -208,3 +246,60 @@ class IssueStatusHistory(BaseModel):
 
     def __str__(self) -> str:
         return formater_str_models(self.issue, self.changed_by_user)
+
+
+# upper bounds (minutes) of the time-to-resolve histogram bins; the last
+# bin of IssueStatsBucket.resolve_histogram is everything above
+RESOLVE_BINS_MINUTES = (15, 30, 60, 120, 240, 480, 1440, 2880, 10080)
+
+
+def _empty_resolve_histogram() -> list[int]:
+    return [0] * (len(RESOLVE_BINS_MINUTES) + 1)
+
+
+class IssueStatsBucket(models.Model):
+    """
+    Hourly rollup per hotel / department / category for the dashboard.
+
+    Maintained incrementally (issues.services.stats) on issue creation
+    and status changes; rebuild_issue_stats recomputes it from history.
+    """
+
+    hotel = models.ForeignKey(
+        "hotels.Hotel", on_delete=models.CASCADE, related_name="+"
+    )
+    department = models.ForeignKey(
+        "hotels.HotelDepartment", on_delete=models.CASCADE, related_name="+"
+    )
+    category = models.ForeignKey(
+        "issues.IssueCategory", on_delete=models.CASCADE, related_name="+"
+    )
+    # start of the hour (UTC)
+    bucket = models.DateTimeField()
+
+    created = models.PositiveIntegerField(default=0)
+    # net change of the open issue count: the sum over all buckets is
+    # the current number of open issues
+    open_delta = models.IntegerField(default=0)
+    resolved = models.PositiveIntegerField(default=0)
+    resolved_breached = models.PositiveIntegerField(default=0)
+    resolve_histogram = ArrayField(
+        models.PositiveIntegerField(),
+        size=len(RESOLVE_BINS_MINUTES) + 1,
+        default=_empty_resolve_histogram,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["hotel", "department", "category", "bucket"],
+                name="issue_stats_bucket_key",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["hotel", "bucket"]),
+            models.Index(fields=["bucket"]),
+        ]
+
+    def __str__(self) -> str:
+        return formater_str_models(self.hotel_id, self.bucket)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import asdict, dataclass
+
+import psycopg
+from django.conf import settings
+from django.db import connection, connections, transaction
+from psycopg import sql
+from psycopg.conninfo import make_conninfo
+
+from common.utils.access.scope import UserScope
+from issues.models import Issue
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IssueEvent:
+    CREATED = "created"
+    STATUS_CHANGED = "status_changed"
+    # the subscriber may have missed events: reload the list
+    RESYNC = "resync"
+
+    type: str
+    issue_id: str = ""
+    hotel_id: int = 0
+    department_id: uuid.UUID | None = None
+    status: str = ""
+    status_label: str = ""
+    title: str = ""
+
+    @classmethod
+    def for_issue(cls, type_: str, issue: Issue) -> IssueEvent:
+        return cls(
+            type=type_,
+            issue_id=str(issue.pk),
+            hotel_id=issue.hotel_id,
+            department_id=issue.assigned_department_id,
+            status=issue.status,
+            status_label=Issue.Status(issue.status).label,
+            # NOTIFY payloads are limited to 8000 bytes
+            title=issue.title[:200],
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"), default=str)
+
+    @classmethod
+    def from_json(cls, payload: str) -> IssueEvent:
+        data = json.loads(payload)
+        if data.get("department_id"):
+            data["department_id"] = uuid.UUID(data["department_id"])
+        return cls(**data)
+
+    def to_sse(self) -> str:
+        return f"event: {self.type}\ndata: {self.to_json()}\n\n"
+
+
+RESYNC_EVENT = IssueEvent(type=IssueEvent.RESYNC)
+
+
+class Subscription:
+    """One SSE connection: a bounded queue owned by an event loop."""
+
+    def __init__(self, scope: UserScope, queue_size: int) -> None:
+        self.scope = scope
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[IssueEvent] = asyncio.Queue(queue_size)
+
+    def offer(self, event: IssueEvent) -> None:
+        """Thread-safe: hands the event over to the subscriber's loop."""
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: IssueEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # a slow client: drop the backlog, let it reload instead
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self) -> IssueEvent:
+        return await self.queue.get()
+
+
+class IssueEventBroker:
+    """
+    In-process pub/sub for issue events.
+
+    Subscribers are indexed by hotel, so an event only wakes the
+    connections whose UserScope can see it. Idle subscribers cost a
+    queue and a suspended coroutine, no thread and no DB connection.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._global: set[Subscription] = set()
+        self._by_hotel: dict[int, set[Subscription]] = defaultdict(set)
+        self._listener: asyncio.Task | None = None
+
+    @staticmethod
+    def _hotels(scope: UserScope) -> set[int]:
+        return set(scope.hotel_ids) | {h for h, _ in scope.dept_pairs}
+
+    def subscribe(self, scope: UserScope) -> Subscription:
+        """Must be called from the event loop that will consume it."""
+        subscription = Subscription(scope, settings.ISSUE_EVENTS_QUEUE_SIZE)
+        with self._lock:
+            if scope.is_global:
+                self._global.add(subscription)
+            for hotel_id in self._hotels(scope):
+                self._by_hotel[hotel_id].add(subscription)
+        self._ensure_listener()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._global.discard(subscription)
+            for hotel_id in self._hotels(subscription.scope):
+                subscribers = self._by_hotel.get(hotel_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._by_hotel[hotel_id]
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._global.union(*self._by_hotel.values()))
+
+    def dispatch(self, event: IssueEvent) -> None:
+        """Deliver to local subscribers. Callable from any thread."""
+        with self._lock:
+            if event.type == IssueEvent.RESYNC:
+                candidates = self._global.union(*self._by_hotel.values())
+            else:
+                candidates = self._global | self._by_hotel.get(
+                    event.hotel_id, set()
+                )
+        for subscription in candidates:
+            if event.type == IssueEvent.RESYNC or subscription.scope.covers(
+                event.hotel_id, event.department_id
+            ):
+                subscription.offer(event)
+
+    def _ensure_listener(self) -> None:
+        listener = self._listener
+        if (
+            listener is not None
+            and not listener.done()
+            and listener.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        self._listener = get_event_backend().start_listener(self)
+
+
+class LocalEventBackend:
+    """Delivers within this process only (single worker, tests)."""
+
+    def publish(self, events: list[IssueEvent]) -> None:
+        def dispatch() -> None:
+            for event in events:
+                issue_events.dispatch(event)
+
+        transaction.on_commit(dispatch)
+
+    def start_listener(self, broker: IssueEventBroker) -> None:
+        return None  # dispatch() is called directly on commit
+
+
+class PostgresEventBackend:
+    """
+    Cross-process delivery through LISTEN/NOTIFY.
+
+    NOTIFY is transactional: events of a rolled back transaction are
+    never delivered. Each process keeps one LISTEN connection, shared by
+    all of its SSE subscribers.
+    """
+
+    def __init__(self, channel: str | None = None) -> None:
+        self.channel = channel or settings.ISSUE_EVENTS_CHANNEL
+
+    def publish(self, events: list[IssueEvent]) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) "
+                "AS payload",
+                [self.channel, [event.to_json() for event in events]],
+            )
+
+    def start_listener(self, broker: IssueEventBroker) -> asyncio.Task:
+        return asyncio.get_running_loop().create_task(self.listen(broker))
+
+    @staticmethod
+    def _conninfo() -> str:
+        db = connections["default"].settings_dict
+        return make_conninfo(
+            dbname=db["NAME"],
+            user=db["USER"] or None,
+            password=db["PASSWORD"] or None,
+            host=db["HOST"] or None,
+            port=db["PORT"] or None,
+        )
+
+    async def listen(
+        self,
+        broker: IssueEventBroker,
+        ready: asyncio.Event | None = None,
+    ) -> None:
+        delay = 1.0
+        reconnect = False
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(
+                    self._conninfo(), autocommit=True
+                )
+                async with conn:
+                    await conn.execute(
+                        sql.SQL("LISTEN {}").format(
+                            sql.Identifier(self.channel)
+                        )
+                    )
+                    delay = 1.0
+                    if reconnect:
+                        broker.dispatch(RESYNC_EVENT)
+                    if ready is not None:
+                        ready.set()
+                    async for notify in conn.notifies():
+                        broker.dispatch(IssueEvent.from_json(notify.payload))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("issue events listener failed")
+            reconnect = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+
+EVENT_BACKENDS = {
+    "local": LocalEventBackend,
+    "postgres": PostgresEventBackend,
+}
+
+
+def get_event_backend() -> LocalEventBackend | PostgresEventBackend:
+    try:
+        backend = EVENT_BACKENDS[settings.ISSUE_EVENTS_BACKEND]
+    except KeyError:
+        raise ValueError(
+            f"Unknown issue events backend: {settings.ISSUE_EVENTS_BACKEND}"
+        ) from None
+    return backend()
+
+
+issue_events = IssueEventBroker()
+
+
+def publish_issue_events(events: Iterable[IssueEvent]) -> None:
+    """Publish once the current transaction commits."""
+    events = list(events)
+    if events:
+        get_event_backend().publish(events)
+
+
+async def stream_issue_events(
+    scope: UserScope, *, heartbeat: float | None = None
+) -> AsyncIterator[str]:
+    """
+    SSE body for one subscriber.
+
+    Subscribes lazily (a response that is never iterated leaks nothing)
+    and sends a comment line on idle so proxies keep the socket open.
+    """
+    if heartbeat is None:
+        heartbeat = settings.ISSUE_EVENTS_HEARTBEAT_SECONDS
+    subscription = issue_events.subscribe(scope)
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), timeout=heartbeat
+                )
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield event.to_sse()
+    finally:
+        issue_events.unsubscribe(subscription)
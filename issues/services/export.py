@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from issues.models import Issue, IssueStatusHistory
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    name: str
+    lookup: str
+    # pyarrow type name for columnar output
+    arrow_type: str = "string"
+
+
+ISSUE_COLUMNS: tuple[ExportColumn, ...] = (
+    ExportColumn("id", "id"),
+    ExportColumn("hotel_code", "hotel__code"),
+    ExportColumn("room_number", "room__number"),
+    ExportColumn("category", "category__name"),
+    ExportColumn("department", "assigned_department__code"),
+    ExportColumn("title", "title"),
+    ExportColumn("status", "status"),
+    ExportColumn("priority", "priority"),
+    ExportColumn("source", "source"),
+    ExportColumn("assigned_user", "assigned_user__email"),
+    ExportColumn("created_at", "created_at", "timestamp"),
+    ExportColumn("sla_due_at", "sla_due_at", "timestamp"),
+    ExportColumn("resolved_at", "resolved_at", "timestamp"),
+    ExportColumn("closed_at", "closed_at", "timestamp"),
+)
+
+HISTORY_COLUMNS: tuple[ExportColumn, ...] = (
+    ExportColumn("id", "id"),
+    ExportColumn("issue_id", "issue_id"),
+    ExportColumn("hotel_code", "issue__hotel__code"),
+    ExportColumn("old_status", "old_status"),
+    ExportColumn("new_status", "new_status"),
+    ExportColumn("changed_by_type", "changed_by_type"),
+    ExportColumn("changed_by_user", "changed_by_user__email"),
+    ExportColumn("created_at", "created_at", "timestamp"),
+)
+
+EXPORT_KINDS = ("issues", "history")
+
+
+def month_range(value: str) -> tuple[datetime, datetime]:
+    """'2026-09' -> [start, end) of that month in the current timezone."""
+    try:
+        first = datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise ValueError(
+            f"Invalid month: {value!r}, expected YYYY-MM"
+        ) from None
+    following = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return _day_start(first), _day_start(following)
+
+
+def _day_start(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time()))
+
+
+def export_queryset(
+    kind: str,
+    issues: QuerySet[Issue],
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> tuple[tuple[ExportColumn, ...], QuerySet]:
+    """
+    Rows to export for the given (already scoped) issue queryset.
+
+    History is limited to the issues of that queryset through a subquery,
+    so scope filtering is shared with the issue export.
+    """
+    if kind == "issues":
+        columns, qs = ISSUE_COLUMNS, issues.order_by()
+    elif kind == "history":
+        columns = HISTORY_COLUMNS
+        qs = IssueStatusHistory.objects.filter(
+            issue_id__in=issues.order_by().values("id")
+        )
+    else:
+        raise ValueError(f"Unknown export: {kind}")
+
+    if since is not None:
+        qs = qs.filter(created_at__gte=since)
+    if until is not None:
+        qs = qs.filter(created_at__lt=until)
+    return columns, qs.order_by("created_at", "id")
+
+
+def iter_rows(
+    columns: Iterable[ExportColumn], qs: QuerySet, *, chunk_size: int = 2000
+) -> Iterator[tuple[Any, ...]]:
+    """
+    Plain tuples from a server-side cursor: memory is bounded by
+    chunk_size, whatever the row count.
+    """
+    return qs.values_list(*(c.lookup for c in columns)).iterator(
+        chunk_size=chunk_size
+    )
+
+
+class _Echo:
+    """csv.writer target that hands back the line instead of storing it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_csv(
+    columns: Iterable[ExportColumn], rows: Iterable[tuple[Any, ...]]
+) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow([c.name for c in columns])
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def write_parquet(
+    path: Path,
+    columns: Iterable[ExportColumn],
+    rows: Iterable[tuple[Any, ...]],
+    *,
+    batch_rows: int = 50_000,
+) -> int:
+    """
+    Columnar export for analytics. Needs pyarrow (optional dependency).
+
+    Written in row groups of batch_rows, so memory stays bounded too.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError(
+            "Parquet export needs pyarrow: pip install pyarrow"
+        ) from exc
+
+    columns = tuple(columns)
+    schema = pa.schema(
+        [
+            pa.field(
+                c.name,
+                pa.timestamp("us", tz="UTC")
+                if c.arrow_type == "timestamp"
+                else pa.string(),
+            )
+            for c in columns
+        ]
+    )
+    timestamp = [c.arrow_type == "timestamp" for c in columns]
+
+    def to_batch(batch: list[tuple[Any, ...]]):
+        arrays = []
+        for index, field in enumerate(schema):
+            values = [row[index] for row in batch]
+            if not timestamp[index]:
+                values = [v if v is None else str(v) for v in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    written = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        batch: list[tuple[Any, ...]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                writer.write_batch(to_batch(batch))
+                written += len(batch)
+                batch = []
+        if batch:
+            writer.write_batch(to_batch(batch))
+            written += len(batch)
+    return written
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from hotels.models import Hotel, HotelDepartment, Room
+from hotels.services.directory import normalize_room_number
+from issues.models import Issue, IssueCategory
+from issues.services.sla import sla_calculator
+from issues.services.stats import IssueStatsDeltas, record_issue_stats
+
+# Input columns (CSV header / JSONL keys). Required: hotel_code,
+# room_number, category, title. The rest is optional.
+COLUMNS = (
+    "hotel_code",
+    "room_number",
+    "category",
+    "department",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "created_at",
+    "sla_due_at",
+    "resolved_at",
+    "closed_at",
+)
+REQUIRED = ("hotel_code", "room_number", "category", "title")
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    line: int
+    data: dict[str, Any]
+
+
+@dataclass
+class RowError:
+    line: int
+    error: str
+    data: dict[str, Any] | None = None
+
+
+@dataclass
+class ChunkResult:
+    created: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+
+def detect_format(path: Path) -> str:
+    return "jsonl" if path.suffix in (".jsonl", ".ndjson") else "csv"
+
+
+def iter_rows(stream: TextIO, fmt: str) -> Iterator[ImportRow | RowError]:
+    """Lazily parse the input; unparseable lines come out as errors."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield ImportRow(line=reader.line_num, data=row)
+        return
+
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield RowError(line=line_no, error=f"invalid JSON: {exc}")
+            continue
+        if not isinstance(data, dict):
+            yield RowError(line=line_no, error="not a JSON object")
+            continue
+        yield ImportRow(line=line_no, data=data)
+
+
+def chunked(
+    rows: Iterable[ImportRow | RowError], size: int
+) -> Iterator[list[ImportRow | RowError]]:
+    chunk: list[ImportRow | RowError] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ImportResolver:
+    """
+    Name -> id dictionaries for the import, built with a few queries.
+
+    Hotels, categories and departments are loaded up front; rooms once per
+    hotel, on the first row of that hotel (inactive rooms included: legacy
+    tickets may point at rooms that no longer exist in service).
+    """
+
+    def __init__(self) -> None:
+        self.hotels: dict[str, int] = dict(
+            Hotel.objects.values_list("code", "id")
+        )
+        categories = IssueCategory.objects.order_by("is_active").values_list(
+            "name", "id", "department_id"
+        )
+        # active categories come last and win on duplicate names
+        self.categories: dict[str, tuple[Any, Any]] = {
+            name.strip().lower(): (category_id, department_id)
+            for name, category_id, department_id in categories
+        }
+        self.departments: dict[str, Any] = {}
+        for department_id, code in HotelDepartment.objects.order_by(
+            "is_active"
+        ).values_list("id", "code"):
+            # same for department codes
+            self.departments[code.strip().upper()] = department_id
+        self.rooms: dict[int, dict[str, Any]] = {}
+
+    def room_id(self, hotel_id: int, number: str) -> Any:
+        rooms = self.rooms.get(hotel_id)
+        if rooms is None:
+            rooms = {
+                normalize_room_number(room_number): room_id
+                for room_id, room_number in Room.objects.filter(
+                    hotel_id=hotel_id
+                ).values_list("id", "number")
+            }
+            self.rooms[hotel_id] = rooms
+        return rooms.get(normalize_room_number(number))
+
+
+def _parse_dt(value: Any, column: str) -> datetime | None:
+    if value in (None, ""):
+        return None
+    parsed = parse_datetime(str(value))
+    if parsed is None:
+        raise ValueError(f"{column}: invalid datetime {value!r}")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, UTC)
+    return parsed
+
+
+def _choice(value: Any, column: str) -> str:
+    """A value of the Issue choice field `column`, its default if empty."""
+    field = Issue._meta.get_field(column)
+    if value in (None, ""):
+        return field.default
+    value = str(value).strip().lower()
+    if value not in dict(field.choices):
+        raise ValueError(f"{column}: unknown value {value!r}")
+    return value
+
+
+def build_issue(row: ImportRow, resolver: ImportResolver) -> Issue:
+    """Validate one input row into an unsaved Issue (ValueError if bad)."""
+    data = row.data
+    missing = [name for name in REQUIRED if not str(data.get(name) or "")]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    hotel_id = resolver.hotels.get(str(data["hotel_code"]).strip())
+    if hotel_id is None:
+        raise ValueError(f"unknown hotel {data['hotel_code']!r}")
+    room_id = resolver.room_id(hotel_id, str(data["room_number"]))
+    if room_id is None:
+        raise ValueError(f"unknown room {data['room_number']!r}")
+    category = resolver.categories.get(str(data["category"]).strip().lower())
+    if category is None:
+        raise ValueError(f"unknown category {data['category']!r}")
+    category_id, department_id = category
+    if data.get("department"):
+        department_id = resolver.departments.get(
+            str(data["department"]).strip().upper()
+        )
+        if department_id is None:
+            raise ValueError(f"unknown department {data['department']!r}")
+
+    created_at = _parse_dt(data.get("created_at"), "created_at")
+    return Issue(
+        hotel_id=hotel_id,
+        room_id=room_id,
+        category_id=category_id,
+        assigned_department_id=department_id,
+        title=str(data["title"])[:255],
+        description=data.get("description") or None,
+        status=_choice(data.get("status"), "status"),
+        priority=_choice(data.get("priority"), "priority"),
+        source=Issue.Source.IMPORT,
+        created_at=created_at or timezone.now(),
+        sla_due_at=_parse_dt(data.get("sla_due_at"), "sla_due_at"),
+        resolved_at=_parse_dt(data.get("resolved_at"), "resolved_at"),
+        closed_at=_parse_dt(data.get("closed_at"), "closed_at"),
+    )
+
+
+@contextmanager
+def keep_created_at() -> Iterator[None]:
+    """Let bulk_create write legacy created_at instead of now()."""
+    created_at = Issue._meta.get_field("created_at")
+    saved = created_at.auto_now_add
+    created_at.auto_now_add = False
+    try:
+        yield
+    finally:
+        created_at.auto_now_add = saved
+
+
+def import_chunk(
+    rows: list[ImportRow | RowError],
+    *,
+    resolver: ImportResolver,
+    batch_size: int = 1000,
+) -> ChunkResult:
+    """
+    Validate, compute missing SLA due dates in one batch and bulk insert.
+
+    A database error fails the whole chunk: its rows are reported as
+    errors and the import goes on with the next chunk.
+    """
+    result = ChunkResult()
+    issues: list[Issue] = []
+    lines: list[ImportRow] = []
+    for row in rows:
+        if isinstance(row, RowError):
+            result.errors.append(row)
+            continue
+        try:
+            issues.append(build_issue(row, resolver))
+        except ValueError as exc:
+            result.errors.append(
+                RowError(line=row.line, error=str(exc), data=row.data)
+            )
+            continue
+        lines.append(row)
+
+    pending = [issue for issue in issues if issue.sla_due_at is None]
+    try:
+        due = sla_calculator.due_at_many(
+            [(i.hotel_id, i.category_id, i.created_at) for i in pending]
+        )
+        for issue, due_at in zip(pending, due, strict=True):
+            issue.sla_due_at = due_at
+
+        # bulk_create sends no post_save: dashboard rollups by hand
+        deltas = IssueStatsDeltas()
+        for issue in issues:
+            deltas.issue_created(issue)
+        with transaction.atomic(), keep_created_at():
+            Issue.objects.bulk_create(issues, batch_size=batch_size)
+            record_issue_stats(deltas)
+    except Exception as exc:  # reported per row, the import goes on
+        result.errors.extend(
+            RowError(
+                line=row.line, error=f"chunk failed: {exc}", data=row.data
+            )
+            for row in lines
+        )
+        return result
+
+    result.created = len(issues)
+    return result
+
+
+# --- worker process side ---------------------------------------------------
+
+_worker_resolver: ImportResolver | None = None
+
+
+def init_worker() -> None:
+    """ProcessPoolExecutor initializer: one resolver per worker process."""
+    import django
+
+    django.setup()
+    global _worker_resolver
+    _worker_resolver = ImportResolver()
+
+
+def import_chunk_in_worker(
+    rows: list[ImportRow | RowError], batch_size: int
+) -> ChunkResult:
+    assert _worker_resolver is not None, "init_worker() was not called"
+    return import_chunk(rows, resolver=_worker_resolver, batch_size=batch_size)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q, QuerySet
+
+from common.utils.access.scope import UserScope
+from hotels.models import Room
+from hotels.services.directory import normalize_room_number
+from issues.models import SEARCH_CONFIG, Issue, IssueComment
+from users.models import StaffUser
+
+from .visibility import get_visible_issues_for_user
+
+# below this length ILIKE '%...%' can't use the trigram index
+TRIGRAM_MIN_LENGTH = 3
+
+
+def parse_search_query(text: str) -> SearchQuery | None:
+    """websearch_to_tsquery syntax (quotes, OR, -word), never fails."""
+    text = text.strip()
+    if not text:
+        return None
+    return SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+
+def room_number_filter(text: str) -> Q | None:
+    """
+    Rooms whose number contains the term, served by the room_number
+    trigram index. Only for a single short token with a digit: '101',
+    '12b'.
+    """
+    number = normalize_room_number(text)
+    if (
+        " " in number
+        or len(number) > 32
+        or not any(char.isdigit() for char in number)
+    ):
+        return None
+    if len(number) < TRIGRAM_MIN_LENGTH:
+        return Q(number__iexact=number)
+    return Q(number__icontains=number)
+
+
+def full_text_filter(text: str, *, with_comments: bool = True) -> Q | None:
+    """
+    Issues matching the text in title/description (issue_search_idx),
+    in comments (issue_comment_search_idx) or by room number.
+
+    The branches are separate selects joined with UNION and matched
+    with one id IN (...): OR-ing them in one WHERE leaves Postgres a
+    sequential scan of issues with a subplan per row.
+    """
+    query = parse_search_query(text)
+    if query is None:
+        return None
+
+    candidates = Issue.objects.filter(search_vector=query).values("id")
+    if with_comments:
+        candidates = candidates.union(
+            IssueComment.objects.filter(search_vector=query).values("issue_id")
+        )
+    rooms = room_number_filter(text)
+    if rooms is not None:
+        candidates = candidates.union(
+            Issue.objects.filter(
+                room_id__in=Room.objects.filter(rooms).values("id")
+            ).values("id")
+        )
+    return Q(id__in=candidates)
+
+
+def search_issues(
+    user: StaffUser,
+    text: str,
+    *,
+    scope: UserScope | None = None,
+    limit: int = 50,
+) -> QuerySet[Issue]:
+    """
+    Issues visible to the user that match the text, best matches first.
+
+    The candidates come from index lookups (GIN on the issue and comment
+    vectors, trigram on room numbers, see full_text_filter); the scope
+    filter is the one of the issue list.
+    """
+    match = full_text_filter(text)
+    if match is None:
+        return Issue.objects.none()
+
+    query = parse_search_query(text)
+    return (
+        get_visible_issues_for_user(user, scope=scope)
+        .filter(match)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "-created_at", "-id")[:limit]
+    )
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.utils import timezone
+
+from common.utils.lru import LRUCache
+from hotels.models import Hotel
+from issues.models import IssueCategory
+
+DAY_SECONDS = 24 * 60 * 60
+# A calendar without a single working second would never end the loop.
+MAX_CALENDAR_DAYS = 366
+
+Window = tuple[int, int]  # [start, end) in seconds from local midnight
+
+
+def _parse_clock(value: str) -> int:
+    hours, minutes = value.split(":")
+    seconds = int(hours) * 3600 + int(minutes) * 60
+    if not 0 <= seconds <= DAY_SECONDS:
+        raise ValueError(f"Invalid time of day: {value}")
+    return seconds
+
+
+def _subtract(windows: list[Window], hole: Window) -> list[Window]:
+    result: list[Window] = []
+    for start, end in windows:
+        if hole[1] <= start or hole[0] >= end:
+            result.append((start, end))
+            continue
+        if start < hole[0]:
+            result.append((start, hole[0]))
+        if hole[1] < end:
+            result.append((hole[1], end))
+    return result
+
+
+def _merge(windows: list[Window]) -> tuple[Window, ...]:
+    """Sorted windows with overlapping and adjacent ones joined."""
+    merged: list[Window] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return tuple(merged)
+
+
+def _split_daily(start: int, end: int) -> tuple[Window | None, Window | None]:
+    """(today part, next day part) of an interval that may wrap midnight."""
+    if start < end:
+        return (start, end), None
+    return (start, DAY_SECONDS), ((0, end) if end else None)
+
+
+@dataclass(frozen=True)
+class HotelCalendar:
+    """
+    When the SLA clock of a hotel runs, in the hotel's local time.
+
+    windows[weekday] are the working intervals of that weekday
+    (Monday = 0); None means 24/7.
+    """
+
+    tz: ZoneInfo
+    windows: tuple[tuple[Window, ...], ...] | None = None
+
+    @classmethod
+    def from_config(
+        cls, tz_name: str, config: Mapping[str, Any] | None
+    ) -> HotelCalendar:
+        tz = ZoneInfo(tz_name)
+        if not config:
+            return cls(tz=tz)
+
+        business_hours = config.get("business_hours")
+        quiet_hours = config.get("quiet_hours") or []
+        if business_hours is None and not quiet_hours:
+            return cls(tz=tz)
+
+        days: list[list[Window]] = [[] for _ in range(7)]
+        if business_hours is None:
+            days = [[(0, DAY_SECONDS)] for _ in range(7)]
+        else:
+            for weekday, intervals in business_hours.items():
+                weekday = int(weekday)
+                for start, end in intervals:
+                    today, tomorrow = _split_daily(
+                        _parse_clock(start), _parse_clock(end)
+                    )
+                    if today:
+                        days[weekday].append(today)
+                    if tomorrow:
+                        days[(weekday + 1) % 7].append(tomorrow)
+
+        for start, end in quiet_hours:
+            today, tomorrow = _split_daily(
+                _parse_clock(start), _parse_clock(end)
+            )
+            for weekday in range(7):
+                for hole in (today, tomorrow):
+                    if hole:
+                        days[weekday] = _subtract(days[weekday], hole)
+
+        if not any(days):
+            return cls(tz=tz)
+        # a wrapped interval may overlap the next day's own ones
+        return cls(tz=tz, windows=tuple(_merge(d) for d in days))
+
+    def add_minutes(self, start: datetime, minutes: int) -> datetime:
+        """`minutes` of working time after `start` (aware, returned in UTC)."""
+        if self.windows is None:
+            return start + timedelta(minutes=minutes)
+
+        remaining: float = minutes * 60
+        local = start.astimezone(self.tz)
+        day = local.date()
+        position = (
+            local.hour * 3600
+            + local.minute * 60
+            + local.second
+            + local.microsecond / 1_000_000
+        )
+
+        for _ in range(MAX_CALENDAR_DAYS):
+            for begin, end in self.windows[day.weekday()]:
+                if end <= position:
+                    continue
+                offset = max(begin, position)
+                available = end - offset
+                if remaining <= available:
+                    return self._at(day, offset + remaining)
+                remaining -= available
+            day += timedelta(days=1)
+            position = 0
+
+        return start + timedelta(minutes=minutes)
+
+    def _at(self, day: date, seconds: float) -> datetime:
+        midnight = datetime.combine(day, time(), tzinfo=self.tz)
+        return (midnight + timedelta(seconds=seconds)).astimezone(UTC)
+
+
+class SlaCalculator:
+    """
+    sla_due_at = created_at + SLA minutes on the hotel's calendar.
+
+    SLA minutes come from IssueCategory.default_sla_minutes, falling back
+    to the category's HotelDepartment.default_sla_minutes. Categories and
+    hotel calendars live in in-process LRU caches that are invalidated on
+    save (issues.signals); due_at_many() warms them with one query per
+    model, so bulk imports compute due dates without per-issue queries.
+    """
+
+    def __init__(
+        self, *, maxsize: int = 4096, ttl: float | None = None
+    ) -> None:
+        self.categories = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.calendars = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def due_at(
+        self,
+        *,
+        hotel_id: int,
+        category_id: Any,
+        start: datetime | None = None,
+    ) -> datetime:
+        return self.due_at_many([(hotel_id, category_id, start)])[0]
+
+    def due_at_many(
+        self, items: Sequence[tuple[int, Any, datetime | None]]
+    ) -> list[datetime]:
+        self.warm(
+            hotel_ids={hotel_id for hotel_id, _, _ in items},
+            category_ids={category_id for _, category_id, _ in items},
+        )
+        now = timezone.now()
+        result = []
+        for hotel_id, category_id, start in items:
+            minutes = self.categories.get(category_id)
+            calendar = self.calendars.get(hotel_id)
+            if minutes is None:
+                raise ValueError(f"Unknown issue category: {category_id}")
+            if calendar is None:
+                raise ValueError(f"Unknown hotel: {hotel_id}")
+            result.append(calendar.add_minutes(start or now, minutes))
+        return result
+
+    def warm(
+        self, *, hotel_ids: Iterable[int], category_ids: Iterable[Any]
+    ) -> None:
+        missing_categories = self.categories.missing(category_ids)
+        if missing_categories:
+            rows = IssueCategory.objects.filter(
+                id__in=missing_categories
+            ).values_list(
+                "id", "default_sla_minutes", "department__default_sla_minutes"
+            )
+            for category_id, own_minutes, department_minutes in rows:
+                self.categories.set(
+                    category_id,
+                    own_minutes
+                    if own_minutes is not None
+                    else department_minutes,
+                )
+
+        missing_hotels = self.calendars.missing(hotel_ids)
+        if missing_hotels:
+            rows = Hotel.objects.filter(id__in=missing_hotels).values_list(
+                "id", "timezone", "sla_calendar"
+            )
+            for hotel_id, tz_name, calendar in rows:
+                self.calendars.set(
+                    hotel_id, HotelCalendar.from_config(tz_name, calendar)
+                )
+
+    def forget_category(self, category_id: Any) -> None:
+        self.categories.pop(category_id)
+
+    def forget_hotel(self, hotel_id: int) -> None:
+        self.calendars.pop(hotel_id)
+
+    def clear(self) -> None:
+        self.categories.clear()
+        self.calendars.clear()
+
+
+sla_calculator = SlaCalculator(ttl=settings.SLA_CACHE_TTL_SECONDS)
+
+
+def compute_sla_due_at(
+    *, hotel_id: int, category_id: Any, start: datetime | None = None
+) -> datetime:
+    return sla_calculator.due_at(
+        hotel_id=hotel_id, category_id=category_id, start=start
+    )
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from hotels.models import HotelUserRole, Visibility
+from issues.models import Issue
+from notifications.models import UserNotificationSettings
+from notifications.services.outbox import (
+    NotificationDraft,
+    enqueue_notifications,
+)
+
+SLA_BREACH_EVENT = "sla_breach"
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+class SlaDueQueue:
+    """
+    In-memory due queue of open, not yet escalated issues.
+
+    A min-heap of (sla_due_at, issue_id) with lazy invalidation: `_due`
+    holds the current deadline of every tracked issue, heap entries that
+    no longer match it are dropped when popped. After the initial load
+    the queue is refreshed incrementally from Issue.updated_at, so the
+    database is never scanned for `sla_due_at < now` again.
+    """
+
+    def __init__(self, *, lookback: timedelta = timedelta(seconds=60)):
+        # lookback: overlap between refreshes for transactions that
+        # committed after a later updated_at was already seen
+        self.lookback = lookback
+        self.watermark: datetime | None = None
+        self._heap: list[tuple[datetime, uuid.UUID]] = []
+        self._due: dict[uuid.UUID, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def load(self) -> None:
+        self._heap.clear()
+        self._due.clear()
+        self.watermark = timezone.now()
+
+        rows = (
+            Issue.objects.filter(
+                status__in=Issue.OPEN_STATUSES, sla_escalated_at__isnull=True
+            )
+            .values_list("id", "sla_due_at")
+            .iterator(chunk_size=5000)
+        )
+        for issue_id, due_at in rows:
+            self._due[issue_id] = due_at
+            self._heap.append((due_at, issue_id))
+        heapq.heapify(self._heap)
+
+    def refresh(self) -> int:
+        """Apply issues changed since the last refresh; returns rows seen."""
+        if self.watermark is None:
+            self.load()
+            return len(self)
+
+        since = self.watermark - self.lookback
+        self.watermark = timezone.now()
+
+        rows = Issue.objects.filter(updated_at__gte=since).values_list(
+            "id", "status", "sla_due_at", "sla_escalated_at"
+        )
+        seen = 0
+        for issue_id, status, due_at, escalated_at in rows.iterator(
+            chunk_size=2000
+        ):
+            seen += 1
+            if status in Issue.OPEN_STATUSES and escalated_at is None:
+                self.push(issue_id, due_at)
+            else:
+                self._due.pop(issue_id, None)
+        return seen
+
+    def push(self, issue_id: uuid.UUID, due_at: datetime) -> None:
+        if self._due.get(issue_id) == due_at:
+            return
+        self._due[issue_id] = due_at
+        heapq.heappush(self._heap, (due_at, issue_id))
+
+    def next_due_at(self) -> datetime | None:
+        while self._heap:
+            due_at, issue_id = self._heap[0]
+            if self._due.get(issue_id) == due_at:
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: datetime) -> list[uuid.UUID]:
+        breached: list[uuid.UUID] = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, issue_id = heapq.heappop(self._heap)
+            if self._due.get(issue_id) == due_at:
+                del self._due[issue_id]
+                breached.append(issue_id)
+        return breached
+
+
+class SlaEscalator:
+    """
+    Emits escalation NotificationLog rows for breached issues, in batches.
+
+    Recipients: active hotel-level roles of the issue's hotel and
+    department-level roles of its assigned department, through every
+    active notification channel of those users.
+    """
+
+    def __init__(self, *, batch_size: int = 500) -> None:
+        self.batch_size = batch_size
+
+    def escalate(self, issue_ids: Iterable[uuid.UUID]) -> int:
+        """Returns the number of escalated issues."""
+        escalated = 0
+        for chunk in _batched(issue_ids, self.batch_size):
+            escalated += self._escalate_batch(chunk)
+        return escalated
+
+    def _escalate_batch(self, issue_ids: list[uuid.UUID]) -> int:
+        now = timezone.now()
+
+        with transaction.atomic():
+            # Re-check in the DB: the issue may have been resolved since it
+            # was queued. SKIP LOCKED keeps parallel monitors apart.
+            issues = list(
+                Issue.objects.select_for_update(skip_locked=True)
+                .filter(
+                    id__in=issue_ids,
+                    status__in=Issue.OPEN_STATUSES,
+                    sla_escalated_at__isnull=True,
+                    sla_due_at__lte=now,
+                )
+                .only(
+                    "id",
+                    "hotel_id",
+                    "assigned_department_id",
+                    "title",
+                    "status",
+                    "sla_due_at",
+                )
+            )
+            if not issues:
+                return 0
+
+            channels = self._recipient_channels(issues)
+            drafts = [
+                NotificationDraft(
+                    channel_type=channel_type,
+                    user_id=user_id,
+                    issue_id=issue.id,
+                    payload={
+                        "type": SLA_BREACH_EVENT,
+                        "issue_id": str(issue.id),
+                        "hotel_id": issue.hotel_id,
+                        "title": issue.title,
+                        "status": issue.status,
+                        "sla_due_at": issue.sla_due_at.isoformat(),
+                        "address": address,
+                    },
+                )
+                for issue in issues
+                for user_id, channel_type, address in channels.get(
+                    (issue.hotel_id, issue.assigned_department_id), ()
+                )
+            ]
+            enqueue_notifications(drafts)
+
+            Issue.objects.filter(id__in=[i.id for i in issues]).update(
+                sla_escalated_at=now
+            )
+
+        return len(issues)
+
+    @staticmethod
+    def _recipient_channels(
+        issues: list[Issue],
+    ) -> dict[tuple[int, object], list[tuple[int, str, str]]]:
+        """(hotel_id, department_id) -> [(user_id, channel_type, address)]"""
+        hotel_ids = {i.hotel_id for i in issues}
+
+        role_rows = list(
+            HotelUserRole.objects.filter(
+                hotel_id__in=hotel_ids,
+                is_active=True,
+                role__visibility__in=[
+                    Visibility.HOTEL,
+                    Visibility.DEPARTMENT,
+                ],
+            )
+            .values_list(
+                "user_id", "hotel_id", "department_id", "role__visibility"
+            )
+            .distinct()
+            .order_by()
+        )
+        user_ids = {row[0] for row in role_rows}
+
+        settings_by_user: dict[int, list[tuple[str, str]]] = {}
+        for (
+            user_id,
+            channel_type,
+            address,
+        ) in UserNotificationSettings.objects.filter(
+            user_id__in=user_ids, is_active=True
+        ).values_list("user_id", "channel_type", "address"):
+            settings_by_user.setdefault(user_id, []).append(
+                (channel_type, address)
+            )
+
+        result: dict[tuple[int, object], list[tuple[int, str, str]]] = {}
+        keys = {(i.hotel_id, i.assigned_department_id) for i in issues}
+        for hotel_id, department_id in keys:
+            recipients = {
+                user_id
+                for user_id, role_hotel_id, role_department_id, vis in (
+                    role_rows
+                )
+                if role_hotel_id == hotel_id
+                and (
+                    vis == Visibility.HOTEL
+                    or role_department_id == department_id
+                )
+            }
+            result[(hotel_id, department_id)] = [
+                (user_id, channel_type, address)
+                for user_id in sorted(recipients)
+                for channel_type, address in settings_by_user.get(user_id, ())
+            ]
+        return result
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import uuid
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Prefetch, Q, QuerySet, Sum
+from django.utils import timezone
+
+from common.utils.access.filters import get_scope_filter
+from common.utils.access.scope import UserScope
+from issues.models import (
+    RESOLVE_BINS_MINUTES,
+    Issue,
+    IssueStatsBucket,
+    IssueStatusHistory,
+)
+
+BucketKey = tuple[int, uuid.UUID, uuid.UUID, datetime]
+
+# leaving an open status for one of these counts as a resolution
+RESOLVED_STATUSES = frozenset({Issue.Status.RESOLVED, Issue.Status.CLOSED})
+
+
+def bucket_start(at: datetime) -> datetime:
+    return at.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def resolve_bin(duration: timedelta) -> int:
+    return bisect_left(RESOLVE_BINS_MINUTES, duration.total_seconds() / 60)
+
+
+@dataclass
+class StatsDelta:
+    created: int = 0
+    open_delta: int = 0
+    resolved: int = 0
+    resolved_breached: int = 0
+    resolve_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(RESOLVE_BINS_MINUTES) + 1)
+    )
+
+
+class IssueStatsDeltas:
+    """
+    Changes to IssueStatsBucket, accumulated in memory per bucket.
+
+    The issue must carry hotel_id, assigned_department_id, category_id,
+    created_at and sla_due_at.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: dict[BucketKey, StatsDelta] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.buckets)
+
+    def _delta(self, issue: Issue, at: datetime) -> StatsDelta:
+        key = (
+            issue.hotel_id,
+            issue.assigned_department_id,
+            issue.category_id,
+            bucket_start(at),
+        )
+        delta = self.buckets.get(key)
+        if delta is None:
+            delta = self.buckets[key] = StatsDelta()
+        return delta
+
+    def _resolved(self, issue: Issue, at: datetime) -> None:
+        delta = self._delta(issue, at)
+        delta.resolved += 1
+        if at > issue.sla_due_at:
+            delta.resolved_breached += 1
+        delta.resolve_histogram[resolve_bin(at - issue.created_at)] += 1
+
+    def issue_created(self, issue: Issue, status: str | None = None) -> None:
+        """
+        status: the status the issue was created with (defaults to the
+        current one). Issues created already resolved (imports) count as
+        resolved at resolved_at / closed_at.
+        """
+        status = status or issue.status
+        delta = self._delta(issue, issue.created_at)
+        delta.created += 1
+        if status in Issue.OPEN_STATUSES:
+            delta.open_delta += 1
+        elif status in RESOLVED_STATUSES:
+            resolved_at = issue.resolved_at or issue.closed_at
+            if resolved_at is not None:
+                self._resolved(issue, resolved_at)
+
+    def status_changed(
+        self, issue: Issue, old_status: str, new_status: str, at: datetime
+    ) -> None:
+        was_open = old_status in Issue.OPEN_STATUSES
+        is_open = new_status in Issue.OPEN_STATUSES
+        if was_open != is_open:
+            self._delta(issue, at).open_delta += 1 if is_open else -1
+        if was_open and new_status in RESOLVED_STATUSES:
+            self._resolved(issue, at)
+
+
+_UPSERT_SQL = """
+INSERT INTO {table} AS b (
+    hotel_id, department_id, category_id, bucket,
+    created, open_delta, resolved, resolved_breached, resolve_histogram
+)
+VALUES {values}
+ON CONFLICT (hotel_id, department_id, category_id, bucket) DO UPDATE SET
+    created = b.created + EXCLUDED.created,
+    open_delta = b.open_delta + EXCLUDED.open_delta,
+    resolved = b.resolved + EXCLUDED.resolved,
+    resolved_breached = b.resolved_breached + EXCLUDED.resolved_breached,
+    resolve_histogram = ARRAY(
+        SELECT x + y
+        FROM unnest(b.resolve_histogram, EXCLUDED.resolve_histogram)
+            WITH ORDINALITY AS h(x, y, i)
+        ORDER BY i
+    )
+"""
+_UPSERT_ROW = "(%s, %s, %s, %s, %s, %s, %s, %s, %s::integer[])"
+
+
+def record_issue_stats(deltas: IssueStatsDeltas) -> None:
+    """
+    Add the deltas to IssueStatsBucket with one INSERT ... ON CONFLICT.
+
+    Call it last in the transaction that made the change: the touched
+    bucket rows stay locked until commit. Rows are written in key order,
+    so concurrent writers can't deadlock on them.
+    """
+    if not deltas:
+        return
+    keys = sorted(
+        deltas.buckets, key=lambda k: (k[0], str(k[1]), str(k[2]), k[3])
+    )
+    params: list = []
+    for key in keys:
+        delta = deltas.buckets[key]
+        params.extend(key)
+        params.extend(
+            (
+                delta.created,
+                delta.open_delta,
+                delta.resolved,
+                delta.resolved_breached,
+                delta.resolve_histogram,
+            )
+        )
+    sql = _UPSERT_SQL.format(
+        table=IssueStatsBucket._meta.db_table,
+        values=", ".join([_UPSERT_ROW] * len(keys)),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def rebuild_issue_stats(
+    *, hotel_ids: Iterable[int] | None = None, chunk_size: int = 2000
+) -> int:
+    """
+    Recompute IssueStatsBucket from Issue and IssueStatusHistory.
+
+    The table is locked against writers (status changes wait, the
+    dashboard keeps reading the old rows) until the rebuild commits.
+    Returns the number of issues processed.
+    """
+    issues = Issue.objects.order_by("id").only(
+        "id",
+        "status",
+        "hotel_id",
+        "assigned_department_id",
+        "category_id",
+        "created_at",
+        "sla_due_at",
+        "resolved_at",
+        "closed_at",
+    )
+    buckets = IssueStatsBucket.objects.all()
+    if hotel_ids is not None:
+        hotel_ids = list(hotel_ids)
+        issues = issues.filter(hotel_id__in=hotel_ids)
+        buckets = buckets.filter(hotel_id__in=hotel_ids)
+    history = IssueStatusHistory.objects.order_by("created_at", "id").only(
+        "issue_id", "old_status", "new_status", "created_at"
+    )
+
+    processed = 0
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {IssueStatsBucket._meta.db_table} "
+                "IN EXCLUSIVE MODE"
+            )
+        buckets.delete()
+
+        deltas = IssueStatsDeltas()
+        rows = issues.prefetch_related(
+            Prefetch("status_history", queryset=history)
+        ).iterator(chunk_size=chunk_size)
+        for issue in rows:
+            changes = list(issue.status_history.all())
+            initial = changes[0].old_status if changes else issue.status
+            deltas.issue_created(issue, initial)
+            for change in changes:
+                deltas.status_changed(
+                    issue,
+                    change.old_status,
+                    change.new_status,
+                    change.created_at,
+                )
+            processed += 1
+            if processed % chunk_size == 0:
+                record_issue_stats(deltas)
+                deltas = IssueStatsDeltas()
+        record_issue_stats(deltas)
+    return processed
+
+
+# --- dashboard -------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DepartmentStats:
+    hotel: str
+    department: str
+    open: int
+    resolved: int
+    resolved_breached: int
+
+    @property
+    def breach_rate(self) -> float | None:
+        if not self.resolved:
+            return None
+        return self.resolved_breached / self.resolved
+
+
+@dataclass(frozen=True)
+class CategoryStats:
+    category: str
+    resolved: int
+    # estimated from the histogram; None if nothing was resolved
+    median_minutes: float | None
+
+
+@dataclass(frozen=True)
+class DashboardStats:
+    since: datetime
+    departments: list[DepartmentStats]
+    categories: list[CategoryStats]
+
+
+def histogram_median(histogram: list[int]) -> float | None:
+    """
+    Median minutes, interpolated linearly inside its bin. A median in
+    the last (unbounded) bin is reported as that bin's lower bound.
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+    half = total / 2
+    seen = 0
+    lower = 0.0
+    for index, count in enumerate(histogram):
+        if index == len(RESOLVE_BINS_MINUTES):
+            return lower
+        upper = float(RESOLVE_BINS_MINUTES[index])
+        if count and seen + count >= half:
+            return lower + (upper - lower) * (half - seen) / count
+        seen += count
+        lower = upper
+    return lower
+
+
+def _scoped_buckets(scope: UserScope) -> QuerySet[IssueStatsBucket]:
+    apply_scope = get_scope_filter(settings.ACCESS_SCOPE_STRATEGY)
+    return apply_scope(
+        IssueStatsBucket.objects.order_by(),
+        scope,
+        hotel_field="hotel_id",
+        department_field="department_id",
+    )
+
+
+def get_dashboard_stats(
+    scope: UserScope, *, days: int = 7, now: datetime | None = None
+) -> DashboardStats:
+    """
+    Dashboard figures for the buckets visible to the scope, two queries:
+
+    - open issues per hotel/department (all buckets), with resolutions
+      and SLA breaches over the last `days`;
+    - median time-to-resolve per category over the last `days`.
+    """
+    since = bucket_start((now or timezone.now()) - timedelta(days=days))
+    buckets = _scoped_buckets(scope)
+    recent = Q(bucket__gte=since)
+
+    departments = [
+        DepartmentStats(
+            hotel=row["hotel__name"],
+            department=row["department__name"],
+            open=row["open"] or 0,
+            resolved=row["resolved_recent"] or 0,
+            resolved_breached=row["breached_recent"] or 0,
+        )
+        for row in buckets.values("hotel__name", "department__name")
+        .annotate(
+            open=Sum("open_delta"),
+            resolved_recent=Sum("resolved", filter=recent),
+            breached_recent=Sum("resolved_breached", filter=recent),
+        )
+        .order_by("hotel__name", "department__name")
+    ]
+
+    histograms: dict[str, list[int]] = {}
+    for name, histogram in buckets.filter(recent, resolved__gt=0).values_list(
+        "category__name", "resolve_histogram"
+    ):
+        total = histograms.setdefault(name, [0] * len(histogram))
+        for index, count in enumerate(histogram):
+            total[index] += count
+    categories = [
+        CategoryStats(
+            category=name,
+            resolved=sum(histogram),
+            median_minutes=histogram_median(histogram),
+        )
+        for name, histogram in sorted(histograms.items())
+    ]
+    return DashboardStats(
+        since=since, departments=departments, categories=categories
+    )
@@ -1,49 +1,215 @@
 # issues/services/status.py
 from __future__ import annotations
 
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import transaction
 from django.utils import timezone
 
+from common.utils.access.scope import UserScope
+from common.utils.access.scope_cache import get_user_scope
 from issues.models import Issue, IssueStatusHistory
 from users.models import StaffUser
 
+from .events import IssueEvent, publish_issue_events
+from .stats import IssueStatsDeltas, record_issue_stats
+from .transitions import check_transition, is_transition_allowed
+from .visibility import get_visible_issues_for_user
+
+
+def status_update_fields(
+    new_status: str, user: StaffUser, now
+) -> dict[str, Any]:
+    """Issue columns a status change by `user` writes, for update()."""
+    fields: dict[str, Any] = {
+        "status": new_status,
+        "assigned_user": user,
+        # QuerySet.update() skips auto_now: the SLA monitor and other
+        # incremental readers rely on updated_at
+        "updated_at": now,
+    }
+    if new_status == Issue.Status.RESOLVED:
+        fields["resolved_at"] = now
+    if new_status == Issue.Status.CLOSED:
+        fields["closed_at"] = now
+    return fields
+
+
+class IssueStatusConflict(ValueError):
+    """The issue status changed after it was read (concurrent update)."""
+
 
 def change_issue_status(
-    *, issue: Issue, new_status: str, user: StaffUser
+    *,
+    issue: Issue,
+    new_status: str,
+    user: StaffUser,
+    scope: UserScope | None = None,
 ) -> None:
     """
     Change the Issue status, record the history, and update the assigned user.
+
+    The change must be allowed by the transition table for the user's
+    role level on this issue, otherwise InvalidTransition is raised.
+    Keeping the current status only takes the issue over.
+
+    Optimistic concurrency: the row is updated with
+    UPDATE ... WHERE id = ... AND status = <status read by the caller>,
+    no SELECT FOR UPDATE round trip. If another writer got there first
+    nothing is written and IssueStatusConflict is raised.
     """
     old_status = issue.status
 
     if new_status not in Issue.Status.values:
         raise ValueError(f"Unknown status: {new_status}")
 
-    if new_status == old_status and issue.assigned_user_id == user.id:
-        return
+    if new_status == old_status:
+        if issue.assigned_user_id == user.id:
+            return
+    else:
+        check_transition(scope or get_user_scope(user), issue, new_status)
 
-    IssueStatusHistory.objects.create(
-        issue=issue,
-        old_status=old_status,
-        new_status=new_status,
-        changed_by_type=IssueStatusHistory.ChangedByType.STAFF,
-        changed_by_user=user,
-    )
+    now = timezone.now()
+    fields = status_update_fields(new_status, user, now)
+
+    with transaction.atomic():
+        updated = Issue.objects.filter(pk=issue.pk, status=old_status).update(
+            **fields
+        )
+        if not updated:
+            raise IssueStatusConflict(
+                "The issue was changed by someone else. "
+                "Reload the page and try again."
+            )
+
+        IssueStatusHistory.objects.create(
+            issue=issue,
+            old_status=old_status,
+            new_status=new_status,
+            changed_by_type=IssueStatusHistory.ChangedByType.STAFF,
+            changed_by_user=user,
+        )
 
-    issue.status = new_status
-    issue.assigned_user = user
+        for name, value in fields.items():
+            setattr(issue, name, value)
+        deltas = IssueStatsDeltas()
+        deltas.status_changed(issue, old_status, new_status, now)
+        record_issue_stats(deltas)
+        publish_issue_events(
+            [IssueEvent.for_issue(IssueEvent.STATUS_CHANGED, issue)]
+        )
 
+
+@dataclass(frozen=True)
+class BulkStatusResult:
+    updated: tuple[uuid.UUID, ...]
+    # not visible to the user, unknown, already in the target state,
+    # or not an allowed transition
+    skipped: tuple[Any, ...]
+
+
+def bulk_change_issue_status(
+    *,
+    transitions: Iterable[tuple[Any, str]],
+    user: StaffUser,
+    scope: UserScope | None = None,
+) -> BulkStatusResult:
+    """
+    Bulk version of change_issue_status for (issue_id, new_status) pairs.
+
+    Rows whose transition is not allowed for the user are skipped.
+    The user's scope is applied once to the whole batch, history rows are
+    written with one bulk_create and issues with one
+    UPDATE ... WHERE id IN (...) per target status, in one transaction.
+    """
+    targets: dict[uuid.UUID, str] = {}
+    skipped: list[Any] = []
+    for issue_id, new_status in transitions:
+        if new_status not in Issue.Status.values:
+            raise ValueError(f"Unknown status: {new_status}")
+        try:
+            targets[uuid.UUID(str(issue_id))] = new_status
+        except ValueError:
+            skipped.append(issue_id)
+
+    scope = scope or get_user_scope(user)
     now = timezone.now()
+    history: list[IssueStatusHistory] = []
+    by_status: dict[str, list[uuid.UUID]] = defaultdict(list)
 
-    if new_status == Issue.Status.RESOLVED:
-        issue.resolved_at = now
-    if new_status == Issue.Status.CLOSED:
-        issue.closed_at = now
-    issue.save(
-        update_fields=[
-            "status",
-            "assigned_user",
-            "resolved_at",
-            "closed_at",
-            "updated_at",
-        ]
+    with transaction.atomic():
+        visible = get_visible_issues_for_user(user, scope=scope).filter(
+            id__in=targets
+        )
+        # Lock the batch: history must describe the status each row
+        # really had. The read is needed anyway, so the lock costs no
+        # extra round trip (and works with DISTINCT scope filters).
+        # Rows are locked in id order, so two overlapping batches queue
+        # up behind each other instead of deadlocking.
+        issues = (
+            Issue.objects.select_for_update()
+            .filter(id__in=visible.order_by().values("id"))
+            .order_by("id")
+            .only(
+                "id",
+                "status",
+                "hotel_id",
+                "assigned_department_id",
+                "assigned_user_id",
+                "category_id",
+                "title",
+                "created_at",
+                "sla_due_at",
+            )
+        )
+        found: set[uuid.UUID] = set()
+        events: list[IssueEvent] = []
+        deltas = IssueStatsDeltas()
+
+        for issue in issues:
+            found.add(issue.id)
+            new_status = targets[issue.id]
+            if new_status == issue.status:
+                if issue.assigned_user_id == user.id:
+                    skipped.append(issue.id)
+                    continue
+            elif not is_transition_allowed(scope, issue, new_status):
+                skipped.append(issue.id)
+                continue
+
+            history.append(
+                IssueStatusHistory(
+                    issue_id=issue.id,
+                    old_status=issue.status,
+                    new_status=new_status,
+                    changed_by_type=IssueStatusHistory.ChangedByType.STAFF,
+                    changed_by_user=user,
+                )
+            )
+            by_status[new_status].append(issue.id)
+            deltas.status_changed(issue, issue.status, new_status, now)
+            issue.status = new_status
+            events.append(
+                IssueEvent.for_issue(IssueEvent.STATUS_CHANGED, issue)
+            )
+
+        skipped.extend(
+            issue_id for issue_id in targets if issue_id not in found
+        )
+
+        IssueStatusHistory.objects.bulk_create(history)
+        for new_status, issue_ids in by_status.items():
+            Issue.objects.filter(id__in=issue_ids).update(
+                **status_update_fields(new_status, user, now)
+            )
+        record_issue_stats(deltas)
+        publish_issue_events(events)
+
+    updated = tuple(
+        issue_id for issue_ids in by_status.values() for issue_id in issue_ids
     )
+    return BulkStatusResult(updated=updated, skipped=tuple(skipped))
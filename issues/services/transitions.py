@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import cast
+
+from common.utils.access.scope import UserScope
+from hotels.models import Visibility
+from issues.models import Issue
+
+S = Issue.Status
+
+# Declarative graph: what a role of each visibility level may do with an
+# issue in a given status. Levels inherit the edges of the level below
+# (department -> hotel -> global), so only the additions are listed.
+# Without Django stubs mypy reads TextChoices members as (value, label)
+# tuples, hence the casts.
+_LEVEL_ORDER = cast(
+    tuple[Visibility, ...],
+    (Visibility.DEPARTMENT, Visibility.HOTEL, Visibility.GLOBAL),
+)
+
+_OPEN = (S.NEW, S.ASSIGNED, S.IN_PROGRESS, S.WAITING_GUEST)
+
+TRANSITION_GRAPH = cast(
+    dict[Visibility, dict[str, tuple[str, ...]]],
+    {
+        # line staff: work the issue through to resolution
+        Visibility.DEPARTMENT: {
+            S.NEW: (S.ASSIGNED, S.IN_PROGRESS),
+            S.ASSIGNED: (S.IN_PROGRESS,),
+            S.IN_PROGRESS: (S.WAITING_GUEST, S.RESOLVED),
+            S.WAITING_GUEST: (S.IN_PROGRESS, S.RESOLVED),
+            S.RESOLVED: (S.IN_PROGRESS,),
+        },
+        # managers: may also close, cancel and reopen
+        Visibility.HOTEL: {
+            **{
+                status: (S.RESOLVED, S.CLOSED, S.CANCELLED) for status in _OPEN
+            },
+            S.RESOLVED: (S.CLOSED,),
+            S.CLOSED: (S.IN_PROGRESS,),
+            S.CANCELLED: (S.NEW,),
+        },
+        Visibility.GLOBAL: {},
+    },
+)
+
+
+class InvalidTransition(ValueError):
+    """The status change is not allowed for the user's role."""
+
+
+def _compile() -> Mapping[tuple[str, str], tuple[tuple[str, str], ...]]:
+    labels = dict(S.choices)
+    table: dict[tuple[str, str], tuple[tuple[str, str], ...]] = {}
+    inherited: dict[str, list[str]] = {status: [] for status in S.values}
+
+    for level in _LEVEL_ORDER:
+        for status, targets in TRANSITION_GRAPH[level].items():
+            for target in targets:
+                if target != status and target not in inherited[status]:
+                    inherited[status].append(target)
+        for status in S.values:
+            # keep the order of Issue.Status for stable button rendering
+            ordered = sorted(inherited[status], key=S.values.index)
+            table[(level, status)] = tuple(
+                (target, labels[target]) for target in ordered
+            )
+    return MappingProxyType(table)
+
+
+# (visibility level, current status) -> ((value, label), ...)
+TRANSITIONS = _compile()
+
+_ALLOWED: Mapping[tuple[str, str], frozenset[str]] = MappingProxyType(
+    {
+        key: frozenset(value for value, _ in targets)
+        for key, targets in TRANSITIONS.items()
+    }
+)
+
+
+def scope_level(
+    scope: UserScope, hotel_id: int, department_id: int | None
+) -> Visibility | None:
+    """Strongest visibility level the scope has for an issue, if any."""
+    if scope.is_global:
+        return Visibility.GLOBAL  # type: ignore[return-value]
+    if hotel_id in scope.hotel_ids:
+        return Visibility.HOTEL  # type: ignore[return-value]
+    if (hotel_id, department_id) in scope.dept_pairs:
+        return Visibility.DEPARTMENT  # type: ignore[return-value]
+    return None
+
+
+def available_transitions(
+    scope: UserScope, issue: Issue
+) -> tuple[tuple[str, str], ...]:
+    """(value, label) pairs of statuses the scope may move the issue to."""
+    level = scope_level(scope, issue.hotel_id, issue.assigned_department_id)
+    if level is None:
+        return ()
+    return TRANSITIONS[(level, issue.status)]
+
+
+def is_transition_allowed(
+    scope: UserScope, issue: Issue, new_status: str
+) -> bool:
+    level = scope_level(scope, issue.hotel_id, issue.assigned_department_id)
+    if level is None:
+        return False
+    return new_status in _ALLOWED[(level, issue.status)]
+
+
+def check_transition(scope: UserScope, issue: Issue, new_status: str) -> None:
+    if not is_transition_allowed(scope, issue, new_status):
+        raise InvalidTransition(
+            f"Cannot change status from {issue.get_status_display()} "
+            f"to {Issue.Status(new_status).label}."
+        )
@@ -1,7 +1,9 @@
+from django.conf import settings
 from django.db.models import QuerySet
 
-from common.utils.access.filters import apply_scope_to_qs
-from common.utils.access.scope import build_user_scope
+from common.utils.access.filters import get_scope_filter
+from common.utils.access.scope import UserScope
+from common.utils.access.scope_cache import get_user_scope
 from issues.models import Issue
 from users.models import StaffUser
 
@@ -13,13 +15,17 @@ def _issues_base_qs() -> QuerySet[Issue]:
         "category",
         "assigned_department",
         "assigned_user",
-    ).order_by("-created_at")
+    ).order_by("-created_at", "-id")
 
 
-def get_visible_issues_for_user(user: StaffUser) -> QuerySet[Issue]:
-    scope = build_user_scope(user)
+def get_visible_issues_for_user(
+    user: StaffUser, *, scope: UserScope | None = None
+) -> QuerySet[Issue]:
+    if scope is None:
+        scope = get_user_scope(user)
     base_qs = _issues_base_qs()
-    return apply_scope_to_qs(
+    apply_scope = get_scope_filter(settings.ACCESS_SCOPE_STRATEGY)
+    return apply_scope(
         base_qs,
         scope,
         hotel_field="hotel_id",
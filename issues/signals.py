@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from hotels.models import Hotel, HotelDepartment
+from issues.models import Issue, IssueCategory
+from issues.services.events import IssueEvent, publish_issue_events
+from issues.services.sla import sla_calculator
+from issues.services.stats import IssueStatsDeltas, record_issue_stats
+
+
+@receiver(post_save, sender=IssueCategory)
+@receiver(post_delete, sender=IssueCategory)
+def _forget_category_sla(sender, instance: IssueCategory, **kwargs) -> None:
+    sla_calculator.forget_category(instance.pk)
+
+
+@receiver(post_save, sender=HotelDepartment)
+@receiver(post_delete, sender=HotelDepartment)
+def _forget_department_sla(sender, **kwargs) -> None:
+    # the department default is the fallback of all its categories
+    sla_calculator.categories.clear()
+
+
+@receiver(post_save, sender=Hotel)
+@receiver(post_delete, sender=Hotel)
+def _forget_hotel_calendar(sender, instance: Hotel, **kwargs) -> None:
+    sla_calculator.forget_hotel(instance.pk)
+
+
+@receiver(post_save, sender=Issue)
+def _on_issue_created(
+    sender, instance: Issue, created: bool, raw: bool = False, **kwargs
+) -> None:
+    if created and not raw:
+        deltas = IssueStatsDeltas()
+        deltas.issue_created(instance)
+        record_issue_stats(deltas)
+        publish_issue_events(
+            [IssueEvent.for_issue(IssueEvent.CREATED, instance)]
+        )
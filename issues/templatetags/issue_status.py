@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from django import template
+
+from issues.services.transitions import available_transitions
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def status_transitions(context, issue) -> tuple[tuple[str, str], ...]:
+    """
+    Allowed (value, label) status changes for the issue.
+
+    Uses `user_scope` from the view context, so a table row costs one
+    lookup in the precomputed transition table.
+    """
+    scope = context.get("user_scope")
+    if scope is None:
+        return ()
+    return available_transitions(scope, issue)
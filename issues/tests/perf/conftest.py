@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from common.testing.perf import PerfBaselines, measure
+from common.testing.synthetic import (
+    SyntheticDataset,
+    build_synthetic_dataset,
+    drop_synthetic_dataset,
+)
+from issues.services.stats import rebuild_issue_stats
+
+BASELINES_FILE = Path(__file__).with_name("baselines.json")
+
+
+@pytest.fixture(scope="session")
+def perf_baselines():
+    baselines = PerfBaselines.load(BASELINES_FILE)
+    yield baselines
+    baselines.save()
+
+
+@pytest.fixture(scope="module")
+def dataset(django_db_setup, django_db_blocker):
+    """
+    3 hotels x 1000 issues with comments and history, shared by the
+    module: built once outside the test transactions and dropped after.
+    """
+    with django_db_blocker.unblock():
+        data = build_synthetic_dataset()
+        rebuild_issue_stats(hotel_ids=[hotel.pk for hotel in data.hotels])
+    yield data
+    with django_db_blocker.unblock():
+        drop_synthetic_dataset(data)
+
+
+@pytest.fixture()
+def perf_budget(perf_baselines) -> Callable[..., Any]:
+    """
+    perf_budget(name, fn): runs fn once to warm up (templates, caches
+    of the first request), then measures a second run against the
+    baseline `name`.
+    """
+
+    def _check(name: str, fn: Callable[[], Any]) -> Any:
+        fn()
+        result, measurement = measure(fn)
+        perf_baselines.check(name, measurement)
+        return result
+
+    return _check
+
+
+@pytest.fixture()
+def staff_client(client, dataset: SyntheticDataset):
+    def _login(visibility: str):
+        client.force_login(dataset.users[visibility])
+        return client
+
+    return _login
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+from django.urls import reverse
+
+from hotels.models import Visibility
+from issues.models import Issue
+
+pytestmark = [pytest.mark.perf, pytest.mark.django_db]
+
+
+def _open_issue_ids(dataset, count: int) -> list:
+    return list(
+        Issue.objects.filter(
+            hotel=dataset.hotels[0],
+            assigned_department=dataset.departments[0],
+            status=Issue.Status.NEW,
+        ).values_list("id", flat=True)[:count]
+    )
+
+
+@pytest.mark.parametrize(
+    "visibility",
+    [Visibility.GLOBAL, Visibility.HOTEL, Visibility.DEPARTMENT],
+)
+def test_issue_list(staff_client, perf_budget, visibility):
+    client = staff_client(visibility)
+
+    def first_and_next_page():
+        page = client.get(reverse("issue_list"))
+        assert len(page.context["issues"]) > 0
+        cursor = page.context["page_obj"].next_cursor
+        if cursor:
+            client.get(reverse("issue_list"), {"cursor": cursor})
+
+    perf_budget(f"issue_list[{visibility}]", first_and_next_page)
+
+
+def test_issue_detail(staff_client, perf_budget, dataset):
+    client = staff_client(Visibility.HOTEL)
+    issue = Issue.objects.filter(hotel=dataset.hotels[0]).first()
+
+    def detail():
+        assert client.get(issue.get_absolute_url()).status_code == 200
+
+    perf_budget("issue_detail", detail)
+
+
+def test_issue_change_status(staff_client, perf_budget, dataset):
+    client = staff_client(Visibility.HOTEL)
+    issue_ids = iter(_open_issue_ids(dataset, 2))
+
+    def change():
+        resp = client.post(
+            reverse("issue_change_status", args=[next(issue_ids)]),
+            {"status": Issue.Status.IN_PROGRESS},
+        )
+        assert resp.status_code == 302
+
+    perf_budget("issue_change_status", change)
+
+
+def test_issue_bulk_change_status(staff_client, perf_budget, dataset):
+    client = staff_client(Visibility.HOTEL)
+    issue_ids = _open_issue_ids(dataset, 100)
+    batches = iter([issue_ids[:50], issue_ids[50:]])
+
+    def bulk():
+        resp = client.post(
+            reverse("issue_bulk_change_status"),
+            {"status": Issue.Status.IN_PROGRESS, "issue_ids": next(batches)},
+        )
+        assert resp.status_code == 302
+
+    perf_budget("issue_bulk_change_status[50]", bulk)
+
+
+def test_issue_search(staff_client, perf_budget):
+    client = staff_client(Visibility.DEPARTMENT)
+
+    def search():
+        resp = client.get(reverse("issue_search"), {"q": "leaking shower"})
+        assert len(resp.context["issues"]) > 0
+
+    perf_budget("issue_search", search)
+
+
+def test_dashboard(staff_client, perf_budget):
+    client = staff_client(Visibility.GLOBAL)
+
+    def dashboard():
+        resp = client.get(reverse("dashboard"), {"days": 30})
+        assert resp.context["stats"].departments
+
+    perf_budget("dashboard", dashboard)
+
+
+def test_issue_export(staff_client, perf_budget, dataset):
+    client = staff_client(Visibility.HOTEL)
+
+    def export():
+        resp = client.get(reverse("issue_export"))
+        lines = b"".join(resp.streaming_content).count(b"\n")
+        assert lines > 1
+
+    perf_budget("issue_export[1000]", export)
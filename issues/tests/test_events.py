@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from common.utils.access.scope import UserScope
+from issues.models import Issue
+from issues.services.events import (
+    IssueEvent,
+    IssueEventBroker,
+    PostgresEventBackend,
+    issue_events,
+    publish_issue_events,
+    stream_issue_events,
+)
+from issues.services.status import change_issue_status
+
+
+def _scope(**kwargs) -> UserScope:
+    kwargs.setdefault("is_global", False)
+    kwargs.setdefault("hotel_ids", frozenset())
+    kwargs.setdefault("dept_pairs", frozenset())
+    return UserScope(**kwargs)
+
+
+DEPT_A = uuid.uuid4()
+DEPT_B = uuid.uuid4()
+
+
+def _event(
+    hotel_id: int, department_id: uuid.UUID | None = None
+) -> IssueEvent:
+    return IssueEvent(
+        type=IssueEvent.CREATED,
+        issue_id="x",
+        hotel_id=hotel_id,
+        department_id=department_id,
+    )
+
+
+@pytest.fixture()
+def local_events(settings):
+    settings.ISSUE_EVENTS_BACKEND = "local"
+
+
+def test_broker_delivers_by_scope(local_events):
+    broker = IssueEventBroker()
+
+    async def scenario():
+        hotel = broker.subscribe(_scope(hotel_ids=frozenset({1})))
+        dept = broker.subscribe(_scope(dept_pairs=frozenset({(1, DEPT_A)})))
+        everyone = broker.subscribe(_scope(is_global=True))
+
+        broker.dispatch(_event(1, DEPT_B))
+        broker.dispatch(_event(2))
+        await asyncio.sleep(0)
+
+        assert hotel.queue.qsize() == 1
+        assert dept.queue.qsize() == 0
+        assert everyone.queue.qsize() == 2
+
+        broker.unsubscribe(hotel)
+        broker.unsubscribe(dept)
+        broker.unsubscribe(everyone)
+        assert broker.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_gets_resync(local_events, settings):
+    settings.ISSUE_EVENTS_QUEUE_SIZE = 2
+    broker = IssueEventBroker()
+
+    async def scenario():
+        subscription = broker.subscribe(_scope(is_global=True))
+        for _ in range(3):
+            broker.dispatch(_event(1))
+        await asyncio.sleep(0)
+        assert await subscription.get() == IssueEvent(type=IssueEvent.RESYNC)
+
+    asyncio.run(scenario())
+
+
+def test_stream_sends_heartbeats_and_events(local_events):
+    async def scenario():
+        stream = stream_issue_events(_scope(is_global=True), heartbeat=0.01)
+        assert await anext(stream) == "retry: 5000\n\n"
+        assert await anext(stream) == ": keep-alive\n\n"
+        assert issue_events.subscriber_count == 1
+
+        issue_events.dispatch(_event(1))
+        chunk = await anext(stream)
+        assert chunk.startswith("event: created\ndata: {")
+
+        await stream.aclose()
+        assert issue_events.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.django_db
+def test_status_change_publishes_on_commit(
+    local_events,
+    monkeypatch,
+    django_capture_on_commit_callbacks,
+    user_factory,
+    hotel_factory,
+    grant_role,
+    issue_factory,
+):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    grant_role(user, hotel)
+    issue = issue_factory(hotel)
+    dispatched: list[IssueEvent] = []
+    monkeypatch.setattr(issue_events, "dispatch", dispatched.append)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        change_issue_status(
+            issue=issue, new_status=Issue.Status.IN_PROGRESS, user=user
+        )
+
+    assert [(e.type, e.issue_id, e.status) for e in dispatched] == [
+        (IssueEvent.STATUS_CHANGED, str(issue.pk), Issue.Status.IN_PROGRESS)
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_postgres_backend_round_trip(settings):
+    settings.ISSUE_EVENTS_BACKEND = "postgres"
+    backend = PostgresEventBackend(channel="issue_events_test")
+    broker = IssueEventBroker()
+
+    def publish() -> None:
+        try:
+            backend.publish([_event(1, DEPT_A)])
+        finally:
+            connection.close()
+
+    async def scenario():
+        ready = asyncio.Event()
+        listener = asyncio.create_task(backend.listen(broker, ready))
+        subscription = broker.subscribe(_scope(hotel_ids=frozenset({1})))
+        try:
+            await asyncio.wait_for(ready.wait(), timeout=5)
+            await asyncio.to_thread(publish)
+            event = await asyncio.wait_for(subscription.get(), timeout=5)
+        finally:
+            listener.cancel()
+            broker._listener.cancel()
+        assert event == _event(1, DEPT_A)
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.django_db
+def test_event_stream_requires_login(client: Client):
+    resp = client.get(reverse("issue_events"))
+    assert resp.status_code == 403
+
+
+def test_publish_nothing_is_a_noop(local_events):
+    publish_issue_events([])
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import csv
+import io
+from datetime import datetime
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from hotels.models import Visibility
+from issues.models import Issue
+from issues.services.status import change_issue_status
+
+
+@pytest.fixture()
+def hotel_staff(user_factory, hotel_factory, grant_role):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    grant_role(user, hotel, visibility=Visibility.HOTEL)
+    return user, hotel
+
+
+def _read_csv(resp) -> list[dict[str, str]]:
+    body = b"".join(resp.streaming_content).decode()
+    return list(csv.DictReader(io.StringIO(body)))
+
+
+@pytest.mark.django_db
+def test_export_view_streams_visible_issues(
+    client: Client, hotel_staff, hotel_factory, issue_factory
+):
+    user, hotel = hotel_staff
+    mine = [issue_factory(hotel) for _ in range(3)]
+    issue_factory(hotel_factory())
+    client.force_login(user)
+
+    resp = client.get(reverse("issue_export"))
+
+    assert resp.status_code == 200
+    assert resp["Content-Type"] == "text/csv"
+    rows = _read_csv(resp)
+    assert {r["id"] for r in rows} == {str(i.pk) for i in mine}
+    assert rows[0]["hotel_code"] == hotel.code
+
+
+@pytest.mark.django_db
+def test_export_view_history_by_month(
+    client: Client, hotel_staff, issue_factory
+):
+    user, hotel = hotel_staff
+    issue = issue_factory(hotel)
+    change_issue_status(
+        issue=issue,
+        new_status=Issue.Status.IN_PROGRESS,  # type: ignore[arg-type]
+        user=user,
+    )
+    client.force_login(user)
+    month = timezone.localtime().strftime("%Y-%m")
+
+    resp = client.get(
+        reverse("issue_export"), {"kind": "history", "month": month}
+    )
+    rows = _read_csv(resp)
+    assert [(r["issue_id"], r["new_status"]) for r in rows] == [
+        (str(issue.pk), Issue.Status.IN_PROGRESS)
+    ]
+
+    resp = client.get(
+        reverse("issue_export"), {"kind": "history", "month": "2001-01"}
+    )
+    assert _read_csv(resp) == []
+    assert (
+        client.get(reverse("issue_export"), {"month": "bad"}).status_code
+        == 404
+    )
+
+
+@pytest.mark.django_db
+def test_export_command_parquet(hotel_staff, issue_factory, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    _, hotel = hotel_staff
+    issues = [issue_factory(hotel) for _ in range(3)]
+    output = tmp_path / "issues.parquet"
+
+    call_command(
+        "export_issues",
+        "--format=parquet",
+        f"--output={output}",
+        "--chunk-size=2",
+        stderr=io.StringIO(),
+    )
+
+    table = pq.read_table(output)
+    assert sorted(table.column("id").to_pylist()) == sorted(
+        str(i.pk) for i in issues
+    )
+    assert isinstance(table.column("created_at")[0].as_py(), datetime)
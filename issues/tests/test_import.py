@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import UTC, datetime
+
+import pytest
+from django.core.management import call_command
+
+from issues.models import Issue
+
+
+@pytest.fixture()
+def dictionaries(hotel_factory, room_factory, category_factory):
+    hotel = hotel_factory()
+    room_factory(hotel, number="101A")
+    category = category_factory(name="Housekeeping")
+    return hotel, category
+
+
+def _write_csv(path, rows) -> None:
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.mark.django_db
+def test_import_csv_creates_issues_and_reports_errors(dictionaries, tmp_path):
+    hotel, category = dictionaries
+    good = {
+        "hotel_code": hotel.code,
+        "room_number": "101a",
+        "category": "housekeeping",
+        "title": "Towels",
+        "status": "closed",
+        "created_at": "2021-03-04T05:06:07",
+    }
+    path = tmp_path / "legacy.csv"
+    _write_csv(
+        path,
+        [
+            good,
+            {**good, "hotel_code": "nope"},
+            {**good, "status": "weird"},
+            {**good, "title": ""},
+        ],
+    )
+    out = io.StringIO()
+
+    call_command(
+        "import_issues", str(path), "--workers=0", "--chunk-size=2", stdout=out
+    )
+
+    issue = Issue.objects.get()
+    assert issue.source == Issue.Source.IMPORT
+    assert issue.status == Issue.Status.CLOSED
+    assert issue.category_id == category.pk
+    assert issue.assigned_department_id == category.department_id
+    assert issue.created_at == datetime(2021, 3, 4, 5, 6, 7, tzinfo=UTC)
+    assert issue.sla_due_at > issue.created_at
+
+    errors = list(csv.DictReader((tmp_path / "legacy.csv.errors.csv").open()))
+    assert [e["line"] for e in errors] == ["3", "4", "5"]
+    assert "unknown hotel" in errors[0]["error"]
+    assert "imported=1 errors=3" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_jsonl_reports_broken_lines(dictionaries, tmp_path):
+    hotel, _ = dictionaries
+    path = tmp_path / "legacy.jsonl"
+    record = {
+        "hotel_code": hotel.code,
+        "room_number": "101A",
+        "category": "Housekeeping",
+        "title": "Leak",
+    }
+    path.write_text(
+        json.dumps(record) + "\n{broken\n" + json.dumps(record) + "\n"
+    )
+    errors = tmp_path / "errors.csv"
+
+    call_command(
+        "import_issues",
+        str(path),
+        "--workers=0",
+        f"--errors={errors}",
+        stdout=io.StringIO(),
+    )
+
+    assert Issue.objects.count() == 2
+    assert "invalid JSON" in errors.read_text()
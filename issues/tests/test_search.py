@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from hotels.models import Visibility
+from issues.models import Issue, IssueComment
+from issues.services.search import full_text_filter, search_issues
+
+
+@pytest.fixture()
+def hotel_staff(user_factory, hotel_factory, grant_role):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    grant_role(user, hotel, visibility=Visibility.HOTEL)
+    return user, hotel
+
+
+@pytest.mark.django_db
+def test_search_matches_text_and_comments_within_scope(
+    hotel_staff, hotel_factory, issue_factory
+):
+    user, hotel = hotel_staff
+    by_title = issue_factory(hotel, title="Leaking shower head")
+    by_comment = issue_factory(hotel, title="Bathroom")
+    IssueComment.objects.create(
+        issue=by_comment,
+        author_type=IssueComment.AuthorType.GUEST,
+        message="the shower is leaking again",
+    )
+    issue_factory(hotel, title="Broken lamp")
+    issue_factory(hotel_factory(), title="Leaking shower")
+
+    found = list(search_issues(user, "leaking shower"))
+
+    assert found == [by_title, by_comment]
+    assert list(search_issues(user, "lamp -broken")) == []
+    assert list(search_issues(user, "   ")) == []
+
+
+@pytest.mark.django_db
+def test_search_by_room_number(hotel_staff, room_factory, issue_factory):
+    user, hotel = hotel_staff
+    issue = issue_factory(hotel, room=room_factory(hotel, number="1204B"))
+    issue_factory(hotel, room=room_factory(hotel, number="310"))
+
+    assert list(search_issues(user, "204b")) == [issue]
+
+
+@pytest.mark.django_db
+def test_search_candidates_come_from_the_gin_indexes(
+    hotel_staff, room_factory, issue_factory
+):
+    _, hotel = hotel_staff
+    for n in range(20):
+        issue_factory(hotel, title=f"Issue {n}")
+    with connection.cursor() as cursor:
+        # the tables are tiny: make sure a usable index is chosen
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    plan = Issue.objects.filter(full_text_filter("leaking 101")).explain()
+
+    assert "issue_search_idx" in plan
+    assert "issue_comment_search_idx" in plan
+    assert "Seq Scan on issues_issue" not in plan
+
+
+@pytest.mark.django_db
+def test_search_view(client: Client, hotel_staff, issue_factory):
+    user, hotel = hotel_staff
+    issue = issue_factory(hotel, title="Noisy air conditioner")
+    client.force_login(user)
+
+    resp = client.get(reverse("issue_search"), {"q": "noisy"})
+
+    assert resp.status_code == 200
+    assert list(resp.context["issues"]) == [issue]
+    assert client.get(reverse("issue_search")).context["issues"] == []
+
+
+@pytest.mark.django_db
+def test_admin_search_uses_search_vector(hotel_staff, issue_factory):
+    _, hotel = hotel_staff
+    issue = issue_factory(hotel, description="Window does not close")
+    issue_factory(hotel, description="Door")
+    model_admin = site._registry[Issue]
+    request = RequestFactory().get("/admin/issues/issue/", {"q": "window"})
+
+    qs, may_have_duplicates = model_admin.get_search_results(
+        request, Issue.objects.all(), "window"
+    )
+    with CaptureQueriesContext(connection) as queries:
+        assert list(qs) == [issue]
+
+    assert not may_have_duplicates
+    assert "@@" in queries[0]["sql"]
+    assert "LIKE" not in queries[0]["sql"]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import F
+
+from common.testing.load import ChainSeeder, SeedConfig
+from common.testing.scenarios import (
+    LoadReport,
+    LoadTargets,
+    Scenario,
+    drive_load,
+)
+from hotels.models import Hotel
+from issues.models import Issue, IssueComment, IssueStatusHistory
+from issues.services.sla import compute_sla_due_at
+from users.models import GuestStay
+
+User = get_user_model()
+
+TINY = SeedConfig(
+    hotels=2,
+    rooms_min=10,
+    rooms_max=20,
+    days=10,
+    issues_per_room_day=0.5,
+    chunk_size=50,
+    prefix="t",
+    sla_calendar={"quiet_hours": [["23:00", "07:00"]]},
+)
+
+
+def _issues() -> list[tuple]:
+    return list(
+        Issue.objects.order_by("pk").values_list(
+            "pk", "room__number", "category__name", "status"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_seed_load_is_consistent_and_deterministic():
+    stats = ChainSeeder(TINY).run()
+
+    assert stats.hotels == 2
+    assert Issue.objects.count() == stats.issues > 0
+    assert IssueComment.objects.count() == stats.comments
+    assert IssueStatusHistory.objects.count() == stats.history
+    assert GuestStay.objects.count() == stats.stays
+    # guest issues point at a stay of the same room
+    linked = Issue.objects.filter(guest_stay__isnull=False)
+    assert linked.exists()
+    assert not linked.exclude(guest_stay__room_id=F("room_id")).exists()
+    closed = Issue.objects.filter(status=Issue.Status.CLOSED)
+    assert not closed.filter(closed_at__isnull=True).exists()
+    # due dates follow the hotel calendars, like any other issue
+    for issue in Issue.objects.order_by("pk")[:20]:
+        assert issue.sla_due_at == compute_sla_due_at(
+            hotel_id=issue.hotel_id,
+            category_id=issue.category_id,
+            start=issue.created_at,
+        )
+
+    first = _issues()
+    Issue.objects.all().delete()
+    Hotel.objects.filter(pk__in=stats.hotel_ids).delete()
+    User.objects.filter(username__startswith="t-").delete()
+    ChainSeeder(TINY).run()
+    assert _issues() == first
+
+
+@pytest.mark.django_db
+def test_seed_load_refuses_an_existing_prefix():
+    ChainSeeder(TINY).run()
+    with pytest.raises(ValueError, match="exist already"):
+        ChainSeeder(TINY).run()
+
+
+def test_scenario_without_run_cannot_be_built():
+    class Idle(Scenario):
+        pass
+
+    targets = LoadTargets((), {}, {}, {}, ())
+    with pytest.raises(TypeError):
+        Idle("http://testserver", targets, LoadReport(), seed=1)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_drive_load_against_live_server(live_server, settings):
+    # stay and JWT cookies are Secure unless DEBUG, the server is plain http
+    settings.DEBUG = True
+    call_command(
+        "seed_load",
+        "--hotels=1",
+        "--rooms",
+        "10",
+        "12",
+        "--days=3",
+        "--prefix=live",
+        stdout=None,
+    )
+    targets = LoadTargets.from_db("live")
+
+    report, seconds = drive_load(
+        live_server.url, targets, staff=1, guests=1, duration=2, think=0
+    )
+
+    rows = {row["name"]: row for row in report.summary(seconds)}
+    assert rows["login"]["errors"] == 0
+    assert rows["guest_room"]["errors"] == 0
+    assert rows["issue_list"]["count"] > 0
+    assert rows["issue_list"]["errors"] == 0
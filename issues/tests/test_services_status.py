@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from hotels.models import Visibility
+from issues.models import Issue, IssueStatusHistory
+from issues.services.status import (
+    IssueStatusConflict,
+    bulk_change_issue_status,
+    change_issue_status,
+)
+
+
+@pytest.fixture()
+def hotel_staff(user_factory, hotel_factory, grant_role):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    grant_role(user, hotel, visibility=Visibility.HOTEL)
+    return user, hotel
+
+
+@pytest.mark.django_db
+def test_bulk_change_updates_visible_issues(
+    hotel_staff, hotel_factory, issue_factory
+):
+    user, hotel = hotel_staff
+    mine = [issue_factory(hotel) for _ in range(3)]
+    foreign = issue_factory(hotel_factory())
+    missing = uuid.uuid4()
+
+    result = bulk_change_issue_status(
+        transitions=[
+            *((i.pk, Issue.Status.RESOLVED) for i in mine),
+            (foreign.pk, Issue.Status.RESOLVED),
+            (missing, Issue.Status.RESOLVED),
+        ],
+        user=user,
+    )
+
+    assert set(result.updated) == {i.pk for i in mine}
+    assert set(result.skipped) == {foreign.pk, missing}
+    for issue in mine:
+        issue.refresh_from_db()
+        assert issue.status == Issue.Status.RESOLVED
+        assert issue.assigned_user_id == user.pk
+        assert issue.resolved_at is not None
+    foreign.refresh_from_db()
+    assert foreign.status == Issue.Status.NEW
+    assert IssueStatusHistory.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_bulk_change_query_count_does_not_grow(
+    hotel_staff, issue_factory, django_assert_max_num_queries
+):
+    user, hotel = hotel_staff
+    issues = [issue_factory(hotel) for _ in range(20)]
+    transitions = [
+        (issue.pk, Issue.Status.CLOSED if n % 2 else Issue.Status.RESOLVED)
+        for n, issue in enumerate(issues)
+    ]
+
+    # scope lookup, select, history insert, one UPDATE per target status,
+    # the dashboard rollup upsert, savepoint handling
+    with django_assert_max_num_queries(9):
+        result = bulk_change_issue_status(transitions=transitions, user=user)
+    assert len(result.updated) == 20
+
+
+@pytest.mark.django_db
+def test_bulk_change_locks_rows_in_id_order(
+    hotel_staff, issue_factory, django_assert_max_num_queries
+):
+    user, hotel = hotel_staff
+    issues = [issue_factory(hotel) for _ in range(3)]
+
+    with django_assert_max_num_queries(9) as captured:
+        bulk_change_issue_status(
+            transitions=[(i.pk, Issue.Status.RESOLVED) for i in issues],
+            user=user,
+        )
+
+    [lock] = [q["sql"] for q in captured if "FOR UPDATE" in q["sql"]]
+    assert 'ORDER BY "issues_issue"."id" ASC' in lock
+
+
+@pytest.mark.django_db
+def test_bulk_change_unknown_status_raises(hotel_staff, issue_factory):
+    user, hotel = hotel_staff
+    with pytest.raises(ValueError):
+        bulk_change_issue_status(
+            transitions=[(issue_factory(hotel).pk, "nope")], user=user
+        )
+
+
+@pytest.mark.django_db
+def test_change_status_stale_instance_raises_conflict(
+    hotel_staff, issue_factory
+):
+    user, hotel = hotel_staff
+    issue = issue_factory(hotel)
+    stale = Issue.objects.get(pk=issue.pk)
+
+    change_issue_status(
+        issue=issue, new_status=Issue.Status.IN_PROGRESS, user=user
+    )
+    with pytest.raises(IssueStatusConflict):
+        change_issue_status(
+            issue=stale, new_status=Issue.Status.RESOLVED, user=user
+        )
+
+    issue.refresh_from_db()
+    assert issue.status == Issue.Status.IN_PROGRESS
+    assert IssueStatusHistory.objects.filter(issue=issue).count() == 1
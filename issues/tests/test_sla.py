@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from issues.services.sla import HotelCalendar, SlaCalculator, sla_calculator
+
+# 2026-01-05 is a Monday
+MONDAY_10_UTC = datetime(2026, 1, 5, 10, 0, tzinfo=UTC)
+
+
+def test_calendar_without_config_is_24_7():
+    calendar = HotelCalendar.from_config("UTC", None)
+    assert calendar.add_minutes(MONDAY_10_UTC, 90) == datetime(
+        2026, 1, 5, 11, 30, tzinfo=UTC
+    )
+
+
+def test_business_hours_carry_over_to_next_working_day():
+    calendar = HotelCalendar.from_config(
+        "UTC",
+        {"business_hours": {str(d): [["09:00", "11:00"]] for d in range(5)}},
+    )
+    # 60 minutes left on Monday, the rest on Tuesday morning
+    assert calendar.add_minutes(MONDAY_10_UTC, 90) == datetime(
+        2026, 1, 6, 9, 30, tzinfo=UTC
+    )
+
+
+def test_quiet_hours_wrap_midnight_in_hotel_timezone():
+    # Cairo is UTC+2 in January: 23:00 local == 21:00 UTC
+    calendar = HotelCalendar.from_config(
+        "Africa/Cairo", {"quiet_hours": [["23:00", "07:00"]]}
+    )
+    start = datetime(2026, 1, 5, 20, 30, tzinfo=UTC)  # 22:30 local
+    assert calendar.add_minutes(start, 60) == datetime(
+        2026, 1, 6, 5, 30, tzinfo=UTC
+    )
+
+
+def test_wrapped_business_hours_merge_with_the_next_day():
+    calendar = HotelCalendar.from_config(
+        "UTC",
+        {
+            "business_hours": {
+                "0": [["22:00", "02:00"]],
+                "1": [["00:00", "08:00"]],
+            }
+        },
+    )
+    assert calendar.windows is not None
+    assert calendar.windows[1] == ((0, 8 * 3600),)
+    tuesday = datetime(2026, 1, 6, 0, 0, tzinfo=UTC)
+    # overlapping hours count once
+    assert calendar.add_minutes(tuesday, 180) == datetime(
+        2026, 1, 6, 3, 0, tzinfo=UTC
+    )
+
+
+@pytest.mark.django_db
+def test_category_minutes_fall_back_to_department(
+    hotel_factory, department_factory, category_factory
+):
+    hotel = hotel_factory(timezone="UTC")
+    department = department_factory(default_sla_minutes=45)
+    own = category_factory(department=department, default_sla_minutes=15)
+    inherited = category_factory(department=department)
+
+    calculator = SlaCalculator()
+    own_due, inherited_due = calculator.due_at_many(
+        [
+            (hotel.id, own.id, MONDAY_10_UTC),
+            (hotel.id, inherited.id, MONDAY_10_UTC),
+        ]
+    )
+    assert own_due == datetime(2026, 1, 5, 10, 15, tzinfo=UTC)
+    assert inherited_due == datetime(2026, 1, 5, 10, 45, tzinfo=UTC)
+
+
+@pytest.mark.django_db
+def test_bulk_due_dates_use_two_queries(
+    hotel_factory, category_factory, django_assert_num_queries
+):
+    hotels = [hotel_factory() for _ in range(3)]
+    categories = [category_factory() for _ in range(3)]
+    items = [
+        (hotel.id, category.id, MONDAY_10_UTC)
+        for hotel in hotels
+        for category in categories
+    ] * 100
+
+    calculator = SlaCalculator()
+    with django_assert_num_queries(2):
+        assert len(calculator.due_at_many(items)) == 900
+    with django_assert_num_queries(0):
+        calculator.due_at_many(items)
+
+
+@pytest.mark.django_db
+def test_cache_is_invalidated_on_save(hotel_factory, category_factory):
+    hotel = hotel_factory(timezone="UTC")
+    category = category_factory(default_sla_minutes=10)
+
+    due = sla_calculator.due_at(
+        hotel_id=hotel.id, category_id=category.id, start=MONDAY_10_UTC
+    )
+    assert due == datetime(2026, 1, 5, 10, 10, tzinfo=UTC)
+
+    category.default_sla_minutes = 20
+    category.save()
+    hotel.sla_calendar = {"business_hours": {"0": [["12:00", "18:00"]]}}
+    hotel.save()
+
+    due = sla_calculator.due_at(
+        hotel_id=hotel.id, category_id=category.id, start=MONDAY_10_UTC
+    )
+    assert due == datetime(2026, 1, 5, 12, 20, tzinfo=UTC)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from hotels.models import Visibility
+from issues.models import Issue
+from issues.services.sla_monitor import SlaDueQueue, SlaEscalator
+from notifications.models import (
+    ChannelType,
+    NotificationLog,
+    UserNotificationSettings,
+)
+
+
+@pytest.mark.django_db
+def test_queue_pops_in_deadline_order(hotel_factory, issue_factory):
+    hotel = hotel_factory()
+    now = timezone.now()
+    late = issue_factory(hotel, sla_due_at=now - timedelta(minutes=5))
+    early = issue_factory(hotel, sla_due_at=now - timedelta(minutes=10))
+    future = issue_factory(hotel, sla_due_at=now + timedelta(hours=1))
+    issue_factory(hotel, sla_due_at=now, status=Issue.Status.CLOSED)
+
+    queue = SlaDueQueue()
+    queue.load()
+
+    assert len(queue) == 3
+    assert queue.pop_due(now) == [early.pk, late.pk]
+    assert queue.next_due_at() == future.sla_due_at
+
+
+@pytest.mark.django_db
+def test_queue_refresh_applies_changes(hotel_factory, issue_factory):
+    hotel = hotel_factory()
+    now = timezone.now()
+    issue = issue_factory(hotel, sla_due_at=now - timedelta(minutes=1))
+
+    queue = SlaDueQueue()
+    queue.load()
+
+    issue.status = Issue.Status.RESOLVED
+    issue.save()
+    fresh = issue_factory(hotel, sla_due_at=now - timedelta(minutes=2))
+    queue.refresh()
+
+    assert queue.pop_due(now) == [fresh.pk]
+
+
+@pytest.mark.django_db
+def test_escalator_notifies_department_and_hotel_roles(
+    user_factory,
+    hotel_factory,
+    department_factory,
+    grant_role,
+    issue_factory,
+):
+    hotel = hotel_factory()
+    dept, other_dept = department_factory(), department_factory()
+    manager, dept_staff, other_staff = (
+        user_factory(),
+        user_factory(),
+        user_factory(),
+    )
+    grant_role(manager, hotel, visibility=Visibility.HOTEL)
+    grant_role(
+        dept_staff, hotel, visibility=Visibility.DEPARTMENT, department=dept
+    )
+    grant_role(
+        other_staff,
+        hotel,
+        visibility=Visibility.DEPARTMENT,
+        department=other_dept,
+    )
+    for user in (manager, dept_staff, other_staff):
+        UserNotificationSettings.objects.create(
+            user=user, channel_type=ChannelType.EMAIL, address=user.email
+        )
+
+    issue = issue_factory(
+        hotel,
+        assigned_department=dept,
+        sla_due_at=timezone.now() - timedelta(minutes=1),
+    )
+
+    escalator = SlaEscalator()
+    assert escalator.escalate([issue.pk]) == 1
+    # second run is a no-op: the issue is marked as escalated
+    assert escalator.escalate([issue.pk]) == 0
+
+    notified = set(
+        NotificationLog.objects.filter(issue=issue).values_list(
+            "user_id", flat=True
+        )
+    )
+    assert notified == {manager.pk, dept_staff.pk}
+    issue.refresh_from_db()
+    assert issue.sla_escalated_at is not None
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from common.utils.access.scope_cache import get_user_scope
+from hotels.models import Visibility
+from issues.models import Issue, IssueStatsBucket
+from issues.services.stats import (
+    get_dashboard_stats,
+    histogram_median,
+    rebuild_issue_stats,
+)
+from issues.services.status import (
+    bulk_change_issue_status,
+    change_issue_status,
+)
+
+
+def _snapshot() -> list[tuple]:
+    return sorted(
+        IssueStatsBucket.objects.values_list(
+            "hotel_id",
+            "department_id",
+            "category_id",
+            "bucket",
+            "created",
+            "open_delta",
+            "resolved",
+            "resolved_breached",
+            "resolve_histogram",
+        ),
+        key=str,
+    )
+
+
+@pytest.fixture()
+def manager(user_factory, hotel_factory, grant_role):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    grant_role(user, hotel, visibility=Visibility.HOTEL)
+    return user, hotel
+
+
+@pytest.mark.django_db
+def test_incremental_rollups_match_rebuild(
+    manager, category_factory, issue_factory
+):
+    user, hotel = manager
+    category = category_factory()
+    issues = [issue_factory(hotel, category=category) for _ in range(4)]
+    late = issue_factory(
+        hotel, sla_due_at=timezone.now() - timedelta(minutes=5)
+    )
+
+    change_issue_status(
+        issue=issues[0], new_status=Issue.Status.RESOLVED, user=user
+    )
+    change_issue_status(
+        issue=issues[0], new_status=Issue.Status.CLOSED, user=user
+    )
+    change_issue_status(
+        issue=late, new_status=Issue.Status.RESOLVED, user=user
+    )
+    bulk_change_issue_status(
+        transitions=[
+            (issues[1].pk, Issue.Status.CANCELLED),
+            (issues[2].pk, Issue.Status.IN_PROGRESS),
+        ],
+        user=user,
+    )
+
+    incremental = _snapshot()
+    assert sum(row[5] for row in incremental) == 2  # still open
+    assert sum(row[6] for row in incremental) == 2  # resolutions
+    assert sum(row[7] for row in incremental) == 1  # the late one
+
+    assert rebuild_issue_stats() == 5
+    assert _snapshot() == incremental
+
+
+@pytest.mark.django_db
+def test_dashboard_stats_are_scoped(
+    manager, hotel_factory, department_factory, category_factory, issue_factory
+):
+    user, hotel = manager
+    department = department_factory()
+    category = category_factory(department=department)
+    for _ in range(3):
+        issue_factory(hotel, category=category)
+    done = issue_factory(
+        hotel,
+        category=category,
+        sla_due_at=timezone.now() - timedelta(minutes=1),
+    )
+    change_issue_status(
+        issue=done, new_status=Issue.Status.RESOLVED, user=user
+    )
+    issue_factory(hotel_factory(), category=category)
+
+    stats = get_dashboard_stats(get_user_scope(user))
+
+    [row] = stats.departments
+    assert (row.hotel, row.department) == (hotel.name, department.name)
+    assert (row.open, row.resolved, row.breach_rate) == (3, 1, 1.0)
+    [category_row] = stats.categories
+    assert category_row.resolved == 1
+    assert 0 <= category_row.median_minutes <= 15
+
+
+def test_histogram_median_interpolates_within_bin():
+    # bins: <=15, <=30, <=60, ...
+    assert histogram_median([0] * 10) is None
+    assert histogram_median([0, 2, 0, 0, 0, 0, 0, 0, 0, 0]) == 22.5
+    assert histogram_median([1, 0, 0, 0, 0, 0, 0, 0, 0, 3]) == 10080
+
+
+@pytest.mark.django_db
+def test_dashboard_view_renders_rollups(
+    client: Client, manager, issue_factory
+):
+    user, hotel = manager
+    issue_factory(hotel)
+    client.force_login(user)
+
+    resp = client.get(reverse("dashboard"), {"days": "30"})
+
+    assert resp.status_code == 200
+    assert resp.context["days"] == 30
+    assert resp.context["stats"].departments[0].open == 1
+    assert hotel.name in resp.content.decode()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+from django.template.loader import render_to_string
+from django.test import Client
+from django.urls import reverse
+
+from common.utils.access.scope_cache import get_user_scope
+from hotels.models import Visibility
+from issues.models import Issue, IssueStatusHistory
+from issues.services.status import (
+    bulk_change_issue_status,
+    change_issue_status,
+)
+from issues.services.transitions import TRANSITIONS, InvalidTransition
+
+S = Issue.Status
+
+
+def _targets(level, status) -> set[str]:
+    return {value for value, _ in TRANSITIONS[(level, status)]}
+
+
+def test_table_covers_every_level_and_status():
+    for level in Visibility.values:
+        for status in S.values:
+            assert (level, status) in TRANSITIONS
+            assert status not in _targets(level, status)
+
+
+def test_higher_levels_inherit_lower_edges():
+    for status in S.values:
+        department = _targets(Visibility.DEPARTMENT, status)
+        hotel = _targets(Visibility.HOTEL, status)
+        assert department <= hotel <= _targets(Visibility.GLOBAL, status)
+
+    assert S.CLOSED not in _targets(Visibility.DEPARTMENT, S.RESOLVED)
+    assert S.CLOSED in _targets(Visibility.HOTEL, S.RESOLVED)
+
+
+@pytest.fixture()
+def department_staff(user_factory, grant_role, hotel_factory, issue_factory):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    issue = issue_factory(hotel)
+    grant_role(
+        user,
+        hotel,
+        visibility=Visibility.DEPARTMENT,
+        department=issue.assigned_department,
+    )
+    return user, issue
+
+
+@pytest.mark.django_db
+def test_change_status_rejects_disallowed_transition(department_staff):
+    user, issue = department_staff
+
+    with pytest.raises(InvalidTransition):
+        change_issue_status(issue=issue, new_status=S.CLOSED, user=user)
+
+    change_issue_status(issue=issue, new_status=S.IN_PROGRESS, user=user)
+    issue.refresh_from_db()
+    assert issue.status == S.IN_PROGRESS
+    assert IssueStatusHistory.objects.filter(issue=issue).count() == 1
+
+
+@pytest.mark.django_db
+def test_bulk_change_skips_disallowed_transitions(
+    department_staff, issue_factory
+):
+    user, issue = department_staff
+    other = issue_factory(issue.hotel, category=issue.category)
+
+    result = bulk_change_issue_status(
+        transitions=[(issue.pk, S.CANCELLED), (other.pk, S.IN_PROGRESS)],
+        user=user,
+    )
+
+    assert result.updated == (other.pk,)
+    assert result.skipped == (issue.pk,)
+
+
+@pytest.mark.django_db
+def test_issue_actions_render_only_allowed_transitions(department_staff):
+    user, issue = department_staff
+
+    html = render_to_string(
+        "issues/_issue_actions.html",
+        {"issue": issue, "user_scope": get_user_scope(user)},
+    )
+
+    assert f'value="{S.IN_PROGRESS}"' in html
+    assert f'value="{S.CLOSED}"' not in html
+    assert f'value="{S.CANCELLED}"' not in html
+
+
+@pytest.mark.django_db
+def test_issue_list_passes_scope_to_templates(
+    client: Client, department_staff
+):
+    user, issue = department_staff
+    client.force_login(user)
+
+    resp = client.get(reverse("issue_list"))
+
+    assert resp.status_code == 200
+    assert resp.context["user_scope"].dept_pairs == {
+        (issue.hotel_id, issue.assigned_department_id)
+    }
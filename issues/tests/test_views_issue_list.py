@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from hotels.models import Visibility
+
+
+@pytest.fixture()
+def hotel_staff(user_factory, hotel_factory, grant_role):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    grant_role(user, hotel, visibility=Visibility.HOTEL)
+    return user, hotel
+
+
+@pytest.mark.django_db
+def test_issue_list_is_cursor_paginated(
+    client: Client, hotel_staff, issue_factory, monkeypatch
+):
+    user, hotel = hotel_staff
+    for _ in range(3):
+        issue_factory(hotel)
+    client.force_login(user)
+
+    monkeypatch.setattr("issues.views.IssueListView.paginate_by", 2)
+
+    resp = client.get(reverse("issue_list"))
+    assert resp.status_code == 200
+    page = resp.context["page_obj"]
+    assert len(resp.context["issues"]) == 2
+    assert page.next_cursor
+
+    resp = client.get(reverse("issue_list"), {"cursor": page.next_cursor})
+    assert resp.status_code == 200
+    assert len(resp.context["issues"]) == 1
+    assert resp.context["page_obj"].has_next() is False
+
+
+@pytest.mark.django_db
+def test_issue_list_invalid_cursor_returns_404(client: Client, hotel_staff):
+    client.force_login(hotel_staff[0])
+    resp = client.get(reverse("issue_list"), {"cursor": "garbage"})
+    assert resp.status_code == 404
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from hotels.models import Visibility
+from issues.models import Issue
+
+
+@pytest.mark.django_db
+def test_bulk_status_view_updates_selected(
+    client: Client, user_factory, hotel_factory, grant_role, issue_factory
+):
+    user = user_factory(is_staff=True)
+    hotel = hotel_factory()
+    grant_role(user, hotel, visibility=Visibility.HOTEL)
+    selected = [issue_factory(hotel) for _ in range(2)]
+    untouched = issue_factory(hotel)
+    client.force_login(user)
+
+    resp = client.post(
+        reverse("issue_bulk_change_status"),
+        data={
+            "issue_ids": [str(i.pk) for i in selected],
+            "status": Issue.Status.IN_PROGRESS,
+        },
+    )
+
+    assert resp.status_code == 302
+    assert set(
+        Issue.objects.filter(status=Issue.Status.IN_PROGRESS).values_list(
+            "pk", flat=True
+        )
+    ) == {i.pk for i in selected}
+    untouched.refresh_from_db()
+    assert untouched.status == Issue.Status.NEW
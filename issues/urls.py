@@ -1,6 +1,14 @@
 from django.urls import URLPattern, path
 
-from issues.views import IssueDetailView, IssueListView, IssueStatusChangeView
+from issues.views import (
+    IssueBulkStatusChangeView,
+    IssueDetailView,
+    IssueEventStreamView,
+    IssueExportView,
+    IssueListView,
+    IssueSearchView,
+    IssueStatusChangeView,
+)
 
 urlpatterns: list[URLPattern] = [
     path("issue_list/", IssueListView.as_view(), name="issue_list"),
@@ -10,4 +18,12 @@ urlpatterns: list[URLPattern] = [
         IssueStatusChangeView.as_view(),
         name="issue_change_status",
     ),
+    path("events/", IssueEventStreamView.as_view(), name="issue_events"),
+    path("search/", IssueSearchView.as_view(), name="issue_search"),
+    path("export/", IssueExportView.as_view(), name="issue_export"),
+    path(
+        "bulk-change-status/",
+        IssueBulkStatusChangeView.as_view(),
+        name="issue_bulk_change_status",
+    ),
 ]
@@ -1,33 +1,79 @@
 # issues/views.py
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import get_object_or_404, redirect
+from django.core.exceptions import ValidationError
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseForbidden,
+    StreamingHttpResponse,
+)
+from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
 from django.views import View
 from django.views.generic import DetailView, ListView
 
+from common.utils.access.scope_cache import get_request_scope, get_user_scope
+from common.utils.pagination import KeysetPaginator
+from core.db_routers import ReadReplicaMixin
 from issues.models import Issue
 
-from .services.status import change_issue_status
+from .services.events import stream_issue_events
+from .services.export import (
+    EXPORT_KINDS,
+    export_queryset,
+    iter_csv,
+    iter_rows,
+    month_range,
+)
+from .services.search import search_issues
+from .services.status import bulk_change_issue_status, change_issue_status
 from .services.visibility import get_visible_issues_for_user
 
 
-class IssueListView(LoginRequiredMixin, ListView):
+class IssueListView(ReadReplicaMixin, LoginRequiredMixin, ListView):
     model = Issue
     template_name = "issues/issue_list.html"
     context_object_name = "issues"
+    paginate_by = 50
 
     def get_queryset(self):
-        return get_visible_issues_for_user(self.request.user)
+        return get_visible_issues_for_user(
+            self.request.user, scope=get_request_scope(self.request)
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        """Keyset pagination on (created_at, id): no OFFSET, no COUNT(*)."""
+        paginator = KeysetPaginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get("cursor"))
+        except (ValueError, ValidationError) as exc:
+            raise Http404("Invalid cursor") from exc
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["status_choices"] = Issue.Status.choices
+        context["user_scope"] = get_request_scope(self.request)
+        return context
 
 
-class IssueDetailView(LoginRequiredMixin, DetailView):
+class IssueDetailView(ReadReplicaMixin, LoginRequiredMixin, DetailView):
     model = Issue
     template_name = "issues/issue_detail.html"
     context_object_name = "issue"
 
     def get_queryset(self):
-        return get_visible_issues_for_user(self.request.user)
+        return get_visible_issues_for_user(
+            self.request.user, scope=get_request_scope(self.request)
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["user_scope"] = get_request_scope(self.request)
+        return context
 
 
 class IssueStatusChangeView(LoginRequiredMixin, View):
@@ -37,7 +83,8 @@ class IssueStatusChangeView(LoginRequiredMixin, View):
     """
 
     def post(self, request: HttpRequest, pk: str) -> HttpResponse:
-        qs = get_visible_issues_for_user(request.user)
+        scope = get_request_scope(request)
+        qs = get_visible_issues_for_user(request.user, scope=scope)
         issue = get_object_or_404(qs, pk=pk)
 
         new_status = request.POST.get("status")
@@ -45,10 +92,123 @@ class IssueStatusChangeView(LoginRequiredMixin, View):
 
         try:
             change_issue_status(
-                issue=issue, new_status=new_status, user=request.user
+                issue=issue,
+                new_status=new_status,
+                user=request.user,
+                scope=scope,
             )
             messages.success(request, "Status updated.")
         except ValueError as exc:
             messages.error(request, str(exc))
 
         return redirect(next_url)
+
+
+class IssueBulkStatusChangeView(LoginRequiredMixin, View):
+    """
+    Change the status of many issues at once.
+    Expects a POST with `issue_ids` (repeated) and the `status` field.
+    """
+
+    def post(self, request: HttpRequest) -> HttpResponse:
+        issue_ids = request.POST.getlist("issue_ids")
+        new_status = request.POST.get("status")
+        next_url = request.POST.get("next") or reverse("issue_list")
+
+        if not issue_ids:
+            messages.error(request, "No issues selected.")
+            return redirect(next_url)
+
+        try:
+            result = bulk_change_issue_status(
+                transitions=[(pk, new_status) for pk in issue_ids],
+                user=request.user,
+                scope=get_request_scope(request),
+            )
+        except ValueError as exc:
+            messages.error(request, str(exc))
+            return redirect(next_url)
+
+        messages.success(request, f"Status updated: {len(result.updated)}.")
+        if result.skipped:
+            messages.warning(request, f"Skipped: {len(result.skipped)}.")
+        return redirect(next_url)
+
+
+class IssueEventStreamView(View):
+    """
+    Server-Sent Events feed of issue changes visible to the user.
+
+    Async end to end: an idle subscriber holds no thread and no DB
+    connection. No login redirect, EventSource can't follow it.
+    """
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        user = await request.auser()
+        if not user.is_authenticated:
+            return HttpResponseForbidden()
+        scope = await sync_to_async(get_user_scope)(user)
+
+        response = StreamingHttpResponse(
+            stream_issue_events(scope), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        # nginx: don't buffer the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class IssueExportView(ReadReplicaMixin, LoginRequiredMixin, View):
+    """
+    Streaming CSV export of visible issues or their status history.
+
+    GET ?kind=issues|history&month=YYYY-MM (month optional).
+    """
+
+    chunk_size = 2000
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        kind = request.GET.get("kind", "issues")
+        if kind not in EXPORT_KINDS:
+            raise Http404("Unknown export")
+        month = request.GET.get("month")
+        try:
+            since, until = month_range(month) if month else (None, None)
+        except ValueError as exc:
+            raise Http404(str(exc)) from exc
+
+        issues = get_visible_issues_for_user(
+            request.user, scope=get_request_scope(request)
+        )
+        columns, qs = export_queryset(kind, issues, since=since, until=until)
+
+        response = StreamingHttpResponse(
+            iter_csv(
+                columns, iter_rows(columns, qs, chunk_size=self.chunk_size)
+            ),
+            content_type="text/csv",
+        )
+        filename = f"{kind}-{month or 'all'}.csv"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class IssueSearchView(LoginRequiredMixin, View):
+    """Full-text search over visible issues, their comments and rooms."""
+
+    template_name = "issues/issue_search.html"
+    limit = 50
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        query = request.GET.get("q", "").strip()
+        scope = get_request_scope(request)
+        issues = (
+            search_issues(request.user, query, scope=scope, limit=self.limit)
+            if query
+            else []
+        )
+        return render(
+            request,
+            self.template_name,
+            {"query": query, "issues": issues, "user_scope": scope},
+        )
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from notifications.services.outbox import (
+    DispatchStats,
+    OutboxConfig,
+    OutboxDispatcher,
+)
+from notifications.services.senders import (
+    BaseSender,
+    StubEmailSender,
+    StubTelegramSender,
+    StubWebPushSender,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Outbox worker: leases PENDING notifications with "
+        "FOR UPDATE SKIP LOCKED and sends them outside the transaction. "
+        "Safe to run in several processes at once."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Sender threads per channel.",
+        )
+        parser.add_argument("--max-attempts", type=int, default=5)
+        parser.add_argument("--backoff-base", type=int, default=30)
+        parser.add_argument("--backoff-max", type=int, default=3600)
+        parser.add_argument(
+            "--send-timeout",
+            type=float,
+            default=30,
+            help="Seconds a batch waits for its sends.",
+        )
+        parser.add_argument(
+            "--lease",
+            type=int,
+            default=300,
+            help="Seconds claimed notifications stay reserved.",
+        )
+        parser.add_argument(
+            "--idle-sleep",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the outbox and exit.",
+        )
+        parser.add_argument(
+            "--stub",
+            action="store_true",
+            help="Use offline stub senders for every channel (load tests).",
+        )
+        parser.add_argument("--stub-latency-ms", type=int, default=0)
+        parser.add_argument("--stub-failure-rate", type=float, default=0.0)
+
+    def handle(self, *args, **options) -> None:
+        config = OutboxConfig(
+            batch_size=options["batch_size"],
+            workers_per_channel=options["workers"],
+            max_attempts=options["max_attempts"],
+            backoff_base_seconds=options["backoff_base"],
+            backoff_max_seconds=options["backoff_max"],
+            send_timeout_seconds=options["send_timeout"],
+            lease_seconds=options["lease"],
+        )
+        senders: dict[str, BaseSender] | None = None
+        if options["stub"]:
+            stub_options = {
+                "latency_ms": options["stub_latency_ms"],
+                "failure_rate": options["stub_failure_rate"],
+            }
+            stubs: list[BaseSender] = [
+                StubEmailSender(**stub_options),
+                StubTelegramSender(**stub_options),
+                StubWebPushSender(**stub_options),
+            ]
+            senders = {sender.channel_type: sender for sender in stubs}
+
+        dispatcher = OutboxDispatcher(senders=senders, config=config)
+        total = DispatchStats()
+        started = time.monotonic()
+
+        try:
+            while True:
+                close_old_connections()
+                stats = dispatcher.dispatch_batch()
+                total += stats
+
+                if stats.claimed:
+                    self._report(stats, total, started)
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["idle_sleep"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            dispatcher.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"claimed={total.claimed} sent={total.sent} "
+                f"retried={total.retried} failed={total.failed}"
+            )
+        )
+
+    def _report(
+        self, stats: DispatchStats, total: DispatchStats, started: float
+    ) -> None:
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.stdout.write(
+            f"batch: claimed={stats.claimed} sent={stats.sent} "
+            f"retried={stats.retried} failed={stats.failed} | "
+            f"total sent={total.sent} ({total.sent / elapsed:.1f}/s)"
+        )
@@ -62,9 +62,14 @@ class NotificationLog(BaseModel):
 
     sent_at = models.DateTimeField(blank=True, null=True)
 
+    # outbox retry state (notifications.services.outbox)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(blank=True, null=True)
+
     class Meta:
         indexes = [
             models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["status", "next_attempt_at"]),
         ]
 
     def __str__(self) -> str:
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from notifications.models import NotificationLog
+
+from .senders import BaseSender, build_senders
+
+
+@dataclass(frozen=True)
+class OutboxConfig:
+    batch_size: int = 100
+    workers_per_channel: int = 4
+    max_attempts: int = 5
+    backoff_base_seconds: int = 30
+    backoff_max_seconds: int = 3600
+    # how long a batch waits for its sends
+    send_timeout_seconds: float = 30
+    # claimed rows are not due again before this; keep it above the send
+    # timeout, or a slow batch is claimed a second time
+    lease_seconds: int = 300
+
+
+@dataclass
+class DispatchStats:
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    def __iadd__(self, other: DispatchStats) -> DispatchStats:
+        self.claimed += other.claimed
+        self.sent += other.sent
+        self.retried += other.retried
+        self.failed += other.failed
+        return self
+
+
+@dataclass
+class _Outcome:
+    error: str | None = None
+    fatal: bool = False
+
+
+def backoff_delay(attempts: int, config: OutboxConfig) -> timedelta:
+    """Exponential backoff with ±10% jitter, capped at backoff_max."""
+    delay = min(
+        config.backoff_base_seconds * 2 ** max(attempts - 1, 0),
+        config.backoff_max_seconds,
+    )
+    return timedelta(seconds=delay * random.uniform(0.9, 1.1))
+
+
+class OutboxDispatcher:
+    """
+    Drains PENDING NotificationLog rows (transactional outbox).
+
+    A batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED in a short
+    transaction that leases the rows (next_attempt_at moves to the end of
+    the lease) and commits, so any number of dispatcher processes can run
+    side by side without sending a notification twice. The sends run
+    outside any transaction, every channel in its own thread pool, and
+    each channel's results are written in a short transaction of their
+    own. A dispatcher that dies mid-batch leaves leased rows behind; they
+    become due again when the lease runs out.
+    """
+
+    def __init__(
+        self,
+        senders: dict[str, BaseSender] | None = None,
+        config: OutboxConfig | None = None,
+    ) -> None:
+        self.senders = build_senders() if senders is None else senders
+        self.config = config or OutboxConfig()
+        self._pools = {
+            channel_type: ThreadPoolExecutor(
+                max_workers=self.config.workers_per_channel,
+                thread_name_prefix=f"outbox-{channel_type}",
+            )
+            for channel_type in self.senders
+        }
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=True)
+
+    def dispatch_batch(self) -> DispatchStats:
+        batch, leased_until = self._claim(timezone.now())
+        stats = DispatchStats()
+        for notifications, outcomes in self._send(batch):
+            stats += self._record(notifications, outcomes, leased_until)
+        return stats
+
+    def _claim(self, now: datetime) -> tuple[list[NotificationLog], datetime]:
+        leased_until = now + timedelta(seconds=self.config.lease_seconds)
+        with transaction.atomic():
+            batch = list(
+                NotificationLog.objects.select_for_update(skip_locked=True)
+                .filter(status=NotificationLog.Status.PENDING)
+                .filter(
+                    Q(next_attempt_at__isnull=True)
+                    | Q(next_attempt_at__lte=now)
+                )
+                .order_by("created_at")[: self.config.batch_size]
+            )
+            if batch:
+                NotificationLog.objects.filter(
+                    pk__in=[notification.pk for notification in batch]
+                ).update(next_attempt_at=leased_until, updated_at=now)
+        return batch, leased_until
+
+    def _send(
+        self, batch: Iterable[NotificationLog]
+    ) -> Iterator[tuple[list[NotificationLog], dict[object, _Outcome]]]:
+        """
+        Submit the whole batch, then yield (notifications, outcomes) one
+        channel at a time. Waiting stops at send_timeout_seconds after
+        submission; sends still running by then count as failed.
+        """
+        by_channel: dict[str, list[NotificationLog]] = defaultdict(list)
+        for notification in batch:
+            by_channel[notification.channel_type].append(notification)
+
+        futures: dict[object, Future] = {}
+        for channel_type, notifications in by_channel.items():
+            sender = self.senders.get(channel_type)
+            if sender is None:
+                continue
+            pool = self._pools[channel_type]
+            for notification in notifications:
+                futures[notification.pk] = pool.submit(
+                    sender.send, notification
+                )
+        deadline = time.monotonic() + self.config.send_timeout_seconds
+
+        for channel_type, notifications in by_channel.items():
+            outcomes: dict[object, _Outcome] = {}
+            for notification in notifications:
+                future = futures.get(notification.pk)
+                if future is None:
+                    outcomes[notification.pk] = _Outcome(
+                        error=f"No sender for {channel_type}", fatal=True
+                    )
+                    continue
+                try:
+                    future.result(timeout=max(deadline - time.monotonic(), 0))
+                except Exception as exc:
+                    if future.done():
+                        error = str(exc) or repr(exc)
+                    else:
+                        # a running send can't be stopped: it may still
+                        # go out, and the retry sends it again
+                        future.cancel()
+                        error = (
+                            "Send timed out after "
+                            f"{self.config.send_timeout_seconds}s"
+                        )
+                    outcomes[notification.pk] = _Outcome(error=error)
+                else:
+                    outcomes[notification.pk] = _Outcome()
+            yield notifications, outcomes
+
+    def _record(
+        self,
+        notifications: list[NotificationLog],
+        outcomes: dict[object, _Outcome],
+        leased_until: datetime,
+    ) -> DispatchStats:
+        with transaction.atomic():
+            # rows whose lease ran out may belong to another dispatcher
+            # by now; their results are dropped
+            held = set(
+                NotificationLog.objects.select_for_update()
+                .filter(
+                    pk__in=[notification.pk for notification in notifications],
+                    status=NotificationLog.Status.PENDING,
+                    next_attempt_at=leased_until,
+                )
+                .values_list("pk", flat=True)
+            )
+            notifications = [
+                notification
+                for notification in notifications
+                if notification.pk in held
+            ]
+            stats = self._apply(notifications, outcomes, timezone.now())
+            NotificationLog.objects.bulk_update(
+                notifications,
+                fields=[
+                    "status",
+                    "attempts",
+                    "next_attempt_at",
+                    "error_message",
+                    "sent_at",
+                    "updated_at",
+                ],
+            )
+        return stats
+
+    def _apply(
+        self,
+        batch: Iterable[NotificationLog],
+        outcomes: dict[object, _Outcome],
+        now: datetime,
+    ) -> DispatchStats:
+        stats = DispatchStats()
+
+        for notification in batch:
+            stats.claimed += 1
+            outcome = outcomes[notification.pk]
+            notification.attempts += 1
+            notification.updated_at = now
+
+            if outcome.error is None:
+                notification.status = NotificationLog.Status.SENT
+                notification.sent_at = now
+                notification.next_attempt_at = None
+                notification.error_message = None
+                stats.sent += 1
+                continue
+
+            notification.error_message = outcome.error
+            if outcome.fatal or (
+                notification.attempts >= self.config.max_attempts
+            ):
+                notification.status = NotificationLog.Status.FAILED
+                notification.next_attempt_at = None
+                stats.failed += 1
+            else:
+                notification.next_attempt_at = now + backoff_delay(
+                    notification.attempts, self.config
+                )
+                stats.retried += 1
+
+        return stats
+
+
+@dataclass
+class NotificationDraft:
+    channel_type: str
+    payload: dict
+    user_id: int | None = None
+    issue_id: object | None = None
+
+
+def enqueue_notifications(
+    drafts: Iterable[NotificationDraft], *, batch_size: int = 500
+) -> list[NotificationLog]:
+    """
+    Put notifications into the outbox. Call inside the business
+    transaction: the rows become visible to dispatchers on commit.
+    """
+    return NotificationLog.objects.bulk_create(
+        [
+            NotificationLog(
+                channel_type=draft.channel_type,
+                payload=draft.payload,
+                user_id=draft.user_id,
+                issue_id=draft.issue_id,
+            )
+            for draft in drafts
+        ],
+        batch_size=batch_size,
+    )
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from notifications.models import ChannelType, NotificationLog
+
+logger = logging.getLogger(__name__)
+
+
+class SendError(Exception):
+    """Delivery failed; the outbox retries the notification later."""
+
+
+class BaseSender(ABC):
+    """
+    Delivers one NotificationLog through one channel.
+
+    Runs in a dispatcher worker thread: must not touch the database,
+    everything it needs is in notification.payload.
+    """
+
+    channel_type: str = ""
+
+    @abstractmethod
+    def send(self, notification: NotificationLog) -> None:
+        """Deliver the notification, raise SendError if it failed."""
+
+
+class StubSender(BaseSender):
+    """
+    Offline sender for local runs and load tests.
+
+    Logs the payload instead of delivering it; latency and failure rate
+    can be simulated to exercise the retry path.
+    """
+
+    def __init__(
+        self, *, latency_ms: int = 0, failure_rate: float = 0.0
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+
+    def send(self, notification: NotificationLog) -> None:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise SendError(f"stub {self.channel_type} failure")
+        logger.info(
+            "stub %s notification %s: %s",
+            self.channel_type,
+            notification.pk,
+            notification.payload,
+        )
+
+
+class StubEmailSender(StubSender):
+    channel_type = ChannelType.EMAIL  # type: ignore[assignment]
+
+
+class StubTelegramSender(StubSender):
+    channel_type = ChannelType.TELEGRAM  # type: ignore[assignment]
+
+
+class StubWebPushSender(StubSender):
+    channel_type = ChannelType.WEB_PUSH  # type: ignore[assignment]
+
+
+def build_senders(
+    config: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, BaseSender]:
+    """
+    Instantiate senders from NOTIFICATION_SENDERS:
+    {channel_type: {"BACKEND": "dotted.path", "OPTIONS": {...}}}
+    """
+    if config is None:
+        config = settings.NOTIFICATION_SENDERS
+
+    senders: dict[str, BaseSender] = {}
+    for channel_type, sender_conf in config.items():
+        sender_cls = import_string(sender_conf["BACKEND"])
+        senders[channel_type] = sender_cls(**sender_conf.get("OPTIONS", {}))
+    return senders
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from notifications.models import ChannelType, NotificationLog
+from notifications.services.outbox import (
+    DispatchStats,
+    NotificationDraft,
+    OutboxConfig,
+    OutboxDispatcher,
+    enqueue_notifications,
+)
+from notifications.services.senders import (
+    BaseSender,
+    SendError,
+    StubEmailSender,
+)
+
+
+class _FailingSender(StubEmailSender):
+    def send(self, notification: NotificationLog) -> None:
+        raise SendError("smtp down")
+
+
+def _dispatch(senders, **config) -> DispatchStats:
+    dispatcher = OutboxDispatcher(
+        senders=senders, config=OutboxConfig(**config)
+    )
+    try:
+        return dispatcher.dispatch_batch()
+    finally:
+        dispatcher.close()
+
+
+def _enqueue(channel_type=ChannelType.EMAIL) -> NotificationLog:
+    [notification] = enqueue_notifications(
+        [NotificationDraft(channel_type=channel_type, payload={"x": 1})]
+    )
+    return notification
+
+
+@pytest.mark.django_db
+def test_dispatch_marks_sent():
+    notification = _enqueue()
+
+    stats = _dispatch({ChannelType.EMAIL: StubEmailSender()})
+
+    notification.refresh_from_db()
+    assert stats.sent == 1
+    assert notification.status == NotificationLog.Status.SENT
+    assert notification.sent_at is not None
+    assert notification.attempts == 1
+
+
+@pytest.mark.django_db
+def test_failure_is_retried_with_backoff_then_failed():
+    notification = _enqueue()
+    senders = {ChannelType.EMAIL: _FailingSender()}
+
+    stats = _dispatch(senders, max_attempts=2, backoff_base_seconds=60)
+    notification.refresh_from_db()
+    assert stats.retried == 1
+    assert notification.status == NotificationLog.Status.PENDING
+    assert notification.attempts == 1
+    assert notification.error_message == "smtp down"
+    assert notification.next_attempt_at > timezone.now() + timedelta(
+        seconds=50
+    )
+
+    # not due yet: nothing is claimed
+    assert _dispatch(senders, max_attempts=2).claimed == 0
+
+    NotificationLog.objects.update(next_attempt_at=timezone.now())
+    stats = _dispatch(senders, max_attempts=2)
+    notification.refresh_from_db()
+    assert stats.failed == 1
+    assert notification.status == NotificationLog.Status.FAILED
+    assert notification.attempts == 2
+
+
+@pytest.mark.django_db
+def test_channel_without_sender_fails_immediately():
+    notification = _enqueue(ChannelType.TELEGRAM)
+
+    stats = _dispatch({ChannelType.EMAIL: StubEmailSender()})
+
+    notification.refresh_from_db()
+    assert stats.failed == 1
+    assert notification.status == NotificationLog.Status.FAILED
+
+
+def test_sender_without_send_cannot_be_built():
+    class Mute(BaseSender):
+        channel_type = "email"
+
+    with pytest.raises(TypeError):
+        Mute()
+
+
+class _BlockingSender(StubEmailSender):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def send(self, notification: NotificationLog) -> None:
+        self.release.wait(5)
+
+
+@pytest.mark.django_db
+def test_claim_leases_rows_until_results_are_written():
+    notification = _enqueue()
+    dispatcher = OutboxDispatcher(
+        senders={ChannelType.EMAIL: StubEmailSender()},
+        config=OutboxConfig(lease_seconds=120),
+    )
+    try:
+        batch, leased_until = dispatcher._claim(timezone.now())
+        notification.refresh_from_db()
+        assert [row.pk for row in batch] == [notification.pk]
+        assert notification.status == NotificationLog.Status.PENDING
+        assert notification.next_attempt_at == leased_until
+        assert leased_until > timezone.now() + timedelta(seconds=110)
+
+        # leased: another dispatcher finds nothing to do
+        assert dispatcher.dispatch_batch().claimed == 0
+    finally:
+        dispatcher.close()
+
+
+@pytest.mark.django_db
+def test_results_are_dropped_once_the_lease_is_lost():
+    notification = _enqueue()
+    dispatcher = OutboxDispatcher(
+        senders={ChannelType.EMAIL: StubEmailSender()}
+    )
+    try:
+        batch, leased_until = dispatcher._claim(timezone.now())
+        # the lease ran out and another dispatcher took the row
+        NotificationLog.objects.update(
+            next_attempt_at=leased_until + timedelta(minutes=1)
+        )
+        [(notifications, outcomes)] = dispatcher._send(batch)
+        stats = dispatcher._record(notifications, outcomes, leased_until)
+    finally:
+        dispatcher.close()
+
+    notification.refresh_from_db()
+    assert stats.claimed == 0
+    assert notification.status == NotificationLog.Status.PENDING
+    assert notification.attempts == 0
+
+
+@pytest.mark.django_db
+def test_slow_send_times_out_and_is_retried():
+    notification = _enqueue()
+    sender = _BlockingSender()
+    dispatcher = OutboxDispatcher(
+        senders={ChannelType.EMAIL: sender},
+        config=OutboxConfig(send_timeout_seconds=0.1),
+    )
+    try:
+        stats = dispatcher.dispatch_batch()
+    finally:
+        sender.release.set()
+        dispatcher.close()
+
+    notification.refresh_from_db()
+    assert stats.retried == 1
+    assert notification.status == NotificationLog.Status.PENDING
+    assert notification.attempts == 1
+    assert notification.error_message == "Send timed out after 0.1s"
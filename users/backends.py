@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models import Q
+
+User = get_user_model()
+
+
+class UsernameOrEmailBackend(ModelBackend):
+    """
+    ModelBackend that accepts a username or an email as `username`.
+
+    The user is fetched with one query and the password is hashed once,
+    so the login form doesn't need a separate email -> username lookup.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        value = username.strip()
+        lookup = (
+            Q(email__iexact=value)
+            if "@" in value
+            else Q(**{User.USERNAME_FIELD: value})
+        )
+        user = User._default_manager.filter(lookup).first()
+
+        if user is None:
+            # Run the hasher anyway: same timing for unknown users.
+            User().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
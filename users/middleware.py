@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
@@ -10,29 +15,55 @@ from users.services.auth_tokens import AuthTokenService
 from users.services.jwt_cookies import JWTCookieService
 
 
+@dataclass(frozen=True)
+class JWTRefreshConfig:
+    excluded_prefixes: tuple[str, ...] = ()
+    refresh_window_seconds: int = 0
+
+    @classmethod
+    def from_settings(cls) -> JWTRefreshConfig:
+        return cls(
+            excluded_prefixes=tuple(settings.JWT_REFRESH_EXCLUDED_PREFIXES),
+            refresh_window_seconds=settings.JWT_REFRESH_WINDOW_SECONDS,
+        )
+
+
 class JWTRefreshMiddleware:
     """
     Минимальный auto-refresh:
     - работает только если есть access_token cookie
     - обновляет access, если он истёк и есть refresh
     - без редиректов на refresh endpoint (чтобы не было циклов и 405)
+
+    Fast path:
+    - excluded URL prefixes (static, health check...) are not inspected
+    - the access token is decoded once, claims go to request.jwt_claims
+    - a token expiring within the refresh window is refreshed in advance,
+      so no request has to pay for the refresh exactly at expiry
     """
 
-    def __init__(self, get_response) -> None:
+    def __init__(
+        self, get_response, config: JWTRefreshConfig | None = None
+    ) -> None:
         self.get_response = get_response
         self.tokens = AuthTokenService()
         self.cookies = JWTCookieService()
+        self.config = config or JWTRefreshConfig.from_settings()
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.path.startswith(self.config.excluded_prefixes):
+            return self.get_response(request)
+
         access = request.COOKIES.get("access_token")
         if not access:
             return self.get_response(request)
 
-        try:
-            AccessToken(access)
-            return self.get_response(request)
-        except (InvalidToken, TokenError):
-            pass
+        claims = self._verify(access)
+        if claims is not None:
+            request.jwt_claims = claims  # type: ignore[attr-defined]
+            if not self._expires_soon(claims):
+                return self.get_response(request)
+            return self._refresh_in_advance(request)
 
         refresh = request.COOKIES.get("refresh_token")
         if not refresh:
@@ -47,6 +78,40 @@ class JWTRefreshMiddleware:
             self.cookies.clear(resp)
             return resp
 
+        request.jwt_claims = AccessToken(  # type: ignore[attr-defined]
+            new_access,  # type: ignore[arg-type]
+            verify=False,
+        ).payload
         response = self.get_response(request)
         self.cookies.set_access(response, access=new_access)
         return response
+
+    @staticmethod
+    def _verify(access: str) -> dict[str, Any] | None:
+        try:
+            # simplejwt annotates the argument as Token, it takes the
+            # encoded string
+            return AccessToken(access).payload  # type: ignore[arg-type]
+        except (InvalidToken, TokenError):
+            return None
+
+    def _expires_soon(self, claims: dict[str, Any]) -> bool:
+        window = self.config.refresh_window_seconds
+        if window <= 0:
+            return False
+        return claims.get("exp", 0) - time.time() <= window
+
+    def _refresh_in_advance(self, request: HttpRequest) -> HttpResponse:
+        # The access token is still valid: any refresh failure is ignored.
+        refresh = request.COOKIES.get("refresh_token")
+        new_access = None
+        if refresh:
+            try:
+                new_access = self.tokens.refresh_access(refresh=refresh)
+            except Exception:
+                new_access = None
+
+        response = self.get_response(request)
+        if new_access:
+            self.cookies.set_access(response, access=new_access)
+        return response
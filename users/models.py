@@ -25,6 +25,13 @@ class GuestStay(BaseModel):
     hotel = models.ForeignKey(
         "hotels.Hotel", on_delete=models.CASCADE, related_name="guest_stays"
     )
+    room = models.ForeignKey(
+        "hotels.Room",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="guest_stays",
+    )
 
     session_key = models.CharField(max_length=64, db_index=True)
 
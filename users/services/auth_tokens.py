@@ -7,6 +7,7 @@ from rest_framework_simplejwt.serializers import (
     TokenObtainPairSerializer,
     TokenRefreshSerializer,
 )
+from rest_framework_simplejwt.tokens import RefreshToken
 
 User = get_user_model()
 
@@ -37,6 +38,18 @@ class AuthTokenService:
         data = serializer.validated_data
         return TokenPair(access=data["access"], refresh=data["refresh"])
 
+    @staticmethod
+    def obtain_pair_for_user(user) -> TokenPair:
+        """
+        Mint a pair for an already authenticated user.
+
+        Unlike obtain_pair_by_username it doesn't check the password again.
+        """
+        refresh = RefreshToken.for_user(user)
+        return TokenPair(
+            access=str(refresh.access_token), refresh=str(refresh)
+        )
+
     @staticmethod
     def refresh_access(*, refresh: str) -> str:
         serializer = TokenRefreshSerializer(data={"refresh": refresh})
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+
+from users.backends import UsernameOrEmailBackend
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("by_email", [False, True])
+def test_authenticate_by_username_or_email(staff_user, by_email):
+    login_value = (
+        f"  {staff_user.email.upper()} " if by_email else staff_user.username
+    )
+    user = UsernameOrEmailBackend().authenticate(
+        None,
+        username=login_value,
+        password=staff_user._raw_password,  # type: ignore[attr-defined]
+    )
+    assert user == staff_user
+
+
+@pytest.mark.django_db
+def test_authenticate_wrong_password_returns_none(staff_user):
+    user = UsernameOrEmailBackend().authenticate(
+        None, username=staff_user.username, password="wrong"
+    )
+    assert user is None
+
+
+@pytest.mark.django_db
+def test_authenticate_unknown_user_returns_none():
+    user = UsernameOrEmailBackend().authenticate(
+        None, username="nobody@example.com", password="x"
+    )
+    assert user is None
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 import pytest
 from django.http import HttpRequest, HttpResponse
 from django.test import RequestFactory
 from django.test.utils import override_settings
 from django.urls import reverse
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
-from users.middleware import JWTRefreshMiddleware
+from users.middleware import JWTRefreshConfig, JWTRefreshMiddleware
 
 
 def _get_response_ok(_request: HttpRequest) -> HttpResponse:
@@ -99,3 +101,54 @@ def test_middleware_expired_access_invalid_refresh_redirects_and_clears(
     assert resp.url.endswith(reverse("staff_login"))
     assert "access_token" in resp.cookies
     assert "refresh_token" in resp.cookies
+
+
+@override_settings(ROOT_URLCONF="users.urls")
+@pytest.mark.django_db
+def test_middleware_excluded_prefix_skips_token_checks(rf: RequestFactory):
+    req = rf.get("/static/app.css")
+    req.COOKIES = {"access_token": "garbage"}  # type: ignore[attr-defined]
+
+    mw = JWTRefreshMiddleware(
+        _get_response_ok,
+        JWTRefreshConfig(excluded_prefixes=("/static/",)),
+    )
+    resp = mw(req)
+    assert resp.status_code == 200
+    assert not hasattr(req, "jwt_claims")
+
+
+@override_settings(ROOT_URLCONF="users.urls")
+@pytest.mark.django_db
+def test_middleware_valid_access_caches_claims(
+    rf: RequestFactory, token_bundle_for_user, staff_user
+):
+    req = rf.get("/dashboard/")
+    req.COOKIES = {"access_token": token_bundle_for_user.access}  # type: ignore[attr-defined]
+
+    JWTRefreshMiddleware(_get_response_ok)(req)
+    assert str(req.jwt_claims["user_id"]) == str(staff_user.pk)
+
+
+@override_settings(ROOT_URLCONF="users.urls")
+@pytest.mark.django_db
+def test_middleware_refreshes_access_within_window(
+    rf: RequestFactory, staff_user
+):
+    refresh = RefreshToken.for_user(staff_user)
+    access = AccessToken.for_user(staff_user)
+    access.set_exp(lifetime=timedelta(seconds=10))
+
+    req = rf.get("/dashboard/")
+    req.COOKIES = {
+        "access_token": str(access),
+        "refresh_token": str(refresh),
+    }  # type: ignore[attr-defined]
+
+    mw = JWTRefreshMiddleware(
+        _get_response_ok, JWTRefreshConfig(refresh_window_seconds=60)
+    )
+    resp = mw(req)
+
+    assert resp.status_code == 200
+    assert resp.cookies["access_token"].value != str(access)
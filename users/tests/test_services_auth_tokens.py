@@ -52,6 +52,13 @@ def test_obtain_pair_by_username_wrong_password_raises(staff_user):
         )
 
 
+@pytest.mark.django_db
+def test_obtain_pair_for_user_ok(staff_user):
+    tokens = AuthTokenService.obtain_pair_for_user(staff_user)
+    assert tokens.access and tokens.refresh
+    assert tokens.access != tokens.refresh
+
+
 @pytest.mark.django_db
 def test_refresh_access_ok(token_bundle_for_user):
     new_access = AuthTokenService.refresh_access(
@@ -6,6 +6,8 @@ from django.test import Client
 from django.test.utils import override_settings
 from django.urls import reverse
 
+from users.models import StaffUser
+
 User = get_user_model()
 
 
@@ -59,6 +61,31 @@ def test_login_post_ok_sets_session_and_cookies(
     assert "refresh_token" in resp.cookies
 
 
+@override_settings(ROOT_URLCONF="users.urls")
+@pytest.mark.django_db
+def test_login_checks_password_once(
+    client: Client, staff_user: StaffUser, monkeypatch
+):
+    calls = []
+    check_password = User.check_password
+
+    def _counting_check_password(self, raw_password):
+        calls.append(raw_password)
+        return check_password(self, raw_password)
+
+    monkeypatch.setattr(User, "check_password", _counting_check_password)
+
+    resp = client.post(
+        reverse("staff_login"),
+        data={
+            "username_or_email": staff_user.email,
+            "password": staff_user._raw_password,  # type: ignore[attr-defined]
+        },
+    )
+    assert resp.status_code == 302
+    assert len(calls) == 1
+
+
 @override_settings(ROOT_URLCONF="users.urls")
 @pytest.mark.django_db
 def test_login_wrong_password_returns_400(client: Client, staff_user: User):
@@ -7,6 +7,10 @@ from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.views import View
 
+from common.utils.access.scope_cache import get_request_scope
+from core.db_routers import ReadReplicaMixin
+from issues.services.stats import get_dashboard_stats
+
 from .forms import StaffLoginForm, StaffRegisterForm
 from .services.auth_tokens import AuthTokenService
 from .services.jwt_cookies import JWTCookieService
@@ -30,35 +34,20 @@ class StaffLoginView(ServiceMixin, View):
                 request, self.template_name, {"form": form}, status=400
             )
 
-        login_value = form.cleaned_data["username_or_email"]
-        password = form.cleaned_data["password"]
-
-        username = self.token_service.resolve_username(
-            username_or_email=login_value
+        user = authenticate(
+            request,
+            username=form.cleaned_data["username_or_email"],
+            password=form.cleaned_data["password"],
         )
-        if not username:
-            form.add_error("username_or_email", "User not found")
-            return render(
-                request, self.template_name, {"form": form}, status=400
-            )
-
-        try:
-            tokens = self.token_service.obtain_pair_by_username(
-                username=username, password=password
-            )
-        except Exception:
-            form.add_error(None, "Incorrect credentials")
-            return render(
-                request, self.template_name, {"form": form}, status=400
-            )
-
-        user = authenticate(request, username=username, password=password)
         if user is None:
             form.add_error(None, "Incorrect credentials")
             return render(
                 request, self.template_name, {"form": form}, status=400
             )
 
+        # the password was checked once above: mint JWT for the same user
+        tokens = self.token_service.obtain_pair_for_user(user)
+
         login(request, user)
 
         resp = redirect("dashboard")
@@ -88,10 +77,7 @@ class StaffRegisterView(ServiceMixin, View):
         user.save()
 
         # автологин
-        tokens = self.token_service.obtain_pair_by_username(
-            username=user.username,
-            password=form.cleaned_data["password1"],
-        )
+        tokens = self.token_service.obtain_pair_for_user(user)
 
         resp = redirect("success_register")
         self.cookie_service.set_tokens(
@@ -131,8 +117,21 @@ class RefreshAccessCookieView(ServiceMixin, View):
         return resp
 
 
-class Dashboard(LoginRequiredMixin, View):
+class Dashboard(ReadReplicaMixin, LoginRequiredMixin, View):
     login_url = reverse_lazy("staff_login")
+    days_choices = (1, 7, 30, 90)
 
     def get(self, request: HttpRequest) -> HttpResponse:
-        return render(request, "staff/dashboard.html")
+        try:
+            days = int(request.GET.get("days", 7))
+        except ValueError:
+            days = 7
+        if days not in self.days_choices:
+            days = 7
+
+        stats = get_dashboard_stats(get_request_scope(request), days=days)
+        return render(
+            request,
+            "staff/dashboard.html",
+            {"stats": stats, "days": days, "days_choices": self.days_choices},
+        )